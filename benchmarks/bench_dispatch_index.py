@@ -0,0 +1,85 @@
+"""
+Сравнение обычной маршрутизации callback с маршрутизацией по индексу.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_dispatch_index.py [количество роутеров]
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+import asyncio
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+from aiogram import Dispatcher, F, Router  # noqa: E402
+from aiogram.types import CallbackQuery, Chat, Message, User  # noqa: E402
+
+from app.bot.core.middleware.dispatch import DispatchIndexMiddleware  # noqa: E402
+from core.module_loader.runtime.dispatch_index import DispatchIndex  # noqa: E402
+from core.response.modules_loader import ModuleInfo  # noqa: E402
+
+
+def create_dispatcher(count: int, use_index: bool) -> Dispatcher:
+    dp = Dispatcher()
+    index = DispatchIndex()
+    for number in range(count):
+        router = Router(name=f"m{number}")
+
+        @router.callback_query(F.data == f"m{number}")
+        async def handler(call: CallbackQuery):
+            return True
+
+        dp.include_router(router)
+        index.add_module(
+            module=ModuleInfo(
+                package=f"app.bot.modules.m{number}",
+                root=f"m{number}",
+                parent=None,
+                settings=None,
+                config=SimpleNamespace(
+                    MENU_CALLBACK_DATA=f"m{number}",
+                    MENU_REPLY_TEXT=f"m{number}",
+                    SHOW_IN_MAIN_MENU=False,
+                ),
+            ),
+            router=router,
+        )
+
+    if use_index:
+        dp.callback_query.outer_middleware(DispatchIndexMiddleware(index=index))
+    return dp
+
+
+def create_callback(data: str) -> CallbackQuery:
+    user = User(id=1, is_bot=False, first_name="bench")
+    message = Message(
+        message_id=1,
+        date=datetime.now(),
+        chat=Chat(id=1, type="private"),
+    )
+    return CallbackQuery(
+        id="1", from_user=user, chat_instance="1", data=data, message=message
+    )
+
+
+async def run(count: int, repeat: int) -> None:
+    for use_index in (False, True):
+        dp = create_dispatcher(count=count, use_index=use_index)
+        events = [create_callback(f"m{number}") for number in range(count)]
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for event in events:
+                await dp.propagate_event("callback_query", event)
+        duration = time.perf_counter() - start
+
+        per_event = duration / (repeat * count) * 1_000_000
+        mode = "index" if use_index else "default"
+        print(f"{mode:<8} routers={count:<5} {per_event:>8.1f} мкс/событие")
+
+
+if __name__ == "__main__":
+    routers_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    asyncio.run(run(count=routers_count, repeat=5))
@@ -0,0 +1,69 @@
+"""
+Сравнение стоимости создания результатов: pydantic модели и модели с __slots__.
+
+Запуск из корня репозитория:
+    python benchmarks/bench_result_types.py [количество]
+"""
+
+import sys
+import timeit
+
+sys.path.insert(0, "src")
+
+from core.response.response_data import (  # noqa: E402
+    Error,
+    ErrorModel,
+    NetworkResponseResult,
+    NetworkResponseResultModel,
+    Result,
+    ResultModel,
+)
+
+
+def make_cases():
+    return {
+        "ok": (
+            lambda: ResultModel(ok=True, data={"id": 1}),
+            lambda: Result(ok=True, data={"id": 1}),
+        ),
+        "fail": (
+            lambda: ResultModel(
+                ok=False, error=ErrorModel(code="ERROR", message="Ошибка")
+            ),
+            lambda: Result(ok=False, error=Error(code="ERROR", message="Ошибка")),
+        ),
+        "network_ok": (
+            lambda: NetworkResponseResultModel(
+                ok=True,
+                data=b"data",
+                url="https://example.com",
+                status=200,
+                method="GET",
+                headers={"Content-Type": "text/plain"},
+            ),
+            lambda: NetworkResponseResult(
+                ok=True,
+                data=b"data",
+                url="https://example.com",
+                status=200,
+                method="GET",
+                headers={"Content-Type": "text/plain"},
+            ),
+        ),
+    }
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'case':<12}{'pydantic, нс':>16}{'slots, нс':>14}{'ускорение':>12}")
+    for name, (before, after) in make_cases().items():
+        before_time: float = min(timeit.repeat(before, number=count, repeat=3))
+        after_time: float = min(timeit.repeat(after, number=count, repeat=3))
+        print(
+            f"{name:<12}{before_time / count * 1e9:>16.0f}"
+            f"{after_time / count * 1e9:>14.0f}{before_time / after_time:>11.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Union
+import asyncio
+import time
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from aiogram.methods import SendAudio, SendDocument, SendPhoto, SendVideo
+from aiogram.types import (
+    InputMediaAudio,
+    InputMediaDocument,
+    InputMediaPhoto,
+    InputMediaVideo,
+    Message,
+)
+
+from core.response.response_data import LoggingData
+
+
+MEDIA_GROUP_SIZE: int = 10  # Максимум медиа в одном альбоме Telegram
+
+InputMedia = Union[InputMediaAudio, InputMediaDocument, InputMediaPhoto, InputMediaVideo]
+
+# Метод отправки одного медиа и имя поля с файлом для каждого типа InputMedia
+SINGLE_MEDIA_METHODS = {
+    InputMediaPhoto: (SendPhoto, "photo"),
+    InputMediaVideo: (SendVideo, "video"),
+    InputMediaAudio: (SendAudio, "audio"),
+    InputMediaDocument: (SendDocument, "document"),
+}
+
+
+@dataclass
+class BroadcastResult:
+    """Результат рассылки."""
+
+    total: int
+    sent: int = 0
+    failed: int = 0
+    cancelled: bool = False
+    duration: float = 0.0
+    errors: Dict[Union[int, str], str] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Отправлено сообщений в секунду."""
+        return self.sent / self.duration if self.duration else 0.0
+
+
+async def broadcast(
+    bot: Bot,
+    chat_ids: Iterable[Union[int, str]],
+    send: Callable[[Bot, Union[int, str]], Awaitable],
+    concurrency: int = 25,
+    update_progress: Optional[Callable[[], Awaitable[bool]]] = None,
+    logging_data: Optional[LoggingData] = None,
+) -> BroadcastResult:
+    """
+    Рассылка сообщения по списку чатов.
+
+    Частоту отправки ограничивает SendSchedulerMiddleware сессии бота, здесь
+    ограничивается только количество одновременных отправок. Ошибки отправки
+    в отдельные чаты(например, бот заблокирован пользователем) не прерывают
+    рассылку и записываются в errors. Любое другое исключение останавливает
+    все обработчики рассылки и передается вызывающему коду.
+
+    Args:
+        bot (Bot): Бот
+        chat_ids (Iterable[Union[int, str]]): Чаты для рассылки
+        send (Callable[[Bot, Union[int, str]], Awaitable]): Функция отправки в один чат
+
+        Пример:
+        lambda bot, chat_id: bot.send_message(chat_id=chat_id, text="Новости")
+
+        concurrency (int, optional): Количество одновременных отправок.По умолчанию 25
+        update_progress (Optional[Callable[[], Awaitable[bool]]], optional): Функция
+        обновления прогресса, вызывается после каждого чата.Если вернула False -
+        рассылка останавливается.
+
+        Пример:
+        async_make_update_progress(state=state) из app/app_utils/fsm.py
+
+        logging_data (Optional[LoggingData], optional): Обьект класса LoggingData.
+        По умолчанию None
+
+    Returns:
+        BroadcastResult: Результат рассылки
+    """
+    queue: List[Union[int, str]] = list(dict.fromkeys(chat_ids))
+    result: BroadcastResult = BroadcastResult(total=len(queue))
+    queue.reverse()
+    start: float = time.monotonic()
+
+    async def worker() -> None:
+        while queue and not result.cancelled:
+            chat_id = queue.pop()
+            try:
+                await send(bot, chat_id)
+                result.sent += 1
+            except TelegramAPIError as err:
+                result.failed += 1
+                result.errors[chat_id] = str(err)
+            if update_progress and not await update_progress():
+                result.cancelled = True
+
+    workers: List[asyncio.Future] = [
+        asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        # Без отмены остальные обработчики продолжили бы рассылку в фоне
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    finally:
+        result.duration = time.monotonic() - start
+
+    if logging_data:
+        logging_data.info_logger.info(
+            f"[BROADCAST] Отправлено {result.sent}/{result.total}, ошибок - "
+            f"{result.failed}, {result.duration:.1f} c ({result.throughput:.1f} сообщ./c)"
+            + (", остановлена пользователем" if result.cancelled else "")
+        )
+    return result
+
+
+async def send_media_groups(
+    bot: Bot,
+    chat_id: Union[int, str],
+    media: List[InputMedia],
+    **kwargs,
+) -> List[Message]:
+    """
+    Отправляет медиа альбомами по MEDIA_GROUP_SIZE вместо отдельных сообщений.
+
+    Если в последней группе остается одно медиа, оно отправляется отдельным
+    методом(send_photo, send_video...) с подписью и ее форматированием из медиа.
+
+    Args:
+        bot (Bot): Бот
+        chat_id (Union[int, str]): Чат
+        media (List[InputMedia]): Медиа для отправки
+        kwargs: Параметры bot.send_media_group
+
+    Returns:
+        List[Message]: Отправленные сообщения
+    """
+    messages: List[Message] = []
+    for index in range(0, len(media), MEDIA_GROUP_SIZE):
+        group: List[InputMedia] = media[index:index + MEDIA_GROUP_SIZE]
+        if len(group) == 1:
+            # Альбом из одного медиа Telegram не принимает
+            messages.append(await _send_single_media(bot, chat_id, group[0], **kwargs))
+            continue
+        messages.extend(await bot.send_media_group(chat_id=chat_id, media=group, **kwargs))
+    return messages
+
+
+async def _send_single_media(
+    bot: Bot,
+    chat_id: Union[int, str],
+    media: InputMedia,
+    **kwargs,
+) -> Message:
+    method, field_name = SINGLE_MEDIA_METHODS[type(media)]
+    # Переносим из медиа все поля, которые принимает метод(caption, parse_mode,
+    # caption_entities, has_spoiler...), параметры вызова имеют приоритет
+    params: Dict = {
+        name: getattr(media, name)
+        for name in type(media).model_fields.keys() & method.model_fields.keys()
+        if getattr(media, name) is not None
+    }
+    params.update(kwargs)
+    params[field_name] = media.media
+    return await bot(method(chat_id=chat_id, **params))
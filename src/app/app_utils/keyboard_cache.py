@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Hashable, Optional, Union
+from threading import Lock
+
+from aiogram.types import InlineKeyboardMarkup, ReplyKeyboardMarkup
+
+
+Markup = Union[InlineKeyboardMarkup, ReplyKeyboardMarkup]
+
+
+@dataclass
+class KeyboardCacheStats:
+    """Метрики кэша клавиатур."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class KeyboardCache:
+    """
+    LRU кэш готовых клавиатур.
+
+    Клавиатуры aiogram изменяемы, поэтому из кэша возвращается глубокая копия
+    сохраненной клавиатуры - изменение полученной клавиатуры не затрагивает кэш.
+    Копирование в несколько раз быстрее создания клавиатуры через builder.
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize: int = maxsize
+        self.stats: KeyboardCacheStats = KeyboardCacheStats()
+        self._data: "OrderedDict[Hashable, Markup]" = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[Markup]:
+        """Возвращает копию клавиатуры по ключу или None."""
+        with self._lock:
+            markup: Optional[Markup] = self._data.get(key)
+            if markup is None:
+                self.stats.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+        return markup.model_copy(deep=True)
+
+    def set(self, key: Hashable, markup: Markup) -> Markup:
+        """
+        Сохраняет копию клавиатуры, вытесняя самую давно использованную.
+
+        Переданная клавиатура остается у вызывающего кода и возвращается как есть.
+        """
+        with self._lock:
+            self._data[key] = markup.model_copy(deep=True)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+        return markup
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Markup]) -> Markup:
+        """
+        Возвращает копию клавиатуры из кэша или создает ее через factory.
+
+        Args:
+            key (Hashable): Ключ клавиатуры
+            factory (Callable[[], Markup]): Функция создания клавиатуры
+
+        Returns:
+            Markup: Клавиатура
+        """
+        markup: Optional[Markup] = self.get(key)
+        if markup is None:
+            markup = self.set(key, factory())
+        return markup
+
+    def clear(self) -> None:
+        """Очищает кэш и метрики."""
+        with self._lock:
+            self._data.clear()
+            self.stats = KeyboardCacheStats()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+keyboard_cache: KeyboardCache = KeyboardCache()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 from aiogram.utils.keyboard import ReplyKeyboardBuilder, InlineKeyboardBuilder
 from aiogram.types.keyboard_button import KeyboardButton
@@ -7,12 +7,14 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from core.response.response_data import InlineKeyboardData
 from core.response.messages import messages
+from app.app_utils.keyboard_cache import keyboard_cache
 
 
 def get_total_buttons_inline_kb(
     list_inline_kb_data: List[InlineKeyboardData],
     quantity_button: int = 1,
     resize_keyboard: bool = True,
+    cache: bool = True,
 ) -> InlineKeyboardMarkup:
     """Общая inline клавиатура с генерацими кнопок.
 
@@ -20,27 +22,40 @@ def get_total_buttons_inline_kb(
         list_inline_kb_data (List[InlineKeyboardData]): Список из InlineKeyboardData с данными о кнопке
         quantity_button (int): Количество кнопок на строке(По умолчанию 1)
         resize_keyboard (bool, optional): Изменяет размер клавиатуры по вертикали для оптимального размещения
+        cache (bool, optional): Брать копию клавиатуры из кэша клавиатур.По умолчанию True
 
     Returns:
         InlineKeyboardMarkup: Возвращает инлайн клавиатуру
     """
-    inline_kb: InlineKeyboardBuilder = InlineKeyboardBuilder()
+    buttons: Tuple[Tuple[str, str], ...] = tuple(
+        (button.text, button.callback_data) for button in list_inline_kb_data
+    )
+
+    def create() -> InlineKeyboardMarkup:
+        inline_kb: InlineKeyboardBuilder = InlineKeyboardBuilder()
 
-    for button in list_inline_kb_data:
-        inline_kb.add(
-            InlineKeyboardButton(
-                text=button.text,
-                callback_data=button.callback_data,
+        for text, callback_data in buttons:
+            inline_kb.add(
+                InlineKeyboardButton(
+                    text=text,
+                    callback_data=callback_data,
+                )
             )
-        )
-    inline_kb.adjust(quantity_button)
-    return inline_kb.as_markup(resize_keyboard=resize_keyboard)
+        inline_kb.adjust(quantity_button)
+        return inline_kb.as_markup(resize_keyboard=resize_keyboard)
+
+    if not cache:
+        return create()
+    return keyboard_cache.get_or_create(
+        key=("inline", buttons, quantity_button, resize_keyboard), factory=create
+    )
 
 
 def get_total_buttons_reply_kb(
     list_text: List[str],
     quantity_button: int,
     resize_keyboard=True,
+    cache: bool = True,
 ) -> ReplyKeyboardMarkup:
     """Общая reply клавиатура с генерациями кнопок.
 
@@ -48,27 +63,38 @@ def get_total_buttons_reply_kb(
         list_text (List[str]): Список из строк с названиями кнопок
         quantity_button (int): Количество кнопок на строке
         resize_keyboard (bool, optional): Изменяет размер клавиатуры по вертикали для оптимального размещения
+        cache (bool, optional): Брать копию клавиатуры из кэша клавиатур.По умолчанию True
 
     Returns:
         ReplyKeyboardMarkup: Возвращает reply клавиатуру
     """
-    reply_kb: ReplyKeyboardBuilder = ReplyKeyboardBuilder()
+    texts: Tuple[str, ...] = tuple(list_text)
 
-    for text_button in list_text:
-        reply_kb.add(KeyboardButton(text=text_button))
+    def create() -> ReplyKeyboardMarkup:
+        reply_kb: ReplyKeyboardBuilder = ReplyKeyboardBuilder()
 
-    reply_kb.adjust(quantity_button)
+        for text_button in texts:
+            reply_kb.add(KeyboardButton(text=text_button))
 
-    return reply_kb.as_markup(
-        resize_keyboard=resize_keyboard,
+        reply_kb.adjust(quantity_button)
+
+        return reply_kb.as_markup(
+            resize_keyboard=resize_keyboard,
+        )
+
+    if not cache:
+        return create()
+    return keyboard_cache.get_or_create(
+        key=("reply", texts, quantity_button, resize_keyboard), factory=create
     )
 
 
 def get_reply_cancel_button() -> ReplyKeyboardMarkup:
     """Reply кнопка отмены."""
-    reply_kb: ReplyKeyboardBuilder = ReplyKeyboardBuilder()
-    reply_kb.add(KeyboardButton(text=messages.CANCEL_TEXT))
-    return reply_kb.as_markup(resize_keyboard=True)
+    return get_total_buttons_reply_kb(
+        list_text=[messages.CANCEL_TEXT],
+        quantity_button=1,
+    )
 
 
 def get_button_for_forward_or_back(
@@ -76,22 +102,71 @@ def get_button_for_forward_or_back(
     list_data: List,
     indeх: int = 0,
     step: int = 1,
+    cache: bool = True,
 ) -> InlineKeyboardMarkup:
     """
     Возвращает инлайн кнопки для прoлистывания назад или вперед.
 
+    Клавиатура зависит только от длины list_data, поэтому в кэше хранится по
+    ключу (prefix, длина списка, indeх, step).
+
     Args:
         prefix (str): Слово которое будет стоять в начале callback data
         list_albums (List): Список содержащий в себе данные по которым нужно листать
         indeх (int, optional): Текущеий индекс отображения списка.По умолчанию 0.
         step (int, optional): Шаг пролистывания. По умолчанию 1.
+        cache (bool, optional): Брать копию клавиатуры из кэша клавиатур.По умолчанию True
 
     Returns:
         InlineKeyboardMarkup: Инлайн клавиатура
     """
+    total: int = len(list_data)
+    if not cache:
+        return _create_button_for_forward_or_back(prefix, total, indeх, step)
+    return keyboard_cache.get_or_create(
+        key=("forward_or_back", prefix, total, indeх, step),
+        factory=lambda: _create_button_for_forward_or_back(prefix, total, indeх, step),
+    )
+
+
+def prerender_button_for_forward_or_back(
+    prefix: str,
+    total: int,
+    step: int = 1,
+) -> int:
+    """
+    Заранее создает в кэше клавиатуры пролистывания для всех страниц списка.
+
+    Args:
+        prefix (str): Слово которое будет стоять в начале callback data
+        total (int): Длина списка по которому нужно листать
+        step (int, optional): Шаг пролистывания. По умолчанию 1.
+
+    Returns:
+        int: Количество созданных клавиатур
+    """
+    count: int = 0
+    for index in range(0, total, step):
+        key = ("forward_or_back", prefix, total, index, step)
+        if key in keyboard_cache:
+            continue
+        keyboard_cache.set(
+            key=key,
+            markup=_create_button_for_forward_or_back(prefix, total, index, step),
+        )
+        count += 1
+    return count
+
+
+def _create_button_for_forward_or_back(
+    prefix: str,
+    total: int,
+    indeх: int,
+    step: int,
+) -> InlineKeyboardMarkup:
     inline_kb: InlineKeyboardMarkup = InlineKeyboardBuilder()
     if indeх == 0:
-        if len(list_data) == 1:
+        if total == 1:
             pass
         else:
             inline_kb.add(
@@ -100,13 +175,13 @@ def get_button_for_forward_or_back(
                 )
             )
     else:
-        if len(list_data) - indeх == step:
+        if total - indeх == step:
             inline_kb.add(
                 InlineKeyboardButton(
                     text="👈 Назад", callback_data=f"{prefix} back {indeх-step}"
                 )
             )
-        elif len(list_data) - indeх >= step:
+        elif total - indeх >= step:
             inline_kb.add(
                 InlineKeyboardButton(
                     text="👈 Назад", callback_data=f"{prefix} back {indeх-step}"
@@ -1,5 +1,17 @@
 from aiogram import Bot, Dispatcher
 from app.bot.settings import settings
+from app.bot.core.middleware.throttling import SendSchedulerMiddleware
 
 telegram_bot: Bot = Bot(token=settings.TOKEN)
 dp: Dispatcher = Dispatcher()
+
+# Ограничение частоты отправки сообщений и повтор запросов при TelegramRetryAfter
+send_scheduler: SendSchedulerMiddleware = SendSchedulerMiddleware(
+    # Каждый процесс обработки апдейтов ограничивается своей долей общего лимита
+    global_rate=settings.TELEGRAM_GLOBAL_RATE / max(1, settings.WORKERS),
+    chat_rate=settings.TELEGRAM_CHAT_RATE,
+    chat_burst=settings.TELEGRAM_CHAT_BURST,
+    group_rate=settings.TELEGRAM_GROUP_RATE,
+    max_retries=settings.TELEGRAM_MAX_RETRIES,
+)
+telegram_bot.session.middleware(send_scheduler)
@@ -0,0 +1,44 @@
+from typing import Any, Optional
+
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.types import CallbackQuery
+
+from core.module_loader.runtime.dispatch_index import DispatchIndex
+
+
+class DispatchIndexMiddleware(BaseMiddleware):
+    """
+    Outer middleware диспетчера, передающий событие сразу в роутер модуля-владельца.
+
+    Если владелец не найден в индексе или не обработал событие, событие проходит
+    обычный путь по всем роутерам. При активном состоянии FSM индекс не
+    используется: ввод в состоянии должен получить роутер, который его ожидает,
+    даже если текст совпадает с кнопкой меню другого модуля.
+    """
+
+    def __init__(self, index: DispatchIndex) -> None:
+        """Инициализация параметров."""
+        super().__init__()
+        self.index: DispatchIndex = index
+
+    async def __call__(self, handler, event, data) -> Optional[Any]:
+        """Маршрутизация события по индексу."""
+        if data.get("raw_state") is not None:
+            self.index.stats.bypasses += 1
+            return await handler(event, data)
+
+        router = self.index.find(event)
+        if router is None:
+            self.index.stats.misses += 1
+            return await handler(event, data)
+
+        self.index.stats.hits += 1
+        update_type: str = (
+            "callback_query" if isinstance(event, CallbackQuery) else "message"
+        )
+        response = await router.propagate_event(update_type, event, **data)
+        if response is UNHANDLED:
+            self.index.stats.fallbacks += 1
+            return await handler(event, data)
+        return response
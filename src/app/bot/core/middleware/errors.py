@@ -1,9 +1,11 @@
-import traceback
 from typing import Optional, Any
 from logging import Logger
+import time
 
 from aiogram import BaseMiddleware
 
+from core.error_handlers.format import EventErrorMessage
+
 
 class RouterErrorMiddleware(BaseMiddleware):
     """Middleware для обработки ошибок routera."""
@@ -16,19 +18,16 @@ class RouterErrorMiddleware(BaseMiddleware):
 
     async def __call__(self, handler, event, data) -> Optional[Any]:
         """Обработчик ошибок."""
+        started: float = time.perf_counter()
         try:
             return await handler(event, data)
         except Exception as err:
-            # Формируем красивое сообщение
-            error_text: str = (
-                f"🚨 Ошибка в Router: {self.current_logger.name}\n"
-                f"Тип события: {type(event).__name__}\n"
-                f"Пользователь: {getattr(event.from_user, 'username', 'Неизвестно')} "
-                f"(id={getattr(event.from_user, 'id', '—')})\n"
-                f"Текст: {getattr(event, 'text', '—')}\n"
-                f"Ошибка: {err}\n"
-                f"Трассировка:\n{traceback.format_exc()}"
-                f"\n{'-' * 80}\n"
+            # Сообщение и трассировка формируются только при записи в лог
+            error_text: EventErrorMessage = EventErrorMessage(
+                name_router=self.current_logger.name,
+                event=event,
+                error=err,
+                duration=time.perf_counter() - started,
             )
 
             # Логируем локально
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Dict, Tuple, Union
+import time
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+
+from core.error_handlers.rate_limit import TokenBucket
+
+
+SEND_METHOD_PREFIXES: Tuple[str, ...] = ("Send", "Forward", "Copy", "Edit")
+
+
+@dataclass
+class SendSchedulerStats:
+    """Метрики отправки сообщений в Telegram."""
+
+    sent: int = 0
+    retried: int = 0
+    retry_after_total: float = 0.0
+    wait_total: float = 0.0
+    started: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Отправлено сообщений в секунду с первой отправки."""
+        duration: float = time.monotonic() - self.started if self.started else 0.0
+        return self.sent / duration if duration else 0.0
+
+
+class SendSchedulerMiddleware(BaseRequestMiddleware):
+    """
+    Middleware сессии бота, ограничивающий частоту отправки сообщений.
+
+    Методы отправки(Send*, Forward*, Copy*, Edit*) ждут разрешения общего
+    ограничителя и ограничителя чата(для групп - отдельная частота).
+    При TelegramRetryAfter чат приостанавливается на retry_after секунд и
+    запрос повторяется до max_retries раз.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = 30.0,
+        chat_rate: float = 1.0,
+        chat_burst: int = 3,
+        group_rate: float = 20 / 60,
+        max_retries: int = 3,
+        max_chats: int = 10000,
+    ) -> None:
+        """Инициализация параметров."""
+        self.chat_rate: float = chat_rate
+        self.chat_burst: int = chat_burst
+        self.group_rate: float = group_rate
+        self.max_retries: int = max_retries
+        self.max_chats: int = max_chats
+        self.global_bucket: TokenBucket = TokenBucket(
+            rate=global_rate, burst=max(1, int(global_rate))
+        )
+        self.stats: SendSchedulerStats = SendSchedulerStats()
+        self._chats: "OrderedDict[Union[int, str], TokenBucket]" = OrderedDict()
+
+    def get_chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        """Возвращает ограничитель чата, удаляя самые давно использованные."""
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            is_group: bool = isinstance(chat_id, str) or chat_id < 0
+            bucket = (
+                TokenBucket(rate=self.group_rate)
+                if is_group
+                else TokenBucket(rate=self.chat_rate, burst=self.chat_burst)
+            )
+            self._chats[chat_id] = bucket
+            while len(self._chats) > self.max_chats:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return bucket
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        bot: Bot,
+        method: TelegramMethod,
+    ) -> Response:
+        """Отправка запроса с ограничением частоты."""
+        chat_id = getattr(method, "chat_id", None)
+        if chat_id is None or not type(method).__name__.startswith(SEND_METHOD_PREFIXES):
+            return await make_request(bot, method)
+
+        if not self.stats.started:
+            self.stats.started = time.monotonic()
+        chat_bucket: TokenBucket = self.get_chat_bucket(chat_id)
+        for attempt in range(self.max_retries + 1):
+            self.stats.wait_total += await chat_bucket.acquire()
+            self.stats.wait_total += await self.global_bucket.acquire()
+            try:
+                response: Response = await make_request(bot, method)
+            except TelegramRetryAfter as err:
+                if attempt == self.max_retries:
+                    raise
+                self.stats.retried += 1
+                self.stats.retry_after_total += err.retry_after
+                chat_bucket.block(err.retry_after)
+                continue
+            self.stats.sent += 1
+            return response
+
+    def snapshot(self) -> Dict:
+        """Возвращает метрики отправки."""
+        snapshot: Dict = asdict(self.stats)
+        snapshot["throughput"] = self.stats.throughput
+        snapshot["chats"] = len(self._chats)
+        snapshot["queued"] = self.global_bucket.stats.queued
+        return snapshot
@@ -8,6 +8,7 @@ class BotPath:
     STATIC_DIR: Path = BOT_DIR / "static"
     TEMP_DIR: Path = BOT_DIR / "temp"
     LOG_DIR: Path = BOT_DIR / "logs"
+    CACHE_DIR: Path = BOT_DIR / "cache"
 
 
 bot_path = BotPath()
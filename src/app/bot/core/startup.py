@@ -1,5 +1,4 @@
 from pathlib import Path
-from typing import List
 import traceback
 
 from app.bot.core.bot import dp
@@ -7,49 +6,143 @@ from app.bot.core.paths import bot_path
 from app.bot.core.bot import telegram_bot
 from app.bot.settings import settings
 from app.bot.core.middleware.errors import RouterErrorMiddleware
-from app.app_utils.keyboards import get_total_buttons_reply_kb
-from core.module_loader.runtime.loader import load_modules
+from app.bot.core.middleware.dispatch import DispatchIndexMiddleware
+from app.app_utils.keyboards import get_total_buttons_reply_kb, get_reply_cancel_button
+from app.app_utils.keyboard_cache import keyboard_cache
+from core.module_loader.runtime.loader import load_routers
+from core.module_loader.runtime.manifest import manifest_stats
+from core.module_loader.runtime.registry import ModuleRegistry
+from core.module_loader.runtime.lazy import lazy_stats
+from core.module_loader.runtime.parallel import import_stats
+from core.module_loader.runtime.dispatch_index import build_dispatch_index
+from core.error_handlers.rate_limit import RateLimitSettings, rate_limiter
+from core.contracts.module import (
+    OPTIONAL_FIELD_EXECUTOR_LIMITS,
+    OPTIONAL_FIELD_RATE_LIMITS,
+)
+from core.utils.executors import executor_manager
+from core.context.api import get_app_context
 from core.utils.filesistem import ensure_directories
 from core.module_loader.runtime.register import register_module
 from core.logging.api import get_loggers
-from core.contracts.constants import (
-    DEFAULT_BOT_MODULES_ROOT,
-    DEFAULT_NAME_ROUTER,
-    DEFAULT_NAME_SETTINGS,
-)
+from core.logging.handlers import handler_registry
+from core.contracts.constants import DEFAULT_NAME_ROUTER
 from core.error_handlers.helpers import ok, fail
 from core.response.response_data import Result
 from core.error_handlers.format import format_errors_message
+from core.profiling.startup import profiler
 
 
-async def setup_bot() -> Result:
-    """Подключает все необходимые компоненты для работы бота."""
+@profiler.profile(phase="prepare_bot")
+def prepare_bot() -> Result:
+    """
+    Подключает модули, middleware и клавиатуру главного меню без обращения к Telegram.
+
+    Используется в setup_bot и в cli profile-startup.
+    """
     try:
         logging_bot = get_loggers(name=settings.NAME_FOR_LOG_FOLDER)
 
-        result_load_modules = load_modules(
-            root_package=DEFAULT_BOT_MODULES_ROOT,
+        ctx = get_app_context()
+        keyboard_cache.maxsize = settings.KEYBOARD_CACHE_SIZE
+        logging_bot.info_logger.info(
+            f"[LOGGING] Обработчики логов: {handler_registry.snapshot()}"
+        )
+
+        if manifest_stats.last_status == "save error":
+            log_manifest = logging_bot.warning_logger.warning
+        else:
+            log_manifest = logging_bot.info_logger.info
+        log_manifest(
+            f"Manifest модулей: {manifest_stats.last_status} "
+            f"(hit={manifest_stats.hits}, miss={manifest_stats.misses})"
+            + (
+                f"\nПричина: {manifest_stats.last_reason}"
+                if manifest_stats.last_reason
+                else ""
+            )
+        )
+
+        result_load_routers = load_routers(
+            registry=ctx.modules,
             name_router=DEFAULT_NAME_ROUTER,
-            name_settings=DEFAULT_NAME_SETTINGS,
+            logging_data=logging_bot,
+            lazy=settings.LAZY_ROUTERS,
+            workers=settings.ROUTERS_IMPORT_WORKERS,
+        )
+        if not result_load_routers.ok:
+            return result_load_routers
+
+        slowest_imports: str = "\n".join(
+            f"{package} - {duration:.3f} c"
+            for package, duration in import_stats.slowest()
+        )
+        logging_bot.info_logger.info(
+            f"[IMPORT] Роутеры импортированы за {import_stats.total:.3f} c "
+            f"({import_stats.mode}, потоков - {import_stats.workers})\n"
+            f"Самые долгие импорты:\n{slowest_imports}"
         )
-        if not result_load_modules.ok:
-            return result_load_modules
 
-        array_modules = result_load_modules.data
+        modules: ModuleRegistry = result_load_routers.data
 
-        register_module(
+        routers = register_module(
             dp=dp,
-            modules=array_modules,
+            modules=modules,
             logging_data=logging_bot,
             name=DEFAULT_NAME_ROUTER,
         )  # регестрируем модули
+        if settings.LAZY_ROUTERS:
+            logging_bot.info_logger.info(
+                f"[LAZY] Роутеров отложено - {lazy_stats.deferred}, "
+                f"загружено при старте - {len(modules) - lazy_stats.deferred}"
+            )
+
+        if settings.DISPATCH_INDEX:
+            dispatch_index = build_dispatch_index(
+                modules=modules,
+                routers=routers,
+                logging_data=logging_bot,
+            )
+            dp.message.outer_middleware(DispatchIndexMiddleware(index=dispatch_index))
+            dp.callback_query.outer_middleware(
+                DispatchIndexMiddleware(index=dispatch_index)
+            )
+            dp["dispatch_index"] = dispatch_index
+            logging_bot.info_logger.info(
+                f"[DISPATCH INDEX] Индекс маршрутизации подключен, ключей - "
+                f"{len(dispatch_index)}"
+            )
+
+        for host, rate_limit in settings.RATE_LIMITS.items():
+            rate_limiter.configure(host=host, settings=rate_limit)
+        for module in modules:
+            module_rate_limits = getattr(module.config, OPTIONAL_FIELD_RATE_LIMITS, None)
+            for host, rate_limit in (module_rate_limits or {}).items():
+                rate_limiter.configure(
+                    host=host,
+                    settings=RateLimitSettings.model_validate(rate_limit),
+                    module=module.config.NAME_FOR_LOG_FOLDER,
+                )
+        if len(rate_limiter):
+            logging_bot.info_logger.info(
+                f"[RATE LIMIT] Подключены ограничения частоты запросов:\n"
+                f"{', '.join(rate_limiter.snapshot())}"
+            )
+
+        for name, executor_settings in settings.EXECUTORS.items():
+            executor_manager.configure(name=name, settings=executor_settings)
+        for module in modules:
+            module_limits = getattr(module.config, OPTIONAL_FIELD_EXECUTOR_LIMITS, None)
+            for name, limit in (module_limits or {}).items():
+                executor_manager.configure_module(
+                    name=name,
+                    module=module.config.NAME_FOR_LOG_FOLDER,
+                    limit=limit,
+                )
 
-        settings_array_modules = [
-            getattr(model.settings, DEFAULT_NAME_SETTINGS) for model in array_modules
-        ]
         list_path_to_temp_folder = [
-            bot_path.TEMP_DIR / Path(config.NAME_FOR_TEMP_FOLDER)
-            for config in settings_array_modules
+            bot_path.TEMP_DIR / Path(module.config.NAME_FOR_TEMP_FOLDER)
+            for module in modules
         ]  # получаем список из путей для папки temp
 
         result_directory = ensure_directories(
@@ -61,16 +154,11 @@ async def setup_bot() -> Result:
         if not result_directory.ok:
             return result_directory
 
-        root_modules = [m for m in array_modules if m.is_root]
-
-        settings_root_modules = [
-            getattr(module.settings, DEFAULT_NAME_SETTINGS) for module in root_modules
-        ]
         # Формируем клавиатуру для главного меню
         settings_modules = [
-            config.MENU_REPLY_TEXT
-            for config in settings_root_modules
-            if config.SHOW_IN_MAIN_MENU
+            module.config.MENU_REPLY_TEXT
+            for module in modules.roots
+            if module.config.SHOW_IN_MAIN_MENU
         ]
         get_main_keyboards = None
         if len(settings_modules) == 0:
@@ -88,19 +176,16 @@ async def setup_bot() -> Result:
             logging_bot.info_logger.info(
                 f"Подключена клавиатура главного меню:\nПодключены кнопки - {buttons}"
             )
+        get_reply_cancel_button()  # статичная клавиатура, создается в кэше заранее
+        logging_bot.info_logger.info(
+            f"[KEYBOARD CACHE] Клавиатур в кэше - {len(keyboard_cache)}"
+        )
 
-        await telegram_bot.set_my_commands(
-            commands=settings.LIST_BOT_COMMANDS  # Добавляет команды боту
-        )  # Добавляет команды боту
-        await telegram_bot.delete_webhook(
-            drop_pending_updates=True
-        )  # Игнорирует все присланные сообщение пока бот не работал
-
-        for model in root_modules:
+        for module in modules.roots:
             # получаем  логгеры
 
-            config = getattr(model.settings, DEFAULT_NAME_SETTINGS)
-            router = getattr(model.router, DEFAULT_NAME_ROUTER)
+            config = module.config
+            router = routers[module.package]
 
             logging_data = get_loggers(
                 name=config.NAME_FOR_LOG_FOLDER,
@@ -122,6 +207,36 @@ async def setup_bot() -> Result:
 
         return ok(data=(get_main_keyboards, dp))
     except Exception as err:
+        logging_bot.error_logger.error(
+            msg=format_errors_message(
+                name_router=logging_bot.router_name,
+                function_name=prepare_bot.__name__,
+                error_text=f"Критическая ошибка в работе startup\n{traceback.format_exc()}",
+            )
+        )
+        return fail(
+            code="STARTUP FAIL",
+            message=f"Критическая ошибка в работе startup - {err}",
+            details=str(traceback.format_exc()),
+        )
+
+
+async def setup_bot() -> Result:
+    """Подключает все необходимые компоненты для работы бота."""
+    result_prepare = prepare_bot()
+    if not result_prepare.ok:
+        return result_prepare
+
+    try:
+        await telegram_bot.set_my_commands(
+            commands=settings.LIST_BOT_COMMANDS  # Добавляет команды боту
+        )  # Добавляет команды боту
+        if settings.RUN_MODE == "polling":
+            await telegram_bot.delete_webhook(
+                drop_pending_updates=True
+            )  # Игнорирует все присланные сообщение пока бот не работал
+    except Exception as err:
+        logging_bot = get_loggers(name=settings.NAME_FOR_LOG_FOLDER)
         logging_bot.error_logger.error(
             msg=format_errors_message(
                 name_router=logging_bot.router_name,
@@ -134,3 +249,4 @@ async def setup_bot() -> Result:
             message=f"Критическая ошибка в работе startup - {err}",
             details=str(traceback.format_exc()),
         )
+    return result_prepare
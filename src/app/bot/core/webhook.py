@@ -0,0 +1,157 @@
+from typing import Any, Dict, Optional
+import asyncio
+
+from aiohttp import web
+from aiogram import Bot, Dispatcher
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+
+from core.response.response_data import LoggingData
+from core.module_loader.runtime.lazy import resolve_allowed_updates
+
+
+class LimitedRequestHandler(SimpleRequestHandler):
+    """
+    Обработчик webhook с ограничением количества одновременно обрабатываемых апдейтов.
+
+    Telegram получает ответ сразу, апдейты обрабатываются в фоне. При остановке
+    сервер ждет завершения начатых обработок не дольше shutdown_timeout секунд.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        max_concurrency: int = 100,
+        shutdown_timeout: float = 10.0,
+        secret_token: Optional[str] = None,
+        **data: Any,
+    ) -> None:
+        """Инициализация параметров."""
+        super().__init__(
+            dispatcher=dispatcher,
+            bot=bot,
+            handle_in_background=True,
+            secret_token=secret_token,
+            **data,
+        )
+        self.shutdown_timeout: float = shutdown_timeout
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _background_feed_update(self, bot: Bot, update: Dict[str, Any]) -> None:
+        async with self._semaphore:
+            await super()._background_feed_update(bot=bot, update=update)
+
+    async def close(self) -> None:
+        """Ждет обработки начатых апдейтов и закрывает сессию бота."""
+        tasks = list(self._background_feed_update_tasks)
+        if tasks:
+            await asyncio.wait(tasks, timeout=self.shutdown_timeout)
+        await super().close()
+
+
+def create_webhook_app(
+    dp: Dispatcher,
+    bot: Bot,
+    path: str,
+    secret_token: Optional[str] = None,
+    max_concurrency: int = 100,
+    **data: Any,
+) -> web.Application:
+    """
+    Создает aiohttp приложение для приема апдейтов Telegram.
+
+    Args:
+        dp (Dispatcher): Диспетчер
+        bot (Bot): Бот
+        path (str): Путь webhook
+
+        Пример:
+        /webhook
+
+        secret_token (Optional[str], optional): Секрет из заголовка
+        X-Telegram-Bot-Api-Secret-Token.По умолчанию None - без проверки
+        max_concurrency (int, optional): Апдейтов в обработке одновременно.По умолчанию 100
+        data: Данные для хендлеров
+
+    Returns:
+        web.Application: aiohttp приложение
+    """
+    app: web.Application = web.Application()
+    LimitedRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        max_concurrency=max_concurrency,
+        secret_token=secret_token,
+        **data,
+    ).register(app, path=path)
+    setup_application(app, dp, bot=bot, **data)
+    return app
+
+
+async def run_webhook(
+    dp: Dispatcher,
+    bot: Bot,
+    stop_event: asyncio.Event,
+    url: str,
+    path: str,
+    host: str,
+    port: int,
+    logging_data: LoggingData,
+    secret_token: Optional[str] = None,
+    max_concurrency: int = 100,
+    max_connections: int = 40,
+    set_webhook: bool = True,
+    app: Optional[web.Application] = None,
+) -> None:
+    """
+    Запускает webhook сервер и работает до установки stop_event.
+
+    Args:
+        dp (Dispatcher): Диспетчер
+        bot (Bot): Бот
+        stop_event (asyncio.Event): Событие остановки сервера
+        url (str): Публичный адрес сервера для Telegram
+
+        Пример:
+        https://example.com
+
+        path (str): Путь webhook
+        host (str): Адрес для запуска сервера
+        port (int): Порт для запуска сервера
+        logging_data (LoggingData): Обьект класса LoggingData
+        secret_token (Optional[str], optional): Секрет webhook.По умолчанию None
+        max_concurrency (int, optional): Апдейтов в обработке одновременно.По умолчанию 100
+        max_connections (int, optional): Соединений Telegram к серверу.По умолчанию 40
+        set_webhook (bool, optional): Зарегистрировать webhook в Telegram.По умолчанию True
+        app (Optional[web.Application], optional): Приложение для приема апдейтов.
+        По умолчанию None - create_webhook_app
+    """
+    if app is None:
+        app = create_webhook_app(
+            dp=dp,
+            bot=bot,
+            path=path,
+            secret_token=secret_token,
+            max_concurrency=max_concurrency,
+        )
+    runner: web.AppRunner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host=host, port=port).start()
+        if set_webhook:
+            await bot.set_webhook(
+                url=f"{url.rstrip('/')}{path}",
+                secret_token=secret_token,
+                max_connections=max_connections,
+                allowed_updates=resolve_allowed_updates(dp),
+                drop_pending_updates=True,
+            )
+        logging_data.info_logger.info(
+            f"[WEBHOOK] Сервер запущен на {host}:{port}{path}, "
+            f"одновременно апдейтов - {max_concurrency}"
+        )
+        await stop_event.wait()
+    finally:
+        logging_data.info_logger.info("[WEBHOOK] Остановка сервера...")
+        await runner.cleanup()
+        logging_data.info_logger.info("[WEBHOOK] Сервер остановлен")
@@ -0,0 +1,286 @@
+from functools import partial
+from typing import Dict, List, Optional
+import asyncio
+import os
+import queue as queue_module
+import secrets
+import signal
+import time
+
+from aiohttp import web
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+
+from app.bot.core.startup import prepare_bot
+from app.bot.core.bot import telegram_bot, send_scheduler
+from app.bot.core.webhook import run_webhook
+from app.bot.settings import settings
+from core.context.context import create_app_context
+from core.context.runtime import ContextRuntime
+from core.logging.api import get_loggers
+from core.logging.handlers import handler_registry
+from core.response.response_data import LoggingData
+from core.utils.session_pool import SessionPool
+from core.utils.executors import executor_manager
+from core.utils.worker_pool import (
+    KeyedTaskRunner,
+    WorkerPool,
+    WorkerStats,
+    get_update_route_key,
+)
+from core.module_loader.runtime.lazy import resolve_allowed_updates
+
+
+POLLING_TIMEOUT: int = 10  # Время ожидания getUpdates в секундах
+POLLING_ERROR_DELAY: float = 5.0  # Пауза после ошибки getUpdates
+
+
+def worker_main(index: int, queue, heartbeat) -> None:
+    """
+    Точка входа процесса обработки апдейтов.
+
+    Сигналы остановки обрабатывает supervisor: он отправляет None в очередь,
+    и процесс завершается после обработки уже полученных апдейтов.
+
+    Args:
+        index (int): Номер процесса
+        queue (multiprocessing.Queue): Очередь апдейтов процесса
+        heartbeat (multiprocessing.Value): Время последнего heartbeat
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    heartbeat.value = time.time()
+    # При ротации логов процесс пишет в свои файлы(info.worker-1.log)
+    handler_registry.process_name = f"worker-{index}"
+    ContextRuntime.init(create_app_context())
+    asyncio.run(run_worker(index=index, queue=queue, heartbeat=heartbeat))
+
+
+def _get_update(queue, parent_pid: int) -> Optional[Dict]:
+    # Процесс обработки не демон и не завершается вместе с supervisor, поэтому
+    # при смерти supervisor чтение очереди прекращается
+    while True:
+        try:
+            return queue.get(timeout=settings.WORKERS_HEARTBEAT_INTERVAL)
+        except queue_module.Empty:
+            if os.getppid() != parent_pid:
+                return None
+
+
+async def run_worker(index: int, queue, heartbeat) -> None:
+    """
+    Обрабатывает апдейты из очереди до получения None.
+
+    Апдейты одного чата обрабатываются по порядку, разных чатов - параллельно.
+    """
+    logging_data: LoggingData = get_loggers(name=settings.NAME_FOR_LOG_FOLDER)
+    result_prepare = prepare_bot()
+    if not result_prepare.ok:
+        logging_data.critical_logger.critical(
+            f"[WORKER {index}] Ошибка при запуске: {result_prepare.error.code} "
+            f"{result_prepare.error.message}"
+        )
+        return
+
+    get_main_keyboards, dp = result_prepare.data
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    parent_pid: int = os.getppid()
+    runner: KeyedTaskRunner = KeyedTaskRunner(
+        max_concurrency=settings.WORKERS_MAX_CONCURRENCY
+    )
+
+    async def beat() -> None:
+        while True:
+            heartbeat.value = time.time()
+            await asyncio.sleep(settings.WORKERS_HEARTBEAT_INTERVAL)
+
+    async def feed(update: Dict) -> None:
+        try:
+            await dp.feed_raw_update(telegram_bot, update)
+        except Exception:
+            logging_data.error_logger.exception(
+                f"[WORKER {index}] Ошибка обработки апдейта {update.get('update_id')}"
+            )
+            raise
+
+    beat_task: asyncio.Task = asyncio.create_task(beat())
+    async with SessionPool(
+        default=settings.SESSION_DEFAULT,
+        upstreams=settings.SESSION_UPSTREAMS,
+    ) as session_pool:
+        dp["session"] = session_pool.get()
+        dp["session_pool"] = session_pool
+        dp["send_scheduler"] = send_scheduler
+        dp["get_main_keyboards"] = get_main_keyboards
+        await dp.emit_startup(bot=telegram_bot, dispatcher=dp, **dp.workflow_data)
+        logging_data.info_logger.info(f"[WORKER {index}] Процесс запущен")
+        try:
+            while True:
+                update: Optional[Dict] = await loop.run_in_executor(
+                    None, _get_update, queue, parent_pid
+                )
+                if update is None:
+                    break
+                runner.submit(get_update_route_key(update), partial(feed, update))
+            await runner.join()
+        finally:
+            beat_task.cancel()
+            await dp.emit_shutdown(bot=telegram_bot, dispatcher=dp, **dp.workflow_data)
+            logging_data.info_logger.info(
+                f"[WORKER {index}] Процесс остановлен, ошибок обработки - {runner.failed}\n"
+                f"Метрики сессий: {session_pool.snapshot()}\n"
+                f"Метрики отправки: {send_scheduler.snapshot()}\n"
+                f"Метрики пулов: {executor_manager.snapshot()}"
+            )
+            executor_manager.shutdown(wait=False)
+    await telegram_bot.session.close()
+
+
+def create_supervisor_webhook_app(
+    pool: WorkerPool,
+    path: str,
+    secret_token: Optional[str] = None,
+) -> web.Application:
+    """
+    Создает aiohttp приложение, передающее апдейты webhook в процессы обработки.
+
+    Args:
+        pool (WorkerPool): Процессы обработки апдейтов
+        path (str): Путь webhook
+        secret_token (Optional[str], optional): Секрет webhook.По умолчанию None
+
+    Returns:
+        web.Application: aiohttp приложение
+    """
+
+    async def handle(request: web.Request) -> web.Response:
+        if secret_token and not secrets.compare_digest(
+            request.headers.get("X-Telegram-Bot-Api-Secret-Token", ""), secret_token
+        ):
+            return web.Response(body="Unauthorized", status=401)
+        pool.dispatch(await request.json())
+        return web.json_response({})
+
+    app: web.Application = web.Application()
+    app.router.add_post(path, handle)
+    return app
+
+
+async def run_supervisor(
+    dp: Dispatcher,
+    stop_event: Optional[asyncio.Event],
+    logging_data: LoggingData,
+) -> None:
+    """
+    Запускает процессы обработки апдейтов и передает им апдейты Telegram.
+
+    Апдейты получаются через polling или webhook(RUN_MODE) и распределяются по
+    процессам по id чата. Процессы проверяются каждые WORKERS_HEARTBEAT_INTERVAL
+    секунд, упавшие и зависшие перезапускаются.
+
+    Args:
+        dp (Dispatcher): Диспетчер с загруженными роутерами
+        stop_event (Optional[asyncio.Event]): Событие остановки.None - работа до
+        отмены задачи
+        logging_data (LoggingData): Обьект класса LoggingData
+    """
+    stop_event = stop_event or asyncio.Event()
+    pool: WorkerPool = WorkerPool(
+        target=worker_main,
+        workers=settings.WORKERS,
+        heartbeat_timeout=settings.WORKERS_HEARTBEAT_TIMEOUT,
+        stop_timeout=settings.WORKERS_STOP_TIMEOUT,
+    )
+    pool.start()
+    logging_data.info_logger.info(
+        f"[SUPERVISOR] Запущено процессов обработки - {pool.workers}"
+    )
+    monitor: asyncio.Task = asyncio.create_task(
+        _monitor_workers(pool=pool, logging_data=logging_data)
+    )
+    try:
+        if settings.RUN_MODE == "webhook":
+            await run_webhook(
+                dp=dp,
+                bot=telegram_bot,
+                stop_event=stop_event,
+                url=settings.WEBHOOK_URL,
+                path=settings.WEBHOOK_PATH,
+                host=settings.WEBHOOK_HOST,
+                port=settings.WEBHOOK_PORT,
+                logging_data=logging_data,
+                secret_token=settings.WEBHOOK_SECRET,
+                max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+                set_webhook=bool(settings.WEBHOOK_URL),
+                app=create_supervisor_webhook_app(
+                    pool=pool,
+                    path=settings.WEBHOOK_PATH,
+                    secret_token=settings.WEBHOOK_SECRET,
+                ),
+            )
+        else:
+            await _poll_updates(
+                pool=pool,
+                bot=telegram_bot,
+                allowed_updates=resolve_allowed_updates(dp),
+                stop_event=stop_event,
+                logging_data=logging_data,
+            )
+    finally:
+        monitor.cancel()
+        logging_data.info_logger.info("[SUPERVISOR] Остановка процессов обработки...")
+        await asyncio.get_running_loop().run_in_executor(None, pool.stop)
+        logging_data.info_logger.info(
+            f"[SUPERVISOR] Метрики процессов:\n{pool.snapshot()}"
+        )
+        await telegram_bot.session.close()
+
+
+async def _monitor_workers(pool: WorkerPool, logging_data: LoggingData) -> None:
+    while True:
+        await asyncio.sleep(settings.WORKERS_HEARTBEAT_INTERVAL)
+        for index in pool.check():
+            stats: WorkerStats = pool.stats[index]
+            logging_data.warning_logger.warning(
+                f"[SUPERVISOR] Процесс обработки {index} упал или не отвечает, "
+                f"перезапуск({stats.restarts}), перенесено апдейтов: {stats.requeued}, "
+                f"потеряно очередей: {stats.lost_queues}"
+            )
+
+
+async def _poll_updates(
+    pool: WorkerPool,
+    bot: Bot,
+    allowed_updates: List[str],
+    stop_event: asyncio.Event,
+    logging_data: LoggingData,
+) -> None:
+    offset: Optional[int] = None
+    stop_task: asyncio.Future = asyncio.ensure_future(stop_event.wait())
+    logging_data.info_logger.info("[SUPERVISOR] Запуск polling")
+    try:
+        while not stop_event.is_set():
+            get_task: asyncio.Future = asyncio.ensure_future(
+                bot.get_updates(
+                    offset=offset,
+                    timeout=POLLING_TIMEOUT,
+                    allowed_updates=allowed_updates,
+                )
+            )
+            await asyncio.wait({get_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+            if not get_task.done():
+                get_task.cancel()
+                break
+            try:
+                updates: List[Update] = get_task.result()
+            except Exception as err:
+                logging_data.warning_logger.warning(
+                    f"[SUPERVISOR] Ошибка получения апдейтов: {err}"
+                )
+                await asyncio.sleep(POLLING_ERROR_DELAY)
+                continue
+            for update in updates:
+                pool.dispatch(update.model_dump(mode="json", by_alias=True, exclude_none=True))
+                offset = update.update_id + 1
+    finally:
+        stop_task.cancel()
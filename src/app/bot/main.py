@@ -1,21 +1,62 @@
+from typing import Optional
+import asyncio
 import sys
 
-import aiohttp
-
 from app.bot.core.startup import setup_bot
 from app.bot.settings import settings
-from app.bot.core.bot import telegram_bot
+from app.bot.core.bot import telegram_bot, send_scheduler
 from core.logging.api import get_loggers
 from core.error_handlers.format import format_errors_message
+from core.profiling.startup import profiler
+from core.contracts.constants import DEFAULT_NAME_STARTUP_PROFILE
+from app.bot.core.paths import bot_path
+from app.bot.core.webhook import run_webhook
+from app.bot.core.workers import run_supervisor
+from core.utils.session_pool import SessionPool
+from core.utils.executors import executor_manager
+from core.logging.queued import log_queue
+from core.module_loader.runtime.lazy import resolve_allowed_updates
+
 
+async def run_bot(stop_event: Optional[asyncio.Event] = None) -> None:
+    """
+    Подлючает все параметры для бота и запускает его.
 
-async def run_bot() -> None:
-    """Подлючает все параметры для бота и запускает его."""
+    Args:
+        stop_event (Optional[asyncio.Event], optional): Событие остановки webhook
+        сервера.По умолчанию None - сервер работает до отмены задачи
+    """
     # Встаем в try/except чтобы отловить все что не попало в middleware
     try:
 
         logging_data = get_loggers(name=settings.NAME_FOR_LOG_FOLDER)
-        result_startup = await setup_bot()
+        if (
+            settings.RUN_MODE == "webhook"
+            and settings.WEBHOOK_URL
+            and not settings.WEBHOOK_SECRET
+        ):
+            # Без секрета любой, кто знает адрес, может отправлять боту апдейты
+            logging_data.critical_logger.critical(
+                format_errors_message(
+                    name_router=logging_data.router_name,
+                    function_name=run_bot.__name__,
+                    error_text="[STARTUP FAILED] WEBHOOK_URL указан без WEBHOOK_SECRET",
+                )
+            )
+            sys.exit()
+
+        with profiler.measure(phase="setup_bot"):
+            result_startup = await setup_bot()
+
+        if profiler.enabled:
+            profiler.disable()
+            report_path = profiler.save_report(
+                bot_path.LOG_DIR / DEFAULT_NAME_STARTUP_PROFILE
+            )
+            logging_data.info_logger.info(
+                f"Отчет профилирования запуска записан в {report_path}\n"
+                f"{profiler.format_report()}"
+            )
         if not result_startup.ok:
             logging_data.critical_logger.critical(
                 format_errors_message(
@@ -27,14 +68,62 @@ async def run_bot() -> None:
             sys.exit()
 
         get_main_keyboards, dp = result_startup.data
+        if settings.RUN_MODE == "webhook" and not settings.WEBHOOK_URL:
+            logging_data.warning_logger.warning(
+                "[WEBHOOK] WEBHOOK_URL не указан: webhook не будет зарегистрирован в "
+                "Telegram, сервер принимает только локальные запросы"
+            )
+
+        if settings.WORKERS > 1:
+            # Апдейты обрабатывают отдельные процессы, сессии создаются в них
+            await run_supervisor(dp=dp, stop_event=stop_event, logging_data=logging_data)
+            return
 
-        # Создаем глобальную сессию для всего бота. Будет доступ в роутерах через
-        # название указанное ниже
-        async with aiohttp.ClientSession() as session:
-            dp["session"] = session
+        # Создаем глобальные сессии для всего бота. Будет доступ в роутерах через
+        # названия указанные ниже
+        async with SessionPool(
+            default=settings.SESSION_DEFAULT,
+            upstreams=settings.SESSION_UPSTREAMS,
+        ) as session_pool:
+            dp["session"] = session_pool.get()
+            dp["session_pool"] = session_pool
+            dp["send_scheduler"] = send_scheduler
             dp["get_main_keyboards"] = get_main_keyboards
             logging_data.info_logger.info("bot запущен")
-            await dp.start_polling(telegram_bot)
+            try:
+                if settings.RUN_MODE == "webhook":
+                    await run_webhook(
+                        dp=dp,
+                        bot=telegram_bot,
+                        stop_event=stop_event or asyncio.Event(),
+                        url=settings.WEBHOOK_URL,
+                        path=settings.WEBHOOK_PATH,
+                        host=settings.WEBHOOK_HOST,
+                        port=settings.WEBHOOK_PORT,
+                        logging_data=logging_data,
+                        secret_token=settings.WEBHOOK_SECRET,
+                        max_concurrency=settings.WEBHOOK_MAX_CONCURRENCY,
+                        max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+                        set_webhook=bool(settings.WEBHOOK_URL),
+                    )
+                else:
+                    await dp.start_polling(
+                        telegram_bot, allowed_updates=resolve_allowed_updates(dp)
+                    )
+            finally:
+                logging_data.info_logger.info(
+                    f"[SESSION POOL] Метрики сессий:\n{session_pool.snapshot()}"
+                )
+                logging_data.info_logger.info(
+                    f"[SEND SCHEDULER] Метрики отправки:\n{send_scheduler.snapshot()}"
+                )
+                logging_data.info_logger.info(
+                    f"[EXECUTORS] Метрики пулов:\n{executor_manager.snapshot()}"
+                )
+                executor_manager.shutdown(wait=False)
+                logging_data.info_logger.info(
+                    f"[LOG QUEUE] Метрики очереди логов:\n{log_queue.snapshot()}"
+                )
 
     except Exception:
         logging_data.info_logger.exception(
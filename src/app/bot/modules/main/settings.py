@@ -12,6 +12,7 @@ class MainRouterSettings(BaseModel):
     NAME_FOR_TEMP_FOLDER: str = "main"
     NAME_FOR_LOG_FOLDER: str = "main"
     ROOT_PACKAGE: str = "app.bot.modules.main"
+    EAGER_LOAD: bool = True
 
 
 settings: MainRouterSettings = MainRouterSettings()
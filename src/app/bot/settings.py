@@ -1,9 +1,13 @@
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 from pathlib import Path
 
 from aiogram.types import BotCommand
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from core.utils.session_pool import UpstreamSettings
+from core.error_handlers.rate_limit import RateLimitSettings
+from core.utils.executors import ExecutorSettings
+
 
 class BotSettings(BaseSettings):
     """Общие настройки бота."""
@@ -16,6 +20,63 @@ class BotSettings(BaseSettings):
         BotCommand(command="start", description="Меню бота")
     ]
 
+    # Режим получения апдейтов: polling или webhook
+    RUN_MODE: Literal["polling", "webhook"] = "polling"
+
+    # Настройки webhook. WEBHOOK_URL - публичный адрес сервера для Telegram
+    WEBHOOK_URL: Optional[str] = None
+    WEBHOOK_PATH: str = "/webhook"
+    WEBHOOK_SECRET: Optional[str] = None
+    WEBHOOK_HOST: str = "0.0.0.0"
+    WEBHOOK_PORT: int = 8080
+    WEBHOOK_MAX_CONCURRENCY: int = 100  # Апдейтов в обработке одновременно
+    WEBHOOK_MAX_CONNECTIONS: int = 40  # Соединений Telegram к серверу
+
+    # Количество процессов обработки апдейтов. 1 - все в одном процессе. Апдейты
+    # одного чата всегда обрабатываются одним процессом по порядку
+    WORKERS: int = 1
+    WORKERS_MAX_CONCURRENCY: int = 100  # Апдейтов в обработке одновременно в процессе
+    WORKERS_HEARTBEAT_INTERVAL: float = 5.0
+    # Процесс без heartbeat дольше(в том числе при запуске) перезапускается
+    WORKERS_HEARTBEAT_TIMEOUT: float = 60.0
+    WORKERS_STOP_TIMEOUT: float = 30.0  # Ожидание обработки очередей при остановке
+
+    # Ленивая загрузка роутеров модулей. Модули с EAGER_LOAD = True в settings
+    # загружаются при старте всегда. False - все роутеры загружаются при старте
+    LAZY_ROUTERS: bool = False
+
+    # Количество потоков для импорта роутеров корневых модулей. 1 - последовательно
+    ROUTERS_IMPORT_WORKERS: int = 1
+
+    # Прямая маршрутизация callback и кнопок главного меню в роутер модуля по индексу
+    DISPATCH_INDEX: bool = False
+
+    # Максимальное количество клавиатур в кэше клавиатур(app_utils/keyboards.py)
+    KEYBOARD_CACHE_SIZE: int = 256
+
+    # Сессии aiohttp. SESSION_UPSTREAMS - отдельные сессии по хосту сайта, пример .env:
+    # SESSION_UPSTREAMS={"api.example.com": {"LIMIT_PER_HOST": 20}}
+    SESSION_DEFAULT: UpstreamSettings = UpstreamSettings()
+    SESSION_UPSTREAMS: Dict[str, UpstreamSettings] = {}
+
+    # Ограничения частоты запросов по хостам, пример .env:
+    # RATE_LIMITS={"api.example.com": {"RATE": 5, "BURST": 10}}
+    RATE_LIMITS: Dict[str, RateLimitSettings] = {}
+
+    # Пулы для синхронных функций(run_safe_inf_executror с executor_name), пример .env:
+    # EXECUTORS={"cpu": {"KIND": "process", "MAX_WORKERS": 4, "MODULE_LIMIT": 2}}
+    EXECUTORS: Dict[str, ExecutorSettings] = {"cpu": ExecutorSettings(KIND="process")}
+
+    # Ограничения отправки сообщений в Telegram(сообщений в секунду)
+    TELEGRAM_GLOBAL_RATE: float = 30.0
+    TELEGRAM_CHAT_RATE: float = 1.0
+    TELEGRAM_CHAT_BURST: int = 3
+    TELEGRAM_GROUP_RATE: float = 20 / 60
+    TELEGRAM_MAX_RETRIES: int = 3
+
+    # Профилирование запуска. Отчет записывается в LOG_DIR бота
+    PROFILE_STARTUP: bool = False
+
     model_config: SettingsConfigDict = SettingsConfigDict(
         env_file=Path(__file__).resolve().parent / ".env", extra="ignore"
     )
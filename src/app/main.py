@@ -4,10 +4,12 @@ import sys
 
 from core.logging.api import get_loggers
 from app.settings import settings as app_settings
+from app.bot.settings import settings as bot_settings
 from app.bot.main import run_bot
 from app.bot.core.bot import telegram_bot
 from core.context.context import create_app_context
 from core.context.runtime import ContextRuntime
+from core.profiling.startup import profiler
 
 
 # Меняет тип event_loop для виндоус чтобы при нажатии ctl+c не было ошибки KeyboardInterrupt
@@ -18,8 +20,12 @@ if sys.platform == "win32":
 def main() -> None:
     """Синхронная точка входа для console_scripts."""
     try:
+        if bot_settings.PROFILE_STARTUP:
+            profiler.enable()
+
         try:
-            ctx = create_app_context()
+            with profiler.measure(phase="create_app_context"):
+                ctx = create_app_context()
             ContextRuntime.init(ctx)
         except Exception as err:
             print("FATAL: Ошибка при создание логов")
@@ -56,7 +62,7 @@ async def _run_unix():
         loop.add_signal_handler(sig, stop_event.set)
 
     logging_data.info_logger.info("Приложение запущен(Unix mode)")
-    await asyncio.gather(run_bot(), stop_event.wait())
+    await asyncio.gather(run_bot(stop_event=stop_event), stop_event.wait())
 
 
 async def _run_windows():
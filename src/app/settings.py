@@ -1,5 +1,9 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+from core.logging.rotation import LogRotationSettings
+
 
 class AppSettings(BaseModel):
     """Общие настроцки для всего приложения."""
@@ -7,5 +11,26 @@ class AppSettings(BaseModel):
     SERVICE_NAME: str = "root_bot"
     NAME_FOR_LOG_FOLDER: str = "root_bot"
 
+    # Один файл на уровень для бота и всех модулей вместо папки на модуль, имя
+    # роутера пишется в каждой строке
+    LOG_SINGLE_FILE: bool = False
+
+    # Запись логов в формате JSON строк(router, function, status, url, user_id,
+    # duration). Для быстрой сериализации установите orjson
+    LOG_JSON: bool = False
+
+    # Запись логов в фоновом потоке через очередь: логгер в хендлере не ждет
+    # записи в файл и консоль
+    LOG_QUEUE: bool = False
+    LOG_QUEUE_SIZE: int = 10000  # Максимум записей в очереди, 0 - без ограничений
+    # При заполненной очереди: drop - отбросить запись(ошибки не отбрасываются),
+    # block - ждать места в очереди
+    LOG_QUEUE_POLICY: Literal["drop", "block"] = "drop"
+
+    # Ротация файлов логов: none - без ротации, size - по размеру файла, time - по
+    # времени. Старые файлы сжимаются gzip в фоновом потоке, на каждый лог модуля
+    # остается BACKUP_COUNT старых файлов
+    LOG_ROTATION: LogRotationSettings = LogRotationSettings()
+
 
 settings: AppSettings = AppSettings()
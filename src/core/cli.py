@@ -1,11 +1,113 @@
 from typing import List
+import asyncio
+import importlib
 import sys
 
 from core.scripts.bot.create_module import creates_new_modules_via_the_command_line
 from core.scripts.bot.remove_module import remove_module
+from core.scripts.bot.webhook_harness import post_synthetic_updates
 from core.paths.paths import SRC_DIR
-from core.context.context import load_bot_paths
-from core.contracts.constants import DEFAULT_BOT_MODULES_ROOT
+from core.context.context import load_app_paths, load_bot_paths, create_app_context
+from core.context.runtime import ContextRuntime
+from core.profiling.startup import profiler
+from core.logging.rotation import prune_logs
+from core.logging.handlers import handler_registry
+from core.module_loader.runtime.loader import rebuild_modules_manifest
+from core.contracts.constants import (
+    DEFAULT_BOT_MODULES_ROOT,
+    DEFAULT_NAME_MODULES_MANIFEST,
+    DEFAULT_NAME_STARTUP_PROFILE,
+    DEFAUTL_NAME_APP_PATH,
+)
+
+
+def profile_startup(log_path) -> None:
+    """
+    Профилирует запуск бота без подключения к Telegram и печатает отчет.
+
+    Отчет в формате JSON записывается в log_path.
+
+    Args:
+        log_path (Path): Папка для записи отчета
+    """
+    profiler.enable()
+    with profiler.measure(phase="create_app_context"):
+        ctx = create_app_context()
+        ContextRuntime.init(ctx)
+
+    with profiler.measure(phase="import", name="app.bot.core.startup"):
+        startup = importlib.import_module("app.bot.core.startup")
+
+    result = startup.prepare_bot()
+    profiler.disable()
+
+    if not result.ok:
+        print(f"Ошибка при запуске: {result.error.message}")
+
+    report_path = profiler.save_report(log_path / DEFAULT_NAME_STARTUP_PROFILE)
+    print(profiler.format_report())
+    print(f"\nОтчет записан в {report_path}")
+
+
+def webhook_test(count: int) -> None:
+    """
+    Отправляет синтетические апдейты на локально запущенный webhook сервер.
+
+    Бот должен быть запущен с RUN_MODE=webhook и токеном тестового бота - ответы
+    хендлеров на синтетические апдейты отправляются через Bot API.
+
+    Args:
+        count (int): Количество апдейтов
+    """
+    from app.bot.settings import settings
+
+    url: str = f"http://127.0.0.1:{settings.WEBHOOK_PORT}{settings.WEBHOOK_PATH}"
+    print(
+        f"Отправка {count} апдейтов на {url}...\n"
+        "Бот должен работать с токеном тестового бота: ответы хендлеров уходят в Telegram"
+    )
+    stats = asyncio.run(
+        post_synthetic_updates(
+            url=url,
+            secret_token=settings.WEBHOOK_SECRET,
+            count=count,
+        )
+    )
+    print(
+        f"Отправлено - {stats.sent}, ошибок соединения - {stats.errors}\n"
+        f"Статусы ответов - {stats.statuses}\n"
+        f"{stats.throughput:.1f} апдейтов/c, p95 - {stats.p95 * 1000:.1f} мс"
+    )
+
+
+def logs_prune(log_dirs) -> None:
+    """
+    Сжимает старые файлы логов и удаляет лишние по настройкам ротации.
+
+    Для папок модулей используется поле LOG_ROTATION из settings модуля.
+
+    Args:
+        log_dirs (List[Path]): Папки логов
+    """
+    from app.settings import settings
+
+    # Контекст создает логгеры модулей и их настройки ротации
+    ContextRuntime.init(create_app_context())
+    rotation = settings.LOG_ROTATION
+    for log_dir in log_dirs:
+        if not log_dir.exists():
+            continue
+        data = prune_logs(
+            log_dir=log_dir,
+            backup_count=rotation.BACKUP_COUNT,
+            retention_days=rotation.RETENTION_DAYS,
+            compress=rotation.COMPRESS,
+            overrides=handler_registry.rotation_overrides(),
+        )
+        print(
+            f"{log_dir}: сжато - {data.compressed}, удалено - {data.deleted}, "
+            f"освобождено - {data.bytes_freed / 1024:.1f} КБ"
+        )
 
 
 def main() -> None:
@@ -14,6 +116,10 @@ def main() -> None:
 
     cli add-module <имя модуля>- Создание модулей
     cli remove-module <имя модуля> - Удаление модуля
+    cli rebuild-manifest - Пересоздание manifest модулей
+    cli profile-startup - Профилирование запуска бота
+    cli webhook-test [количество] - Нагрузка на локальный webhook сервер
+    cli logs-prune - Сжатие и удаление старых логов
     """
 
     list_sys_argv: List[str] = sys.argv
@@ -22,7 +128,11 @@ def main() -> None:
         print(
             "-----\nИспользование:\n\ncli add-module "
             "<name module> - Создание модуля\n"
-            "cli remove-module <name module> - Удаление модуля\n-----"
+            "cli remove-module <name module> - Удаление модуля\n"
+            "cli rebuild-manifest - Пересоздание manifest модулей\n"
+            "cli profile-startup - Профилирование запуска бота\n"
+            "cli webhook-test [count] - Нагрузка на локальный webhook сервер\n"
+            "cli logs-prune - Сжатие и удаление старых логов\n-----"
         )
         sys.exit()
 
@@ -74,6 +184,24 @@ def main() -> None:
                 root_dir=SRC_DIR,
             )
             print(f"Процедура удаления {name_module} завершена")
+    elif command == "rebuild-manifest":
+        print("Идет пересоздание manifest модулей...")
+        manifest_path = bot_path.CACHE_DIR / DEFAULT_NAME_MODULES_MANIFEST
+        result = rebuild_modules_manifest(
+            manifest_path=manifest_path,
+            root_package=DEFAULT_BOT_MODULES_ROOT,
+        )
+        if not result.ok:
+            print(result.error.message)
+        else:
+            print(f"Manifest {manifest_path} пересоздан. Модулей - {result.data}")
+    elif command == "profile-startup":
+        profile_startup(log_path=bot_path.LOG_DIR)
+    elif command == "webhook-test":
+        webhook_test(count=int(list_sys_argv[2]) if len(list_sys_argv) >= 3 else 100)
+    elif command == "logs-prune":
+        app_path = load_app_paths("app.core.paths", name_variable=DEFAUTL_NAME_APP_PATH)
+        logs_prune(log_dirs=[app_path.LOG_DIR, bot_path.LOG_DIR])
     elif command == "help":
         print(
             """-----
@@ -81,6 +209,10 @@ def main() -> None:
               
 cli add-module <name_module> - Создание модуля
 cli remove-module <name_module> - Удаление модуля
+cli rebuild-manifest - Пересоздание manifest модулей
+cli profile-startup - Профилирование запуска бота
+cli webhook-test [count] - Нагрузка на локальный webhook сервер
+cli logs-prune - Сжатие и удаление старых логов
 ----
 """
         )
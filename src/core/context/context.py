@@ -2,7 +2,6 @@ from pathlib import Path
 import importlib
 from typing import Protocol, List, Optional
 from dataclasses import dataclass
-import pkgutil
 from types import ModuleType
 
 
@@ -14,16 +13,22 @@ from core.logging.factory import LoggerFactory
 from core.logging.storage import storage
 from core.logging.runtime import LoggerRuntime
 from core.logging.format import log_format
+from core.logging.queued import log_queue
+from core.logging.handlers import handler_registry
+from core.logging.rotation import LogRotationSettings
 from core.module_loader.runtime.validate import validate_module
+from core.module_loader.runtime.loader import discover_modules
+from core.module_loader.runtime.registry import ModuleRegistry
 from core.contracts.module import (
     REQUIRED_FIELD_APP_MODULES_SETTINGS,
     REQUIRED_FIELD_BOT_MODULES_SETTINGS,
-    REQUIRED_FIELDS_MODULES,
+    OPTIONAL_FIELD_LOG_ROTATION,
 )
 from core.contracts.constants import (
     DEFAULT_NAME_SETTINGS,
     DEFAUTL_NAME_APP_PATH,
     DEFAUTL_NAME_BOT_PATH,
+    DEFAULT_NAME_MODULES_MANIFEST,
 )
 
 
@@ -32,6 +37,7 @@ class BotPathProtocol(Protocol):
     TEMP_DIR: Path
     LOG_DIR: Path
     STATIC_DIR: Path
+    CACHE_DIR: Path
 
 
 class AppPathProtocol(Protocol):
@@ -44,6 +50,12 @@ class AppPathProtocol(Protocol):
 class AppSettingsProtocol(Protocol):
     SERVICE_NAME: str
     NAME_FOR_LOG_FOLDER: str
+    LOG_SINGLE_FILE: bool
+    LOG_JSON: bool
+    LOG_QUEUE: bool
+    LOG_QUEUE_SIZE: int
+    LOG_QUEUE_POLICY: str
+    LOG_ROTATION: LogRotationSettings
 
 
 class BotSettingsProtocol(Protocol):
@@ -71,6 +83,7 @@ class AppContext:
     bot_settings: BotSettingsProtocol
     loggers: LoggerRuntime
     root_modules_settings: List[ModuleSettings]
+    modules: ModuleRegistry
 
 
 def load_bot_paths(
@@ -99,6 +112,7 @@ def load_bot_paths(
             - TEMP_DIR (Path)
             - LOG_DIR  (Path)
             - STATIC_DIR (Path)
+            - CACHE_DIR (Path)
     """
     module: ModuleType = importlib.import_module(bot_core)
     if not hasattr(module, name_variable):
@@ -212,31 +226,15 @@ def load_bot_root_modules_data(
             - ROOT_PACKAGE: (str)
 
     """
-    package: ModuleType = importlib.import_module(root_package)  # получаем модуль
-    array_settings: List = []  # список для настроек
-    for module_info in pkgutil.walk_packages(
-        path=package.__path__,
-        prefix=package.__name__ + ".",
-    ):  # проходимся по пакетам модуля
-        name: str = module_info.name
-
-        if not name.endswith(f"{file_name}"):  # если не нужный файл
-            continue
-
-        if separator in name:  # если дочерний то пропускаем итерацию
-            continue
-
-        settings = validate_module(
-            root_package=name,
-            required_field_modules=REQUIRED_FIELDS_MODULES,
-            name=file_name,
-            root=True,
-        )
-        if not settings.ok:
-            raise RuntimeError(settings.error.message)
+    result_discover = discover_modules(
+        root_package=root_package,
+        name_settings=file_name,
+        separator=separator,
+    )
+    if not result_discover.ok:
+        raise RuntimeError(result_discover.error.message)
 
-        array_settings.append(settings.data)
-    return array_settings
+    return [module.config for module in result_discover.data.roots]
 
 
 def init_logging(
@@ -262,17 +260,41 @@ def init_logging(
     Returns:
         LoggerRuntime: Склад логов
     """
+    # Запись логов в фоновом потоке
+    queue = None
+    if app_settings.LOG_QUEUE:
+        log_queue.configure(
+            maxsize=app_settings.LOG_QUEUE_SIZE,
+            policy=app_settings.LOG_QUEUE_POLICY,
+        )
+        queue = log_queue
+
+    # Ротация и сжатие файлов логов
+    handler_registry.configure_rotation(settings=app_settings.LOG_ROTATION)
+
+    format_log: str = (
+        log_format.LOG_FORMAT_WITH_ROUTER
+        if app_settings.LOG_SINGLE_FILE
+        else log_format.LOG_FORMAT
+    )
+
     # Создание фабрики логгеров для приложения и бота
     app_factory: LoggerFactory = LoggerFactory(
         base_path=app_path.LOG_DIR,
         datefmt=log_format.DATE_FORMAT,
-        format_log=log_format.LOG_FORMAT,
+        format_log=format_log,
+        log_queue=queue,
+        single_file=app_settings.LOG_SINGLE_FILE,
+        json_format=app_settings.LOG_JSON,
     )
 
     bot_factory: LoggerFactory = LoggerFactory(
         base_path=bot_path.LOG_DIR,
         datefmt=log_format.DATE_FORMAT,
-        format_log=log_format.LOG_FORMAT,
+        format_log=format_log,
+        log_queue=queue,
+        single_file=app_settings.LOG_SINGLE_FILE,
+        json_format=app_settings.LOG_JSON,
     )
 
     # Добавление в хранилище фабрики логгеров логгеры бота, приложения,
@@ -287,11 +309,18 @@ def init_logging(
         data=bot_factory.create(name=bot_settings.NAME_FOR_LOG_FOLDER),
     )
     for settings in root_modules_settings:
+        # Ротация логов модуля из необязательного поля LOG_ROTATION settings модуля
+        rotation_override = getattr(settings, OPTIONAL_FIELD_LOG_ROTATION, None)
         storage.add(
             name=settings.NAME_FOR_LOG_FOLDER,
             data=bot_factory.create(
                 name=settings.NAME_FOR_LOG_FOLDER,
                 subdir=settings.NAME_FOR_LOG_FOLDER,
+                rotation=(
+                    app_settings.LOG_ROTATION.merge(rotation_override)
+                    if rotation_override
+                    else None
+                ),
             ),
         )
 
@@ -301,8 +330,18 @@ def init_logging(
 
 def create_app_context(
     bot_modules_root: str = DEFAULT_BOT_MODULES_ROOT,
+    use_manifest: bool = True,
 ) -> AppContext:
-    """Создает контекст приложения."""
+    """
+    Создает контекст приложения.
+
+    Модули бота обнаруживаются один раз, реестр модулей сохраняется в AppContext.modules
+
+    Args:
+        bot_modules_root (str): Путь для импорта пакета с модулями бота
+        use_manifest (bool): Использовать manifest модулей из bot_path.CACHE_DIR.
+        По умолчанию True
+    """
 
     app_settings = load_data_modules(
         core="app",
@@ -320,10 +359,22 @@ def create_app_context(
         "app.bot.core.paths",
         name_variable=DEFAUTL_NAME_BOT_PATH,
     )
-    modules_settings = load_bot_root_modules_data(
+    result_discover = discover_modules(
         root_package=bot_modules_root,
-        file_name=DEFAULT_NAME_SETTINGS,
+        name_settings=DEFAULT_NAME_SETTINGS,
+        manifest_path=(
+            bot_path.CACHE_DIR / DEFAULT_NAME_MODULES_MANIFEST
+            if use_manifest
+            else None
+        ),
     )
+    if not result_discover.ok:
+        raise RuntimeError(result_discover.error.message)
+
+    modules: ModuleRegistry = result_discover.data
+    modules_settings: List[ModuleSettings] = [
+        module.config for module in modules.roots
+    ]
 
     loggers = init_logging(
         app_path=app_path,
@@ -339,4 +390,5 @@ def create_app_context(
         bot_settings=bot_settings,
         loggers=loggers,
         root_modules_settings=modules_settings,
+        modules=modules,
     )
@@ -5,6 +5,14 @@ DEFAULT_NAME_SETTINGS: str = "settings"
 DEFAULT_NAME_ROUTER: str = "router"
 DEFAUTL_NAME_APP_PATH: str = "app_path"
 DEFAUTL_NAME_BOT_PATH: str = "bot_path"
+DEFAULT_NAME_MODULES_MANIFEST: str = "modules_manifest.json"
+DEFAULT_NAME_STARTUP_PROFILE: str = "startup_profile.json"
+TELEGRAM_UPLOAD_LIMIT: int = 50 * 1024 * 1024  # Максимальный размер файла для отправки ботом
+DEFAULT_USER_AGENT: str = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0 Safari/537.36"
+)
 
 
 REQUIERED_MODULE_DIRS = [
@@ -25,6 +25,21 @@ class ModuleSettingsContract(Protocol):
 DEFAULT_FIELD_FOR_INLINE_MENU_DATA: str = "MENU_CALLBACK_DATA"
 DEFAULT_FIELD_FOR_INLINE_MENU_TEXT: str = "MENU_CALLBACK_TEXT"
 
+# Необязательные поля settings модуля для ленивой загрузки роутера
+OPTIONAL_FIELD_EAGER_LOAD: str = "EAGER_LOAD"
+OPTIONAL_FIELD_COMMANDS: str = "COMMANDS"
+OPTIONAL_FIELD_CALLBACK_PREFIXES: str = "CALLBACK_PREFIXES"
+
+# Необязательное поле settings модуля: ограничения частоты запросов модуля по хостам
+OPTIONAL_FIELD_RATE_LIMITS: str = "RATE_LIMITS"
+
+# Необязательное поле settings модуля: задач модуля одновременно по именам пулов
+OPTIONAL_FIELD_EXECUTOR_LIMITS: str = "EXECUTOR_LIMITS"
+
+# Необязательное поле settings корневого модуля: настройки ротации логов модуля
+# (словарь с частью полей LogRotationSettings, например {"BACKUP_COUNT": 30})
+OPTIONAL_FIELD_LOG_ROTATION: str = "LOG_ROTATION"
+
 REQUIRED_FIELDS_MODULES = {
     "SERVICE_NAME",
     "ROOT_PACKAGE",
@@ -41,7 +41,9 @@ for file in handlers_path.glob("*.py"):
             "\\n[Auto] Sub router inculde into {}: {}".format(router, handler_router)
         )  
     """,
-    f"{DEFAULT_NAME_SETTINGS}.py": """from pydantic import BaseModel
+    f"{DEFAULT_NAME_SETTINGS}.py": """from typing import List
+
+from pydantic import BaseModel
 
 
 class ModuleSettings(BaseModel):
@@ -53,6 +55,11 @@ class ModuleSettings(BaseModel):
     {NAME_FOR_LOG_FOLDER}: str = "{log_name}"
     {NAME_FOR_TEMP_FOLDER}: str = "{temp_path}"
     {ROOT_PACKAGE}: str = "{root_package}"
+
+    # Ленивая загрузка роутера
+    EAGER_LOAD: bool = False
+    COMMANDS: List[str] = []
+    CALLBACK_PREFIXES: List[str] = []
     
 settings: ModuleSettings = ModuleSettings()
     """,
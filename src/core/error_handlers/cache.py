@@ -0,0 +1,419 @@
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, fields
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from pathlib import Path
+import asyncio
+import hashlib
+import base64
+import json
+import os
+import time
+
+from multidict import CIMultiDict
+
+from core.response.response_data import NetworkResponseResult, LoggingData
+from core.error_handlers.helpers import network_ok
+
+
+DISK_PRUNE_INTERVAL: int = 32  # Очистка папки кэша после каждых N записей на диск
+
+# Заголовки запроса с данными пользователя: такие ответы в общий кэш не попадают
+PRIVATE_REQUEST_HEADERS: Tuple[str, ...] = ("Authorization", "Cookie")
+
+
+@dataclass
+class ResponseCacheStats:
+    """Метрики кэша ответов."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+    disk_errors: int = 0
+    disk_evictions: int = 0
+    disk_corrupted: int = 0
+
+
+@dataclass
+class CacheEntry:
+    """Сохраненный ответ сайта."""
+
+    url: str
+    method: str
+    status: int
+    data_type: str
+    data: Any
+    headers: List[Tuple[str, str]]
+    expires: float
+    size: int
+
+    @property
+    def is_fresh(self) -> bool:
+        """Ответ можно вернуть без запроса к сайту."""
+        return time.time() < self.expires
+
+    def get_header(self, name: str) -> Optional[str]:
+        """Возвращает заголовок ответа без учета регистра."""
+        name = name.lower()
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    def validation_headers(self) -> Dict[str, str]:
+        """Заголовки условного запроса для проверки актуальности ответа."""
+        headers: Dict[str, str] = {}
+        etag: Optional[str] = self.get_header("ETag")
+        last_modified: Optional[str] = self.get_header("Last-Modified")
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def to_result(self) -> NetworkResponseResult:
+        """Возвращает NetworkResponseResult из сохраненного ответа."""
+        return network_ok(
+            data=self.data,
+            url=self.url,
+            status=self.status,
+            method=self.method,
+            headers=self.headers,
+        )
+
+
+def _cache_directives(headers: CIMultiDict) -> Dict[str, str]:
+    """Возвращает директивы Cache-Control ответа."""
+    cache_control: str = headers.get("Cache-Control", "").lower()
+    directives: Dict[str, str] = {}
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name] = value.strip('"')
+    return directives
+
+
+def is_shared_cacheable(response_headers, request_headers=None) -> bool:
+    """
+    Можно ли сохранить ответ в общий для всего процесса кэш.
+
+    Нельзя сохранять ответы с Cache-Control: private и Vary: *, а также ответы
+    на запросы с Authorization или Cookie - они относятся к одному пользователю.
+    """
+    request: CIMultiDict = CIMultiDict(request_headers or {})
+    if any(name in request for name in PRIVATE_REQUEST_HEADERS):
+        return False
+    response: CIMultiDict = CIMultiDict(response_headers or {})
+    if "private" in _cache_directives(response):
+        return False
+    vary: List[str] = [
+        name.strip() for value in response.getall("Vary", []) for name in value.split(",")
+    ]
+    return "*" not in vary
+
+
+def get_cache_lifetime(headers, default_ttl: float) -> Optional[float]:
+    """
+    Возвращает время жизни ответа в секундах по заголовкам Cache-Control и Expires.
+
+    Returns:
+        Optional[float]: None - ответ нельзя сохранять(no-store), 0 - ответ нужно
+        проверять перед каждым использованием(no-cache)
+    """
+    headers = CIMultiDict(headers or {})
+    directives: Dict[str, str] = _cache_directives(headers)
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if directives.get(name, "").isdigit():
+            return float(directives[name])
+
+    expires: Optional[str] = headers.get("Expires")
+    if expires:
+        try:
+            date: datetime = parsedate_to_datetime(expires)
+            if date.tzinfo is None:
+                date = date.replace(tzinfo=timezone.utc)
+            return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return 0.0
+    return default_ttl
+
+
+class ResponseCache:
+    """
+    Кэш ответов сайтов для error_handler_for_the_website.
+
+    LRU кэш в памяти с временем жизни ответа по Cache-Control/Expires
+    (ttl - если заголовков нет). Устаревшие ответы с ETag или Last-Modified
+    не удаляются, а проверяются условным запросом: при 304 возвращается
+    сохраненный ответ. Заголовки запроса входят в ключ, поэтому ответы на
+    запросы с разными заголовками(в том числе из Vary ответа) не смешиваются.
+    Ответы для одного пользователя(private, Authorization, Cookie) и с Vary: *
+    не сохраняются. При переданном disk_dir ответы дополнительно
+    сохраняются на диск и переживают перезапуск бота. На диске остается не
+    больше maxsize ответов, устаревшие файлы удаляются. Ошибка записи на диск
+    не прерывает запрос - ответ остается в памяти.
+
+    Возвращаемые из кэша data общие для всех вызовов - их нельзя изменять.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttl: float = 60.0,
+        disk_dir: Optional[Path] = None,
+        methods: Tuple[str, ...] = ("GET",),
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.disk_dir: Optional[Path] = disk_dir
+        self.methods: Tuple[str, ...] = methods
+        self.stats: ResponseCacheStats = ResponseCacheStats()
+        self._data: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._disk_writes: int = 0
+
+    def is_cacheable(self, method: str, data_type: str) -> bool:
+        """Можно ли кэшировать запрос."""
+        return method.upper() in self.methods and data_type.upper() in (
+            "JSON",
+            "TEXT",
+            "BYTES",
+        )
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        data_type: str,
+        data: Any = None,
+        json_data: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """
+        Возвращает ключ запроса по методу, URL, типу данных, телу и заголовкам запроса.
+        """
+        request_headers: List[Tuple[str, str]] = sorted(
+            (str(name).lower(), str(value))
+            for name, value in CIMultiDict(headers or {}).items()
+        )
+        body: str = json.dumps(
+            [
+                data if isinstance(data, (str, dict, list)) else repr(data),
+                json_data,
+                request_headers,
+            ],
+            sort_keys=True,
+            default=repr,
+        )
+        raw: str = f"{method.upper()} {url} {data_type.upper()} {body}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Возвращает сохраненный ответ из памяти или с диска."""
+        entry: Optional[CacheEntry] = self._data.get(key)
+        if entry is not None:
+            self._data.move_to_end(key)
+            return entry
+
+        if self.disk_dir is None:
+            return None
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(None, self._read_disk, key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    async def store(
+        self,
+        key: str,
+        result: NetworkResponseResult,
+        data_type: str,
+        logging_data: Optional[LoggingData] = None,
+        request_headers: Optional[Mapping[str, str]] = None,
+    ) -> Optional[CacheEntry]:
+        """
+        Сохраняет успешный ответ, если это разрешают заголовки запроса и ответа.
+
+        logging_data - для предупреждения об ошибке записи на диск.
+
+        Returns:
+            Optional[CacheEntry]: Сохраненный ответ или None
+        """
+        if not is_shared_cacheable(result.headers, request_headers):
+            return None
+        lifetime: Optional[float] = get_cache_lifetime(result.headers, self.ttl)
+        if lifetime is None:
+            return None
+        headers: List[Tuple[str, str]] = list((result.headers or {}).items())
+        entry: CacheEntry = CacheEntry(
+            url=result.url,
+            method=result.method,
+            status=result.status,
+            data_type=data_type.upper(),
+            data=result.data,
+            headers=headers,
+            expires=time.time() + lifetime,
+            size=_get_size(result.data, result.headers),
+        )
+        if lifetime == 0 and not entry.validation_headers():
+            return None
+        await self._save(key, entry, logging_data)
+        self.stats.stores += 1
+        return entry
+
+    async def revalidate(
+        self,
+        key: str,
+        entry: CacheEntry,
+        headers,
+        logging_data: Optional[LoggingData] = None,
+    ) -> CacheEntry:
+        """Продлевает сохраненный ответ после ответа сайта 304 Not Modified."""
+        updated: CIMultiDict = CIMultiDict(entry.headers)
+        for name in ("Cache-Control", "Expires", "ETag", "Last-Modified"):
+            value: Optional[str] = CIMultiDict(headers or {}).get(name)
+            if value is not None:
+                updated[name] = value
+        entry.headers = list(updated.items())
+        lifetime: Optional[float] = get_cache_lifetime(entry.headers, self.ttl)
+        entry.expires = time.time() + (lifetime or 0.0)
+        await self._save(key, entry, logging_data)
+        self.stats.revalidated += 1
+        self.stats.bytes_saved += entry.size
+        return entry
+
+    def clear(self) -> None:
+        """Очищает кэш в памяти и метрики."""
+        self._data.clear()
+        self.stats = ResponseCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def _save(
+        self,
+        key: str,
+        entry: CacheEntry,
+        logging_data: Optional[LoggingData] = None,
+    ) -> None:
+        self._remember(key, entry)
+        if self.disk_dir is None:
+            return
+        self._disk_writes += 1
+        prune: bool = self._disk_writes % DISK_PRUNE_INTERVAL == 1
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._write_disk, key, entry, prune)
+        except OSError as err:
+            # Диск - необязательная часть кэша, ответ остается в памяти
+            self.stats.disk_errors += 1
+            if logging_data:
+                logging_data.warning_logger.warning(
+                    f"[CACHE] Ответ {entry.url} не сохранен на диск: {err}"
+                )
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        # Любой поврежденный файл - промах кэша, файл удаляется
+        path: Path = self.disk_dir / f"{key}.json"
+        try:
+            text: str = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            return _entry_from_raw(json.loads(text))
+        except (ValueError, TypeError, KeyError, AttributeError):
+            self.stats.disk_corrupted += 1
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+    def _write_disk(self, key: str, entry: CacheEntry, prune: bool = False) -> None:
+        raw: Dict = asdict(entry)
+        if entry.data_type == "BYTES":
+            raw["data"] = base64.b64encode(entry.data).decode("ascii")
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        path: Path = self.disk_dir / f"{key}.json"
+        tmp_path: Path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(raw, ensure_ascii=False), encoding="utf-8")
+        # Время изменения файла - время устаревания ответа, очистка не читает файлы
+        os.utime(tmp_path, (time.time(), entry.expires))
+        tmp_path.replace(path)
+        if prune:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        # Файлы сортируются по времени устаревания: удаляются устаревшие(в памяти
+        # они остаются для условных запросов) и самые старые сверх maxsize
+        now: float = time.time()
+        files: List[Tuple[float, str]] = []
+        with os.scandir(self.disk_dir) as entries:
+            for item in entries:
+                if item.name.endswith(".json") and item.is_file():
+                    files.append((item.stat().st_mtime, item.path))
+        files.sort(reverse=True)
+        for index, (expires, path) in enumerate(files):
+            if index >= self.maxsize or expires < now:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+                self.stats.disk_evictions += 1
+
+
+def _entry_from_raw(raw: Any) -> CacheEntry:
+    """Проверяет запись с диска и возвращает CacheEntry, иначе TypeError/ValueError."""
+    names: List[str] = [field.name for field in fields(CacheEntry)]
+    if not isinstance(raw, dict) or sorted(raw) != sorted(names):
+        raise TypeError("неверная структура записи кэша")
+    for name, kind in (
+        ("url", str),
+        ("method", str),
+        ("data_type", str),
+        ("status", int),
+        ("expires", (int, float)),
+        ("size", int),
+        ("headers", list),
+    ):
+        if not isinstance(raw[name], kind):
+            raise TypeError(f"неверный тип поля {name}")
+    headers: List[Tuple[str, str]] = []
+    for header in raw["headers"]:
+        name, value = header
+        if not isinstance(name, str) or not isinstance(value, str):
+            raise TypeError("неверный заголовок")
+        headers.append((name, value))
+    raw["headers"] = headers
+    if raw["data_type"] == "BYTES":
+        raw["data"] = base64.b64decode(raw["data"], validate=True)
+    return CacheEntry(**raw)
+
+
+def _get_size(data: Any, headers) -> int:
+    content_length: Optional[str] = CIMultiDict(headers or {}).get("Content-Length")
+    if content_length and content_length.isdigit():
+        return int(content_length)
+    if isinstance(data, bytes):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    return len(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+response_cache: ResponseCache = ResponseCache()
@@ -1,4 +1,99 @@
-from typing import Optional
+from typing import Any, Dict, Optional
+import traceback
+
+from core.logging.structured import LazyMessage
+
+
+class ErrorMessage(LazyMessage):
+    """Сообщение об ошибке, текст формируется только при записи в лог."""
+
+    __slots__ = ("name_router", "method", "status", "url", "error_text", "function_name")
+
+    def __init__(
+        self,
+        name_router: Optional[str] = None,
+        method: Optional[str] = None,
+        status: Optional[int] = None,
+        url: Optional[str] = None,
+        error_text: Any = None,
+        function_name: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self.name_router: Optional[str] = name_router
+        self.method: Optional[str] = method
+        self.status: Optional[int] = status
+        self.url: Optional[str] = url
+        self.error_text: Any = error_text
+        self.function_name: Optional[str] = function_name
+
+    def fields(self) -> Dict[str, Any]:
+        return {
+            "router": self.name_router,
+            "function": self.function_name,
+            "method": self.method,
+            "status": self.status,
+            "url": self.url,
+            "message": str(self.error_text) if self.error_text else None,
+        }
+
+    def render(self) -> str:
+        return (
+            f"[{self.status or 0}] {self.method or '<no method>'} "
+            f"{self.url or '<unknown>'}\n"
+            f"Router: {self.name_router or '<unknown>'}\n"
+            f"Function: {self.function_name or '<unknown>'}\n"
+            f"Response:\n{self.error_text or '<no text>'}\n"
+        )
+
+
+class EventErrorMessage(LazyMessage):
+    """Сообщение об ошибке в обработчике события, трассировка формируется при записи."""
+
+    __slots__ = ("name_router", "event", "error", "duration")
+
+    def __init__(
+        self,
+        name_router: str,
+        event: Any,
+        error: BaseException,
+        duration: float,
+    ) -> None:
+        super().__init__()
+        self.name_router: str = name_router
+        self.event: Any = event
+        self.error: BaseException = error
+        self.duration: float = duration
+
+    def _traceback(self) -> str:
+        return "".join(
+            traceback.format_exception(
+                type(self.error), self.error, self.error.__traceback__
+            )
+        )
+
+    def fields(self) -> Dict[str, Any]:
+        user = getattr(self.event, "from_user", None)
+        return {
+            "event": type(self.event).__name__,
+            "user_id": getattr(user, "id", None),
+            "duration": round(self.duration, 6),
+            "message": str(self.error),
+            "exc": self._traceback(),
+        }
+
+    def render(self) -> str:
+        user = getattr(self.event, "from_user", None)
+        return (
+            f"🚨 Ошибка в Router: {self.name_router}\n"
+            f"Тип события: {type(self.event).__name__}\n"
+            f"Пользователь: {getattr(user, 'username', 'Неизвестно')} "
+            f"(id={getattr(user, 'id', '—')})\n"
+            f"Текст: {getattr(self.event, 'text', '—')}\n"
+            f"Ошибка: {self.error}\n"
+            f"Время обработки: {self.duration * 1000:.1f} мс\n"
+            f"Трассировка:\n{self._traceback()}"
+            f"\n{'-' * 80}\n"
+        )
 
 
 def format_errors_message(
@@ -8,9 +103,12 @@ def format_errors_message(
     url: Optional[str] = None,
     error_text: Optional[str] = None,
     function_name: Optional[str] = None,
-) -> str:
+) -> ErrorMessage:
     """
-    Возвращает строку для записи в лог ошибок.
+    Возвращает сообщение для записи в лог ошибок.
+
+    Текст сообщения формируется только при записи в лог, при выключенном уровне
+    логгера форматирование не выполняется.
 
     Args:
         name_router (str): Имя роутера
@@ -21,18 +119,13 @@ def format_errors_message(
         function_name: (str): Имя функции в которой произошла ошибка
 
     Returns:
-        str: Возвращает строку для записи в лог ошибок
+        ErrorMessage: Сообщение для записи в лог ошибок, str() - текст сообщения
     """
-    name_router: str = name_router or "<unknown>"
-    method: str = method or "<no method>"
-    status: int = status or 0
-    url: str = url or "<unknown>"
-    error_text: str = error_text or "<no text>"
-    function_name: str = function_name if function_name else "<unknown>"
-
-    return (
-        f"[{status}] {method} {url}\n"
-        f"Router: {name_router}\n"
-        f"Function: {function_name}\n"
-        f"Response:\n{error_text}\n"
+    return ErrorMessage(
+        name_router=name_router,
+        method=method,
+        status=status,
+        url=url,
+        error_text=error_text,
+        function_name=function_name,
     )
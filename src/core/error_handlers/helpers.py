@@ -1,4 +1,4 @@
-from typing import Callable, Optional, Union, Any, Dict
+from typing import Callable, Optional, Union, Any
 from asyncio import AbstractEventLoop, exceptions
 import functools
 import traceback
@@ -8,10 +8,13 @@ from core.response.response_data import (
     LoggingData,
     Result,
     Error,
+    Headers,
     NetworkResponseResult,
 )
 from core.error_handlers.format import format_errors_message
 from core.response.messages import messages
+from core.profiling.startup import profiler
+from core.utils.executors import executor_manager
 
 
 def ok(data: None) -> Result:
@@ -44,7 +47,7 @@ def network_ok(
     url: str,
     status: int,
     method: str,
-    headers: Dict = None,
+    headers: Optional[Headers] = None,
 ) -> NetworkResponseResult:
     """Возвращает класс NetworkResponseResult для успешного запроса."""
     return NetworkResponseResult(
@@ -64,7 +67,7 @@ def network_fail(
     status: int,
     method: str,
     details: Any = None,
-    headers: Dict = None,
+    headers: Optional[Headers] = None,
 ) -> NetworkResponseResult:
     """Возвращает класс NetworkResponseResult для неуспешного запроса."""
     return NetworkResponseResult(
@@ -86,12 +89,14 @@ async def run_safe_inf_executror(
     func: Callable,
     *args,
     logging_data: LoggingData = None,
+    executor_name: Optional[str] = None,
     **kwargs,
 ) -> Union[Any, Result]:
     """
     Отлавливает все возможные ошибки для переданной синхронной функции.
 
-    При ошибке в ходе выполнения функции выкидывает обьект класса ResponseData
+    При ошибке в ходе выполнения функции выкидывает обьект класса ResponseData.
+    Отмена задачи пробрасывается дальше.
 
     Args:
         loop (AbstractEventLoop): цикл событий
@@ -105,10 +110,24 @@ async def run_safe_inf_executror(
             - critical_logger (Logger)
             - router_name (str)
 
+        executor_name (Optional[str], optional): Имя пула из executor_manager.
+        По умолчанию None - пул потоков цикла событий
+
+        Пример:
+        cpu - для тяжелых вычислений в отдельных процессах
+
     Returns:
         Union[Any, Result]: Возвращает результат функции func
     """
     try:
+        if executor_name is not None:
+            return await executor_manager.run(
+                executor_name,
+                func,
+                *args,
+                module=logging_data.router_name if logging_data else None,
+                **kwargs,
+            )
         return await loop.run_in_executor(
             None,
             functools.partial(
@@ -119,6 +138,7 @@ async def run_safe_inf_executror(
         )
     except exceptions.CancelledError:
         print("Остановка работы процесса пользователем")
+        raise
 
     except Exception as err:
         if logging_data:
@@ -138,6 +158,7 @@ async def run_safe_inf_executror(
         return fail(code="Unknown error", message=messages.SERVER_ERROR)
 
 
+@profiler.profile(phase="safe_import", arg="module_package")
 def safe_import(
     module_package: str,
     logging_data: LoggingData = None,
@@ -176,21 +197,46 @@ def safe_import(
     try:
         return ok(data=importlib.import_module(module_package))
     except Exception as err:
-        if logging_data:
-            logging_data.error_logger.error(
-                format_errors_message(
-                    name_router=logging_data.router_name,
-                    error_text=f"[IMPORT ERROR] Модуль {module_package} не загрузился\n"
-                    f"{err}\n{traceback.format_exc()}",
-                    function_name=safe_import.__name__,
-                )
-            )
-        else:
-            print(
-                f"[IMPORT ERROR] Модуль {module_package} не загрузился\n{traceback.format_exc()}"
-            )
+        return import_fail(
+            module_package=module_package,
+            err=err,
+            logging_data=logging_data,
+        )
+
 
-        return fail(
-            code="IMPORT ERROR",
-            message=f"Модуль {module_package} не загрузился\n{err}",
+def import_fail(
+    module_package: str,
+    err: Exception,
+    logging_data: LoggingData = None,
+) -> Result:
+    """
+    Логирует ошибку импорта модуля и возвращает Result с кодом IMPORT ERROR.
+
+    Вызывается внутри блока except, чтобы в лог попала трассировка ошибки.
+
+    Args:
+        module_package (str): Путь для импорта
+        err (Exception): Ошибка импорта
+        logging_data (LoggingData, optional): Обьект класса LoggingData.По умолчанию None
+
+    Returns:
+        Result: Ошибка импорта
+    """
+    if logging_data:
+        logging_data.error_logger.error(
+            format_errors_message(
+                name_router=logging_data.router_name,
+                error_text=f"[IMPORT ERROR] Модуль {module_package} не загрузился\n"
+                f"{err}\n{traceback.format_exc()}",
+                function_name=safe_import.__name__,
+            )
+        )
+    else:
+        print(
+            f"[IMPORT ERROR] Модуль {module_package} не загрузился\n{traceback.format_exc()}"
         )
+
+    return fail(
+        code="IMPORT ERROR",
+        message=f"Модуль {module_package} не загрузился\n{err}",
+    )
@@ -1,14 +1,40 @@
-from typing import Dict
+from typing import Callable, Dict, Mapping, Optional, BinaryIO, Union
+from urllib.parse import urlparse
+from pathlib import Path
 import asyncio
+import os
+import time
 
 import aiohttp
+from multidict import CIMultiDict
+from yarl import URL
 
 from core.error_handlers.format import format_errors_message
-from core.response.response_data import NetworkResponseResult, LoggingData
-from core.error_handlers.helpers import network_fail, network_ok
+from core.response.response_data import (
+    NetworkResponseResult,
+    LoggingData,
+    DownloadData,
+    Result,
+)
+from core.error_handlers.helpers import network_fail, network_ok, ok, fail
+from core.error_handlers.cache import CacheEntry, ResponseCache
+from core.error_handlers.singleflight import SingleFlight
+from core.error_handlers.rate_limit import RateLimiter, TokenBucket, rate_limiter
+from core.error_handlers.retry import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    LOCAL_EXCEPTIONS,
+    NETWORK_EXCEPTIONS,
+    RetryPolicy,
+    parse_retry_after,
+)
 from core.response.messages import messages
 
 
+# Путь для сохранения файла или функция, выбирающая путь по заголовкам ответа
+FilePath = Union[Path, Callable[[Mapping[str, str]], Path]]
+
+
 async def safe_read_response(resp):
     """Проверяет в каком формате был передан ответ с сайта и возвращает текст ответа.
 
@@ -28,6 +54,131 @@ async def safe_read_response(resp):
         return "<no body>"
 
 
+async def read_response_limited(
+    resp: aiohttp.ClientResponse,
+    max_size: Optional[int] = None,
+    chunk_size: int = 64 * 1024,
+) -> Result:
+    """
+    Читает тело ответа в память с ограничением размера.
+
+    Ответ с Content-Length больше max_size не читается, без Content-Length чтение
+    прерывается, как только прочитано больше max_size байт.
+
+    Args:
+        resp (aiohttp.ClientResponse): Ответ сайта
+        max_size (Optional[int], optional): Максимальный размер ответа в байтах.
+        По умолчанию None - без ограничений
+        chunk_size (int, optional): Размер части в байтах.По умолчанию 64 KiB
+
+    Returns:
+        Result: data - тело ответа(bytes), код ошибки FILE_TOO_LARGE при
+        превышении max_size
+    """
+    if max_size is None:
+        return ok(data=await resp.read())
+    if (resp.content_length or 0) > max_size:
+        return fail(
+            code="FILE_TOO_LARGE",
+            message=messages.FILE_TOO_LARGE_ERROR,
+            details=resp.content_length,
+        )
+
+    body: bytearray = bytearray()
+    async for chunk in resp.content.iter_chunked(chunk_size):
+        body.extend(chunk)
+        if len(body) > max_size:
+            return fail(
+                code="FILE_TOO_LARGE",
+                message=messages.FILE_TOO_LARGE_ERROR,
+                details=len(body),
+            )
+    return ok(data=bytes(body))
+
+
+async def save_response_to_file(
+    resp: aiohttp.ClientResponse,
+    file_path: FilePath,
+    max_size: Optional[int] = None,
+    chunk_size: int = 64 * 1024,
+) -> Result:
+    """
+    Записывает тело ответа на диск по частям.
+
+    Части пишутся во временный файл file_path.part в пуле потоков, чтобы не
+    блокировать цикл событий, после полной загрузки файл атомарно переименовывается
+    в file_path. При превышении max_size загрузка прерывается и временный файл удаляется.
+
+    Args:
+        resp (aiohttp.ClientResponse): Ответ сайта
+        file_path (FilePath): Путь для сохранения файла или функция, получающая
+        заголовки ответа и возвращающая путь(например, расширение по Content-Type)
+        max_size (Optional[int], optional): Максимальный размер файла в байтах.
+        По умолчанию None - без ограничений
+        chunk_size (int, optional): Размер части в байтах.По умолчанию 64 KiB
+
+    Returns:
+        Result: data - DownloadData при успехе, код ошибки FILE_TOO_LARGE при
+        превышении max_size
+    """
+    if max_size is not None and (resp.content_length or 0) > max_size:
+        return fail(
+            code="FILE_TOO_LARGE",
+            message=messages.FILE_TOO_LARGE_ERROR,
+            details=resp.content_length,
+        )
+
+    if callable(file_path):
+        file_path = file_path(resp.headers)
+
+    loop = asyncio.get_running_loop()
+    part_path: Path = file_path.with_name(f"{file_path.name}.part")
+    start: float = time.perf_counter()
+    size: int = 0
+    completed: bool = False
+
+    def open_part() -> BinaryIO:
+        part_path.parent.mkdir(parents=True, exist_ok=True)
+        return open(part_path, "wb")
+
+    file: BinaryIO = await loop.run_in_executor(None, open_part)
+    try:
+        async for chunk in resp.content.iter_chunked(chunk_size):
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                break
+            await loop.run_in_executor(None, file.write, chunk)
+        else:
+            completed = True
+    finally:
+        await loop.run_in_executor(None, file.close)
+        if not completed:
+            await loop.run_in_executor(None, _remove_file, part_path)
+
+    if not completed:
+        return fail(
+            code="FILE_TOO_LARGE",
+            message=messages.FILE_TOO_LARGE_ERROR,
+            details=size,
+        )
+
+    await loop.run_in_executor(None, os.replace, part_path, file_path)
+    return ok(
+        data=DownloadData(
+            path=file_path,
+            size=size,
+            duration=time.perf_counter() - start,
+        )
+    )
+
+
+def _remove_file(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
 async def error_handler_for_the_website(
     session: aiohttp.ClientSession,
     url: str,
@@ -39,21 +190,68 @@ async def error_handler_for_the_website(
     headers=None,
     function_name=None,
     json=None,
+    file_path: Optional[FilePath] = None,
+    max_size: Optional[int] = None,
+    chunk_size: int = 64 * 1024,
+    retry: Optional[RetryPolicy] = None,
+    breakers: Optional[CircuitBreakerRegistry] = None,
+    cache: Optional[ResponseCache] = None,
+    singleflight: Optional[SingleFlight] = None,
+    rate_limiter: Optional[RateLimiter] = rate_limiter,
 ) -> NetworkResponseResult:
     """
     Асинхронный запрос с обработками ошибок для сайтов.
 
+    При переданной retry запрос повторяется по политике RetryPolicy, при переданном
+    breakers запросы к хосту с открытым выключателем не отправляются. При переданном
+    cache свежие ответы возвращаются из кэша, устаревшие проверяются условным запросом.
+    При переданном singleflight одинаковые одновременные запросы выполняются один раз.
+    Запросы к хостам с ограничением частоты в rate_limiter ждут своей очереди.
+
     Args:
         session (_type_): Асинхронная сессия запроса
         url (str): URL сайта
         logging_data: (LoggingData): Класс содержащий логгер и имя роутера для логирования
-        data_type (str, optional): Тип возвращаемых данных.По умолчанию JSON('JSON', 'TEXT', 'BYTES')
-        timeout (int, optional): Таймаут запроса в секундах
+        data_type (str, optional): Тип возвращаемых данных.По умолчанию JSON('JSON', 'TEXT', 'BYTES', 'FILE')
+        timeout (int, optional): Таймаут запроса в секундах. Для 'FILE' - таймаут
+        подключения и ожидания каждой части ответа
         method (str, optional): Метод запроса. 'POST' или "GET"
         data (_type_, optional): Данные для POST запроса
         headers (dict): Заголовки запроса
         function_name (str): Имя функции в которой произошла ошибка
         json (json_data): JSON данные.По умолчанию None
+        file_path (Optional[FilePath]): Путь для сохранения файла при data_type='FILE'
+        или функция, получающая заголовки ответа и возвращающая путь
+        max_size (Optional[int]): Максимальный размер ответа в байтах при
+        data_type='FILE' и 'BYTES'
+        chunk_size (int): Размер части ответа в байтах при data_type='FILE' и 'BYTES'
+        retry (Optional[RetryPolicy]): Политика повторных запросов.По умолчанию None -
+        одна попытка.POST и PATCH повторяются, только если есть в retry.methods
+
+        Пример:
+        DEFAULT_RETRY_POLICY из core/error_handlers/retry.py
+
+        breakers (Optional[CircuitBreakerRegistry]): Выключатели запросов по хостам.
+        По умолчанию None
+
+        Пример:
+        circuit_breakers из core/error_handlers/retry.py
+
+        cache (Optional[ResponseCache]): Кэш ответов для 'JSON', 'TEXT' и 'BYTES'.
+        По умолчанию None
+
+        Пример:
+        response_cache из core/error_handlers/cache.py
+
+        singleflight (Optional[SingleFlight]): Объединение одинаковых одновременных
+        запросов.Все ожидающие получают один обьект NetworkResponseResult.
+        По умолчанию None
+
+        Пример:
+        single_flight из core/error_handlers/singleflight.py
+
+        rate_limiter (Optional[RateLimiter]): Ограничители частоты запросов по хостам.
+        По умолчанию общий rate_limiter из core/error_handlers/rate_limit.py
 
     Returns: NetworkResponseResult
 
@@ -70,7 +268,7 @@ async def error_handler_for_the_website(
 
         атрибуты NetworkResponseResult:
             - ok (bool): True если запрос прошел успешно, False - Произошла ошибка
-            - data (Optional[Any]): Данные успешного ответа
+            - data (Optional[Any]): Данные успешного ответа. Для 'FILE' - DownloadData
             - url (str): URL, по которому выполнялся запрос
             - status (int): HTTP-код ответа. 0 — если ошибка возникла на клиентской стороне.
             - method (str): HTTP-метод, использованный при запросе.
@@ -84,110 +282,466 @@ async def error_handler_for_the_website(
             - message (str)
             - details (Optional[Any])
     """
-    timeout_cfg: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=timeout)
-    try:
-        async with session.request(
+    cache_key: Optional[str] = None
+    entry: Optional[CacheEntry] = None
+    request_headers: Optional[CIMultiDict] = None
+    if cache is not None and cache.is_cacheable(method=method, data_type=data_type):
+        request_headers = _cache_request_headers(session=session, url=url, headers=headers)
+        cache_key = cache.make_key(
             method=method,
             url=url,
-            timeout=timeout_cfg,
+            data_type=data_type,
+            data=data,
+            json_data=json,
+            headers=request_headers,
+        )
+        entry = await cache.get(cache_key)
+        if entry and entry.is_fresh:
+            cache.stats.hits += 1
+            cache.stats.bytes_saved += entry.size
+            return entry.to_result()
+        cache.stats.misses += 1
+        if entry:
+            headers = {**(headers or {}), **entry.validation_headers()}
+
+    async def fetch() -> NetworkResponseResult:
+        result: NetworkResponseResult = await _request_with_retry(
+            session=session,
+            url=url,
+            logging_data=logging_data,
+            data_type=data_type,
+            timeout=timeout,
+            method=method,
             data=data,
             headers=headers,
+            function_name=function_name,
             json=json,
-            allow_redirects=True,
-        ) as resp:
-            if resp.status in [403, 404]:
-
-                # Тело ответа запроса
-                error_body = await safe_read_response(resp=resp)
-
-                # Формируем дефолтные сообщения
-                default_messages: Dict = {
-                    403: "Доступ к сайту запрещен",
-                    404: "Cервер не может найти запрошенный ресурс",
-                }
-
-                # Формируем ответ для пользователя
-                error_message_str: str = (
-                    error_body.get("message", default_messages[resp.status])
-                    if isinstance(error_body, dict)
-                    else default_messages[resp.status]
+            file_path=file_path,
+            max_size=max_size,
+            chunk_size=chunk_size,
+            retry=retry,
+            breakers=breakers,
+            rate_limiter=rate_limiter,
+        )
+
+        if cache_key:
+            if result.status == 304 and entry:
+                revalidated: CacheEntry = await cache.revalidate(
+                    key=cache_key,
+                    entry=entry,
+                    headers=result.headers,
+                    logging_data=logging_data,
+                )
+                return revalidated.to_result()
+            if result.ok and result.status == 200:
+                await cache.store(
+                    key=cache_key,
+                    result=result,
+                    data_type=data_type,
+                    logging_data=logging_data,
+                    request_headers=request_headers,
+                )
+        return result
+
+    if singleflight is None:
+        return await fetch()
+    return await singleflight.do(
+        key=singleflight.key_func(
+            method=method,
+            url=url,
+            data_type=data_type,
+            data=data,
+            json_data=json,
+            headers=headers,
+            file_path=file_path,
+        ),
+        factory=fetch,
+    )
+
+
+def _cache_request_headers(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers,
+) -> CIMultiDict:
+    """
+    Заголовки запроса для ключа кэша: заголовки сессии и запроса.
+
+    Если сессия отправит на url cookie из cookie_jar, добавляется Cookie, чтобы
+    ответ не попал в общий кэш.
+    """
+    request_headers: CIMultiDict = CIMultiDict(session.headers)
+    request_headers.update(headers or {})
+    if "Cookie" not in request_headers:
+        cookies = session.cookie_jar.filter_cookies(URL(url))
+        if cookies:
+            request_headers["Cookie"] = "; ".join(
+                f"{name}={morsel.value}" for name, morsel in sorted(cookies.items())
+            )
+    return request_headers
+
+
+async def _request_with_retry(
+    session: aiohttp.ClientSession,
+    url: str,
+    logging_data: LoggingData,
+    data_type: str,
+    timeout: float,
+    method: str,
+    data,
+    headers,
+    function_name: Optional[str],
+    json,
+    file_path: Optional[FilePath],
+    max_size: Optional[int],
+    chunk_size: int,
+    retry: Optional[RetryPolicy],
+    breakers: Optional[CircuitBreakerRegistry],
+    rate_limiter: Optional[RateLimiter],
+) -> NetworkResponseResult:
+    """Запрос с повторами по политике retry, выключателем и ограничением частоты хоста."""
+    if retry and not retry.allows_method(method):
+        retry = None
+    attempts: int = retry.attempts if retry else 1
+    breaker: Optional[CircuitBreaker] = (
+        breakers.get(urlparse(url).netloc) if breakers else None
+    )
+    bucket: Optional[TokenBucket] = (
+        rate_limiter.get(
+            host=urlparse(url).hostname or "", module=logging_data.router_name
+        )
+        if rate_limiter is not None
+        else None
+    )
+    for attempt in range(1, attempts + 1):
+        if breaker and not breaker.allow():
+            logging_data.warning_logger.warning(
+                f"[CIRCUIT BREAKER] Запрос {method} {url} не отправлен: "
+                f"хост недоступен ({breaker.state})"
+            )
+            return network_fail(
+                code="CIRCUIT_OPEN",
+                message=messages.NETWORK_ERROR,
+                status=0,
+                url=url,
+                method=method,
+            )
+
+        try:
+            if bucket:
+                await bucket.acquire()
+            result: NetworkResponseResult = await _send_request(
+                session=session,
+                url=url,
+                logging_data=logging_data,
+                data_type=data_type,
+                timeout=timeout,
+                method=method,
+                data=data,
+                headers=headers,
+                function_name=function_name,
+                json=json,
+                file_path=file_path,
+                max_size=max_size,
+                chunk_size=chunk_size,
+            )
+        except Exception as err:
+            # Локальные ошибки(диск, разбор ответа, ограничитель частоты) не
+            # говорят о недоступности хоста и не влияют на выключатель
+            host_error: bool = isinstance(
+                err, retry.exceptions if retry else NETWORK_EXCEPTIONS
+            ) and not isinstance(err, LOCAL_EXCEPTIONS)
+            if breaker:
+                if host_error:
+                    breaker.record_failure()
+                else:
+                    breaker.release_probe()
+            if retry and attempt < attempts and host_error:
+                delay: Optional[float] = retry.get_delay(attempt=attempt)
+                logging_data.warning_logger.warning(
+                    f"[RETRY] {method} {url}: {type(err).__name__} {err}, попытка "
+                    f"{attempt}/{attempts}, повтор через {delay:.2f} c"
                 )
+                await asyncio.sleep(delay)
+                continue
+            return _request_error_result(
+                err=err,
+                url=url,
+                method=method,
+                logging_data=logging_data,
+                function_name=function_name,
+            )
+        except BaseException:
+            # Отмена не записывается как ошибка хоста, но пробный запрос
+            # half_open должен освободиться, иначе хост будет отклоняться всегда
+            if breaker:
+                breaker.release_probe()
+            raise
+
+        if bucket and result.status == 429:
+            retry_after: Optional[str] = CIMultiDict(result.headers or {}).get(
+                "Retry-After"
+            )
+            bucket.block((parse_retry_after(retry_after) if retry_after else None) or 1.0)
 
-                logg_error_str: str = str(error_body)[:500]
-
-                logging_data.error_logger.error(
-                    msg=format_errors_message(
-                        name_router=logging_data.router_name,
-                        method=resp.method,
-                        status=resp.status,
-                        url=url,
-                        error_text=logg_error_str,
-                        function_name=function_name,
-                    )
+        if breaker:
+            if result.status >= 500 or result.status == 429:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+        if retry and attempt < attempts and result.status in retry.statuses:
+            delay = retry.get_delay(
+                attempt=attempt,
+                retry_after=CIMultiDict(result.headers or {}).get("Retry-After"),
+            )
+            if delay is not None:
+                logging_data.warning_logger.warning(
+                    f"[RETRY] {method} {url}: статус {result.status}, попытка "
+                    f"{attempt}/{attempts}, повтор через {delay:.2f} c"
                 )
+                await asyncio.sleep(delay)
+                continue
+        return result
+
+
+async def _send_request(
+    session: aiohttp.ClientSession,
+    url: str,
+    logging_data: LoggingData,
+    data_type: str,
+    timeout: float,
+    method: str,
+    data,
+    headers,
+    function_name: Optional[str],
+    json,
+    file_path: Optional[FilePath],
+    max_size: Optional[int],
+    chunk_size: int,
+) -> NetworkResponseResult:
+    """Одна попытка запроса. Ошибки запроса пробрасываются."""
+    timeout_cfg: aiohttp.ClientTimeout = (
+        aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+        if data_type.upper() == "FILE"
+        else aiohttp.ClientTimeout(total=timeout)
+    )
+    async with session.request(
+        method=method,
+        url=url,
+        timeout=timeout_cfg,
+        data=data,
+        headers=headers,
+        json=json,
+        allow_redirects=True,
+    ) as resp:
+        if resp.status == 304:
+            # Ответ на условный запрос: сохраненные данные не изменились
+            return network_ok(
+                data=None,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
+
+        if resp.status in [403, 404]:
+
+            # Тело ответа запроса
+            error_body = await safe_read_response(resp=resp)
+
+            # Формируем дефолтные сообщения
+            default_messages: Dict = {
+                403: "Доступ к сайту запрещен",
+                404: "Cервер не может найти запрошенный ресурс",
+            }
+
+            # Формируем ответ для пользователя
+            error_message_str: str = (
+                error_body.get("message", default_messages[resp.status])
+                if isinstance(error_body, dict)
+                else default_messages[resp.status]
+            )
 
-                return network_fail(
-                    code="NETWORK ERROR",
-                    message=error_message_str,
+            logg_error_str: str = str(error_body)[:500]
+
+            logging_data.error_logger.error(
+                msg=format_errors_message(
+                    name_router=logging_data.router_name,
+                    method=resp.method,
                     status=resp.status,
                     url=url,
-                    method=resp.method,
-                    headers=resp.headers,
+                    error_text=logg_error_str,
+                    function_name=function_name,
                 )
+            )
 
-            elif resp.status != 200 and resp.status != 202:
-                error_body = await safe_read_response(resp=resp)
-
-                logg_error_str: str = str(error_body)[:500]
+            return network_fail(
+                code="NETWORK ERROR",
+                message=error_message_str,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
 
-                logging_data.error_logger.error(
-                    msg=format_errors_message(
-                        name_router=logging_data.router_name,
-                        method=resp.method,
-                        status=resp.status,
-                        url=url,
-                        error_text=logg_error_str,
-                        function_name=function_name,
-                    )
-                )
-                return network_fail(
-                    code="UNKNOWN_STATUS_ERROR",
-                    message=messages.UNKNOWN_STATUS_ERROR,
+        elif resp.status == 429:
+            logging_data.warning_logger.warning(
+                msg=format_errors_message(
+                    name_router=logging_data.router_name,
+                    method=resp.method,
                     status=resp.status,
                     url=url,
-                    method=resp.method,
-                    headers=resp.headers,
+                    error_text=f"Превышен лимит запросов, Retry-After: "
+                    f"{resp.headers.get('Retry-After', '<no header>')}",
+                    function_name=function_name,
                 )
+            )
+            return network_fail(
+                code="RATE_LIMITED",
+                message=messages.RATE_LIMIT_ERROR,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
+
+        elif resp.status != 200 and resp.status != 202:
+            error_body = await safe_read_response(resp=resp)
 
-            if data_type.upper() == "JSON":
-                message_body = await resp.json()
-                return network_ok(
-                    data=message_body,
+            logg_error_str: str = str(error_body)[:500]
+
+            logging_data.error_logger.error(
+                msg=format_errors_message(
+                    name_router=logging_data.router_name,
+                    method=resp.method,
                     status=resp.status,
                     url=url,
-                    method=resp.method,
-                    headers=resp.headers,
+                    error_text=logg_error_str,
+                    function_name=function_name,
                 )
+            )
+            return network_fail(
+                code="UNKNOWN_STATUS_ERROR",
+                message=messages.UNKNOWN_STATUS_ERROR,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
 
-            elif data_type.upper() == "TEXT":
-                message_body: str = await resp.text()
-                return network_ok(
-                    data=message_body,
-                    status=resp.status,
+        if data_type.upper() == "JSON":
+            message_body = await resp.json()
+            return network_ok(
+                data=message_body,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
+
+        elif data_type.upper() == "FILE":
+            result_save: Result = await save_response_to_file(
+                resp=resp,
+                file_path=file_path,
+                max_size=max_size,
+                chunk_size=chunk_size,
+            )
+            if not result_save.ok:
+                return _too_large_result(
+                    resp=resp,
                     url=url,
-                    method=resp.method,
-                    headers=resp.headers,
+                    result=result_save,
+                    max_size=max_size,
+                    logging_data=logging_data,
+                    function_name=function_name,
                 )
-            else:
-                message_body: bytes = await resp.read()
-                return network_ok(
-                    data=message_body,
-                    status=resp.status,
+
+            download: DownloadData = result_save.data
+            logging_data.info_logger.info(
+                f"[DOWNLOAD] {url} -> {download.path}: {download.size} байт за "
+                f"{download.duration:.2f} c ({download.speed / 1024:.1f} KiB/c)"
+            )
+            return network_ok(
+                data=download,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
+
+        elif data_type.upper() == "TEXT":
+            message_body: str = await resp.text()
+            return network_ok(
+                data=message_body,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
+        else:
+            result_read: Result = await read_response_limited(
+                resp=resp,
+                max_size=max_size,
+                chunk_size=chunk_size,
+            )
+            if not result_read.ok:
+                return _too_large_result(
+                    resp=resp,
                     url=url,
-                    method=resp.method,
-                    headers=resp.headers,
+                    result=result_read,
+                    max_size=max_size,
+                    logging_data=logging_data,
+                    function_name=function_name,
                 )
-    except aiohttp.ClientError as err:
+            return network_ok(
+                data=result_read.data,
+                status=resp.status,
+                url=url,
+                method=resp.method,
+                headers=resp.headers,
+            )
+
+
+def _too_large_result(
+    resp: aiohttp.ClientResponse,
+    url: str,
+    result: Result,
+    max_size: Optional[int],
+    logging_data: LoggingData,
+    function_name: Optional[str],
+) -> NetworkResponseResult:
+    """Логирует превышение max_size и возвращает ошибку запроса."""
+    logging_data.error_logger.error(
+        msg=format_errors_message(
+            name_router=logging_data.router_name,
+            method=resp.method,
+            status=resp.status,
+            url=url,
+            error_text=f"Размер файла {result.error.details} "
+            f"больше допустимого {max_size} байт",
+            function_name=function_name,
+        )
+    )
+    return network_fail(
+        code=result.error.code,
+        message=result.error.message,
+        status=resp.status,
+        url=url,
+        method=resp.method,
+        headers=resp.headers,
+    )
+
+
+def _request_error_result(
+    err: Exception,
+    url: str,
+    method: str,
+    logging_data: LoggingData,
+    function_name: Optional[str],
+) -> NetworkResponseResult:
+    """Логирует ошибку запроса и возвращает NetworkResponseResult с ошибкой."""
+    if isinstance(err, aiohttp.ClientError):
         error_message: str = f"Ошибка сети при запросе:\n{err}"
 
         logging_data.error_logger.exception(
@@ -209,7 +763,7 @@ async def error_handler_for_the_website(
             method=method,
         )
 
-    except asyncio.TimeoutError as err:
+    if isinstance(err, asyncio.TimeoutError):
         error_message: str = f"Ожидание от сервера истекло:\n{err}"
 
         logging_data.error_logger.exception(
@@ -230,23 +784,22 @@ async def error_handler_for_the_website(
             method=method,
         )
 
-    except Exception as err:
-        error_message: str = f"Неизвестная ошибка при запросе:\n{err}"
+    error_message: str = f"Неизвестная ошибка при запросе:\n{err}"
 
-        logging_data.error_logger.exception(
-            msg=format_errors_message(
-                name_router=logging_data.router_name,
-                method=method,
-                status=0,
-                url=url,
-                error_text=error_message,
-                function_name=function_name,
-            )
-        )
-        return network_fail(
-            code="SERVER_ERROR",
-            message=messages.SERVER_ERROR,
+    logging_data.error_logger.exception(
+        msg=format_errors_message(
+            name_router=logging_data.router_name,
+            method=method,
             status=0,
             url=url,
-            method=method,
+            error_text=error_message,
+            function_name=function_name,
         )
+    )
+    return network_fail(
+        code="SERVER_ERROR",
+        message=messages.SERVER_ERROR,
+        status=0,
+        url=url,
+        method=method,
+    )
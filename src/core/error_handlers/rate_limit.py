@@ -0,0 +1,151 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Tuple
+import asyncio
+import time
+
+from pydantic import BaseModel, Field
+
+
+class RateLimitSettings(BaseModel):
+    """Настройки ограничения частоты запросов."""
+
+    RATE: float = Field(gt=0)  # Запросов в секунду
+    BURST: int = Field(1, ge=1)  # Запросов подряд без ожидания
+
+
+@dataclass
+class RateLimitStats:
+    """Метрики ограничителя частоты запросов."""
+
+    acquired: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+
+
+class TokenBucket:
+    """
+    Асинхронный token bucket.
+
+    Запросы сверх лимита не отклоняются, а ждут своей очереди(FIFO).
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.rate: float = rate
+        self.burst: int = burst
+        self.stats: RateLimitStats = RateLimitStats()
+        self._tokens: float = float(self.burst)
+        self._updated: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> float:
+        """
+        Ждет разрешения на запрос.
+
+        Returns:
+            float: Время ожидания в секундах
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        start: float = time.monotonic()
+        self.stats.queued += 1
+        self.stats.max_queued = max(self.stats.max_queued, self.stats.queued)
+        try:
+            async with self._lock:
+                while True:
+                    now: float = time.monotonic()
+                    self._refill(now)
+                    if now >= self._blocked_until and self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep(
+                        max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+                    )
+        finally:
+            self.stats.queued -= 1
+
+        wait: float = time.monotonic() - start
+        self.stats.acquired += 1
+        self.stats.total_wait += wait
+        self.stats.max_wait = max(self.stats.max_wait, wait)
+        if wait > 0.001:
+            self.stats.delayed += 1
+        return wait
+
+    def block(self, seconds: float) -> None:
+        """Приостанавливает выдачу разрешений(например после ответа 429)."""
+        self.stats.throttled += 1
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            float(self.burst), self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Ограничители частоты запросов по хостам.
+
+    Ограничение модуля для хоста(module - имя роутера из LoggingData)
+    имеет приоритет над общим ограничением хоста. Запросы к хостам без
+    ограничений выполняются сразу.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[Tuple[Optional[str], str], TokenBucket] = {}
+
+    def configure(
+        self,
+        host: str,
+        settings: RateLimitSettings,
+        module: Optional[str] = None,
+    ) -> None:
+        """
+        Задает ограничение для хоста.
+
+        Args:
+            host (str): Хост сайта
+
+            Пример:
+            api.example.com
+
+            settings (RateLimitSettings): Настройки ограничения
+            module (Optional[str], optional): Имя роутера модуля.По умолчанию None -
+            ограничение для всех модулей
+        """
+        self._buckets[(module, host)] = TokenBucket(
+            rate=settings.RATE, burst=settings.BURST
+        )
+
+    def get(self, host: str, module: Optional[str] = None) -> Optional[TokenBucket]:
+        """Возвращает ограничитель для хоста и модуля или None."""
+        return self._buckets.get((module, host)) or self._buckets.get((None, host))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Возвращает метрики ограничителей."""
+        return {
+            f"{module}:{host}" if module else host: asdict(bucket.stats)
+            for (module, host), bucket in self._buckets.items()
+        }
+
+    def clear(self) -> None:
+        """Удаляет все ограничения."""
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+rate_limiter: RateLimiter = RateLimiter()
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple, Type
+from threading import Lock
+import asyncio
+import random
+import time
+
+import aiohttp
+
+
+# Ошибки соединения и таймауты - только они считаются ошибками хоста
+NETWORK_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+)
+# Ошибки разбора ответа хоста, который ответил, - не признак недоступности хоста
+LOCAL_EXCEPTIONS: Tuple[Type[BaseException], ...] = (aiohttp.ContentTypeError,)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Политика повторных запросов.
+
+    Задержка перед попыткой n - backoff * 2 ** (n - 1), но не больше max_backoff,
+    со случайным разбросом ±jitter от задержки. Если сайт вернул Retry-After,
+    ждем указанное время; если оно больше max_backoff - повторов не делаем.
+
+    Повторяются только запросы с методами из methods. Неидемпотентные методы
+    (POST, PATCH) нужно добавить явно - сайт мог выполнить запрос до ошибки.
+    """
+
+    attempts: int = 3
+    statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    exceptions: Tuple[Type[BaseException], ...] = NETWORK_EXCEPTIONS
+    backoff: float = 0.5
+    max_backoff: float = 10.0
+    jitter: float = 0.5
+    respect_retry_after: bool = True
+    methods: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+    def allows_method(self, method: str) -> bool:
+        """Можно ли повторять запрос с этим методом."""
+        return method.upper() in self.methods
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Возвращает задержку перед следующей попыткой в секундах.
+
+        Args:
+            attempt (int): Номер неудачной попытки, начиная с 1
+            retry_after (Optional[str], optional): Значение заголовка Retry-After
+
+        Returns:
+            Optional[float]: Задержка или None, если повторять запрос не нужно
+        """
+        if self.respect_retry_after and retry_after:
+            delay: Optional[float] = parse_retry_after(retry_after)
+            if delay is not None:
+                return delay if delay <= self.max_backoff else None
+
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return max(0.0, delay * (1 + random.uniform(-self.jitter, self.jitter)))
+
+
+DEFAULT_RETRY_POLICY: RetryPolicy = RetryPolicy()
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Возвращает задержку из заголовка Retry-After(секунды или HTTP дата)."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель запросов к одному хосту.
+
+    - closed: запросы проходят, после failure_threshold ошибок подряд - open
+    - open: запросы не отправляются recovery_timeout секунд, затем - half_open
+    - half_open: проходит один пробный запрос, успех - closed, ошибка - open.
+      Отмененный пробный запрос освобождается release_probe
+    """
+
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.state: str = self.CLOSED
+        self.failures: int = 0
+        self.opened_at: float = 0.0
+        self.rejected: int = 0
+        self._probe: bool = False
+
+    def allow(self) -> bool:
+        """Проверяет можно ли отправить запрос."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self.state = self.HALF_OPEN
+            self._probe = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probe:
+                self.rejected += 1
+                return False
+            self._probe = True
+        return True
+
+    def record_success(self) -> None:
+        """Записывает успешный запрос."""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe = False
+
+    def release_probe(self) -> None:
+        """Освобождает пробный запрос, завершившийся без результата(отмена)."""
+        self._probe = False
+
+    def record_failure(self) -> None:
+        """Записывает неудачный запрос."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._probe = False
+
+    def snapshot(self) -> Dict:
+        """Возвращает состояние выключателя."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Выключатели запросов по хостам."""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock: Lock = Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        """Возвращает выключатель хоста, создавая его при первом обращении."""
+        breaker: Optional[CircuitBreaker] = self._breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(
+                    host,
+                    CircuitBreaker(
+                        failure_threshold=self.failure_threshold,
+                        recovery_timeout=self.recovery_timeout,
+                    ),
+                )
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Возвращает состояние выключателей всех хостов."""
+        return {host: breaker.snapshot() for host, breaker in self._breakers.items()}
+
+
+circuit_breakers: CircuitBreakerRegistry = CircuitBreakerRegistry()
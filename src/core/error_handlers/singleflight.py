@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from pathlib import Path
+import asyncio
+import json
+
+
+@dataclass
+class SingleFlightStats:
+    """Метрики объединения одинаковых запросов."""
+
+    executed: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+def default_request_key(
+    method: str,
+    url: str,
+    data_type: str,
+    data: Any = None,
+    json_data: Any = None,
+    headers: Optional[Dict] = None,
+    file_path: Optional[Path] = None,
+) -> Optional[Hashable]:
+    """
+    Ключ запроса для SingleFlight.
+
+    Объединяются только GET запросы с одинаковыми URL, телом, заголовками и
+    путем сохранения файла. Для остальных методов возвращает None.
+    """
+    if method.upper() != "GET":
+        return None
+    return (
+        url,
+        data_type.upper(),
+        repr(data),
+        json.dumps(json_data, sort_keys=True, default=repr),
+        tuple(sorted((str(key), str(value)) for key, value in (headers or {}).items())),
+        str(file_path) if file_path else None,
+    )
+
+
+class SingleFlight:
+    """
+    Объединение одинаковых одновременных вызовов.
+
+    Пока вызов с ключом выполняется, все вызовы с тем же ключом ждут его
+    результат, а не запускают свой. Все ожидающие получают один и тот же
+    обьект результата - его нельзя изменять. Отмена одного ожидающего не
+    отменяет общий вызов.
+    """
+
+    def __init__(
+        self,
+        key_func: Callable[..., Optional[Hashable]] = default_request_key,
+    ) -> None:
+        self.key_func: Callable[..., Optional[Hashable]] = key_func
+        self.stats: SingleFlightStats = SingleFlightStats()
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self,
+        key: Optional[Hashable],
+        factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Выполняет factory или ждет уже выполняющийся вызов с тем же ключом.
+
+        Args:
+            key (Optional[Hashable]): Ключ вызова. None - вызов выполняется без объединения
+            factory (Callable[[], Awaitable[Any]]): Функция создания корутины вызова
+
+        Returns:
+            Any: Результат вызова
+        """
+        if key is None:
+            return await factory()
+
+        call: Optional[asyncio.Future] = self._calls.get(key)
+        if call is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(call)
+
+        call = asyncio.ensure_future(factory())
+        self._calls[key] = call
+        self.stats.executed += 1
+        self.stats.in_flight += 1
+        call.add_done_callback(lambda future: self._done(key, future))
+        return await asyncio.shield(call)
+
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        self.stats.in_flight -= 1
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()  # ошибку получают ожидающие, не логируем ее повторно
+
+
+single_flight: SingleFlight = SingleFlight()
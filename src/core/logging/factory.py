@@ -4,6 +4,7 @@ from logging import (
     Formatter,
     StreamHandler,
     FileHandler,
+    Handler,
     getLogger,
     Logger,
     ERROR,
@@ -11,22 +12,49 @@ from logging import (
     WARNING,
     CRITICAL,
 )
-from sys import stdout
-from pathlib import Path
 
 from core.response.response_data import LoggingData
+from core.profiling.startup import profiler
+from core.logging.queued import LogQueue
+from core.logging.handlers import HandlerRegistry, RouterFilter, handler_registry
+from core.logging.rotation import LogRotationSettings
 
 
 class LoggerFactory:
-    def __init__(self, base_path: Path, format_log: str, datefmt: str):
+    def __init__(
+        self,
+        base_path: Path,
+        format_log: str,
+        datefmt: str,
+        log_queue: Optional[LogQueue] = None,
+        single_file: bool = False,
+        registry: HandlerRegistry = handler_registry,
+        json_format: bool = False,
+    ):
         self.base_path = base_path
         self.format = format_log
         self.datefmt = datefmt
-
-    def create(self, name: str, subdir: Optional[str] = None):
+        # Очередь для записи логов в фоновом потоке, None - запись в вызывающем потоке
+        self.log_queue = log_queue
+        # Все логгеры фабрики пишут в один файл на уровень, имя роутера - поле router
+        self.single_file = single_file
+        self.registry = registry
+        # Запись в формате JSON строк с полем router вместо текстового формата
+        self.json_format = json_format
+
+    @profiler.profile(phase="logger_create", arg="name", position=1)
+    def create(
+        self,
+        name: str,
+        subdir: Optional[str] = None,
+        rotation: Optional[LogRotationSettings] = None,
+    ):
         base_path = self.base_path
-        if subdir:
+        if subdir and not self.single_file:
             base_path = self.base_path / subdir
+        else:
+            # Файлы общие для всех модулей, ротация модуля не применяется
+            rotation = None
 
         info_path: Path = base_path / "info.log"
         warning_path: Path = base_path / "warning.log"
@@ -36,67 +64,53 @@ class LoggerFactory:
         # Создаем папку "logs" если ее нет
         base_path.mkdir(parents=True, exist_ok=True)
 
-        # задаем форматы логов
-        formaterr: Formatter = Formatter(
-            fmt=self.format,
+        # Форматтер и обработчики общие для логгеров с одинаковым форматом и путем
+        formaterr: Formatter = self.registry.get_formatter(
+            format_log=self.format,
             datefmt=self.datefmt,
+            json_format=self.json_format,
         )
 
         # Потоковый обработчик для вывода в консоль
-        stream_handler: StreamHandler = StreamHandler(stream=stdout)
-        stream_handler.setFormatter(formaterr)
+        stream_handler: StreamHandler = self.registry.get_stream_handler(formaterr)
 
         # Файловые обработчики
-        file_handler_info: FileHandler = FileHandler(
-            filename=info_path,
-            encoding="utf-8",
+        file_handler_info: FileHandler = self.registry.get_file_handler(
+            path=info_path, formatter=formaterr, rotation=rotation
         )
-        file_handler_info.setFormatter(formaterr)
-
-        file_handler_warning: FileHandler = FileHandler(
-            filename=warning_path, encoding="utf-8"
+        file_handler_warning: FileHandler = self.registry.get_file_handler(
+            path=warning_path, formatter=formaterr, rotation=rotation
         )
-        file_handler_warning.setFormatter(formaterr)
-
-        file_handler_error: FileHandler = FileHandler(
-            filename=error_path,
-            encoding="utf-8",
+        file_handler_error: FileHandler = self.registry.get_file_handler(
+            path=error_path, formatter=formaterr, rotation=rotation
         )
-        file_handler_error.setFormatter(formaterr)
-
-        file_handler_critical: FileHandler = FileHandler(
-            filename=critical_path,
-            encoding="utf-8",
+        file_handler_critical: FileHandler = self.registry.get_file_handler(
+            path=critical_path, formatter=formaterr, rotation=rotation
         )
-        file_handler_critical.setFormatter(formaterr)
 
         # Логгер для информации
         info_logger: Logger = getLogger(f"{name}_info")
         if not info_logger.handlers:
             info_logger.setLevel(level=INFO)
-            info_logger.addHandler(file_handler_info)
-            info_logger.addHandler(stream_handler)
+            self._add_handlers(info_logger, name, file_handler_info, stream_handler)
 
         # Логгер для предупреждения
         warning_logger: Logger = getLogger(f"{name}_warning")
         if not warning_logger.handlers:
             warning_logger.setLevel(level=WARNING)
-            warning_logger.addHandler(file_handler_warning)
-            warning_logger.addHandler(stream_handler)
+            self._add_handlers(warning_logger, name, file_handler_warning, stream_handler)
 
         # Логгер для ошибок
         error_logger: Logger = getLogger(f"{name}_error")
         if not error_logger.handlers:
             error_logger.setLevel(level=ERROR)
-            error_logger.addHandler(file_handler_error)
-            error_logger.addHandler(stream_handler)
+            self._add_handlers(error_logger, name, file_handler_error, stream_handler)
 
         # Логгер для критических ошибок
         critical_logger: Logger = getLogger(f"{name}_critical")
         if not critical_logger.handlers:
             critical_logger.setLevel(level=CRITICAL)
-            critical_logger.addHandler(file_handler_critical)
-            critical_logger.addHandler(stream_handler)
+            self._add_handlers(critical_logger, name, file_handler_critical, stream_handler)
 
         info_logger.info(f"Логгер {name} создан")
         return LoggingData(
@@ -106,3 +120,12 @@ class LoggerFactory:
             critical_logger=critical_logger,
             router_name=name,
         )
+
+    def _add_handlers(self, logger: Logger, router_name: str, *handlers: Handler) -> None:
+        if self.single_file or self.json_format:
+            logger.addFilter(RouterFilter(router_name=router_name))
+        if self.log_queue is not None:
+            self.log_queue.attach(logger, list(handlers))
+            return
+        for handler in handlers:
+            logger.addHandler(handler)
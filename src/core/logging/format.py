@@ -8,6 +8,11 @@ class LogFormat:
     LOG_FORMAT: str = (
         "[%(asctime)s] - %(module)s:%(lineno)s - [%(levelname)s - %(message)s]"
     )
+    # Формат для одного файла на уровень: имя роутера из RouterFilter
+    LOG_FORMAT_WITH_ROUTER: str = (
+        "[%(asctime)s] - %(router)s - %(module)s:%(lineno)s - "
+        "[%(levelname)s - %(message)s]"
+    )
     DATE_FORMAT: str = "%Y-%m-%D %H-%M-%S"
 
 
@@ -0,0 +1,144 @@
+from typing import Dict, Optional, Tuple
+from logging import FileHandler, Filter, Formatter, LogRecord, StreamHandler
+from pathlib import Path
+from sys import stdout
+
+from core.logging.rotation import GzipRotator, LogRotationSettings, create_file_handler
+from core.logging.structured import JsonFormatter
+
+
+class RouterFilter(Filter):
+    """Добавляет в запись поле router с именем роутера логгера."""
+
+    def __init__(self, router_name: str) -> None:
+        super().__init__()
+        self.router_name: str = router_name
+
+    def filter(self, record: LogRecord) -> bool:
+        record.router = self.router_name
+        return True
+
+
+class HandlerRegistry:
+    """
+    Общие обработчики и форматтеры логов.
+
+    Файловый обработчик создается один раз на путь и открывает файл только при
+    первой записи, поэтому уровни без записей не занимают файловые дескрипторы.
+
+    Ротация не синхронизируется между процессами, поэтому при включенной ротации
+    и заданном process_name каждый процесс пишет в свои файлы(info.worker-1.log).
+    """
+
+    def __init__(self) -> None:
+        self._formatters: Dict[Tuple[str, str, bool], Formatter] = {}
+        self._file_handlers: Dict[Path, FileHandler] = {}
+        self._stream_handlers: Dict[int, StreamHandler] = {}
+        self.rotation: LogRotationSettings = LogRotationSettings()
+        self.rotator: Optional[GzipRotator] = None
+        # Имя процесса для отдельных файлов при ротации, None - общие файлы
+        self.process_name: Optional[str] = None
+        self._dir_rotation: Dict[Path, LogRotationSettings] = {}
+
+    def configure_rotation(self, settings: LogRotationSettings) -> None:
+        """
+        Задает ротацию для новых файловых обработчиков.
+
+        Args:
+            settings (LogRotationSettings): Настройки ротации
+        """
+        self.rotation = settings
+
+    def rotation_overrides(self) -> Dict[Path, LogRotationSettings]:
+        """Возвращает настройки ротации папок модулей с переопределенными настройками."""
+        return dict(self._dir_rotation)
+
+    def get_formatter(
+        self, format_log: str, datefmt: str, json_format: bool = False
+    ) -> Formatter:
+        """
+        Возвращает форматтер для формата и формата даты.
+
+        При json_format=True возвращается JsonFormatter, формат строки не используется.
+        """
+        key: Tuple[str, str, bool] = (format_log, datefmt, json_format)
+        formatter = self._formatters.get(key)
+        if formatter is None:
+            formatter = (
+                JsonFormatter()
+                if json_format
+                else Formatter(fmt=format_log, datefmt=datefmt)
+            )
+            self._formatters[key] = formatter
+        return formatter
+
+    def get_file_handler(
+        self,
+        path: Path,
+        formatter: Formatter,
+        rotation: Optional[LogRotationSettings] = None,
+    ) -> FileHandler:
+        """
+        Возвращает файловый обработчик для пути.
+
+        Args:
+            path (Path): Путь до файла лога
+            formatter (Formatter): Форматтер для нового обработчика
+            rotation (Optional[LogRotationSettings], optional): Настройки ротации
+            модуля.По умолчанию None - общие настройки
+
+        Returns:
+            FileHandler: Обработчик
+        """
+        settings: LogRotationSettings = rotation or self.rotation
+        key: Path = Path(path).resolve()
+        if rotation is not None:
+            self._dir_rotation[key.parent] = rotation
+        if self.process_name and settings.MODE != "none":
+            key = key.with_name(f"{key.stem}.{self.process_name}{key.suffix}")
+        handler = self._file_handlers.get(key)
+        if handler is None:
+            handler = create_file_handler(
+                path=key, settings=settings, rotator=self._get_rotator(settings)
+            )
+            handler.setFormatter(formatter)
+            self._file_handlers[key] = handler
+        return handler
+
+    def _get_rotator(self, settings: LogRotationSettings) -> Optional[GzipRotator]:
+        if not settings.COMPRESS or settings.MODE == "none":
+            return None
+        if self.rotator is None:
+            self.rotator = GzipRotator(settings=self.rotation)
+        return self.rotator
+
+    def get_stream_handler(self, formatter: Formatter) -> StreamHandler:
+        """Возвращает обработчик вывода в консоль для форматтера."""
+        handler = self._stream_handlers.get(id(formatter))
+        if handler is None:
+            handler = StreamHandler(stream=stdout)
+            handler.setFormatter(formatter)
+            self._stream_handlers[id(formatter)] = handler
+        return handler
+
+    def snapshot(self) -> Dict[str, int]:
+        """Возвращает количество обработчиков, открытых файлов и форматтеров."""
+        return {
+            "file_handlers": len(self._file_handlers),
+            "open_files": sum(
+                1 for handler in self._file_handlers.values() if handler.stream is not None
+            ),
+            "stream_handlers": len(self._stream_handlers),
+            "formatters": len(self._formatters),
+        }
+
+    def close(self) -> None:
+        """Закрывает файлы обработчиков."""
+        for handler in self._file_handlers.values():
+            handler.close()
+        self._file_handlers.clear()
+        self._stream_handlers.clear()
+        self._formatters.clear()
+
+
+handler_registry: HandlerRegistry = HandlerRegistry()
@@ -0,0 +1,141 @@
+from dataclasses import dataclass, asdict
+from logging import ERROR, Handler, Logger, LogRecord
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Literal, Optional
+import atexit
+import queue
+
+
+@dataclass
+class LogQueueStats:
+    """Метрики очереди логов."""
+
+    enqueued: int = 0
+    dropped: int = 0
+    blocked: int = 0
+    max_size: int = 0
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Обработчик, складывающий записи в ограниченную очередь.
+
+    При заполненной очереди политика drop отбрасывает записи ниже ERROR,
+    ошибки всегда ждут места в очереди. Политика block ждет для всех записей.
+    """
+
+    def __init__(
+        self,
+        log_queue: "queue.Queue[Optional[LogRecord]]",
+        stats: LogQueueStats,
+        policy: Literal["drop", "block"] = "drop",
+    ) -> None:
+        super().__init__(log_queue)
+        self.stats: LogQueueStats = stats
+        self.policy: str = policy
+        # После остановки потока записи передаются обработчикам сразу
+        self.direct: Optional[Callable[[LogRecord], None]] = None
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        """
+        Передает запись в очередь без форматирования.
+
+        Поток записи работает в том же процессе, поэтому сообщение формируется
+        обработчиками в потоке записи, а не в вызывающем потоке.
+        """
+        return record
+
+    def enqueue(self, record: LogRecord) -> None:
+        """Кладет запись в очередь по политике заполнения."""
+        if self.direct is not None:
+            self.direct(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.policy == "drop" and record.levelno < ERROR:
+                self.stats.dropped += 1
+                return
+            self.stats.blocked += 1
+            self.queue.put(record)
+        self.stats.enqueued += 1
+        self.stats.max_size = max(self.stats.max_size, self.queue.qsize())
+
+
+class RoutingQueueListener(QueueListener):
+    """Поток, передающий записи из очереди обработчикам логгера записи."""
+
+    def __init__(self, log_queue: "queue.Queue[Optional[LogRecord]]") -> None:
+        super().__init__(log_queue)
+        self.routes: Dict[str, List[Handler]] = {}
+
+    def enqueue_sentinel(self) -> None:
+        """Ждет места в очереди, чтобы остановка не терялась при заполненной очереди."""
+        self.queue.put(self._sentinel)
+
+    def handle(self, record: LogRecord) -> None:
+        """Передает запись обработчикам логгера по record.name."""
+        for handler in self.routes.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class LogQueue:
+    """
+    Фоновая запись логов.
+
+    Логгеры получают один BoundedQueueHandler, запись в файлы и консоль выполняет
+    отдельный поток. Поток запускается при первом attach и останавливается при
+    выходе из процесса с записью оставшихся логов.
+    """
+
+    def __init__(self, maxsize: int = 10000, policy: Literal["drop", "block"] = "drop") -> None:
+        self.stats: LogQueueStats = LogQueueStats()
+        self.configure(maxsize=maxsize, policy=policy)
+
+    def configure(self, maxsize: int, policy: Literal["drop", "block"] = "drop") -> None:
+        """
+        Задает размер очереди и политику заполнения. Вызывается до attach.
+
+        Args:
+            maxsize (int): Максимум записей в очереди, 0 - без ограничений
+            policy (Literal["drop", "block"], optional): Политика при заполненной
+            очереди.По умолчанию drop
+        """
+        self.queue: "queue.Queue[Optional[LogRecord]]" = queue.Queue(maxsize=maxsize)
+        self.handler: BoundedQueueHandler = BoundedQueueHandler(
+            log_queue=self.queue, stats=self.stats, policy=policy
+        )
+        self.listener: RoutingQueueListener = RoutingQueueListener(self.queue)
+        self._started: bool = False
+
+    def attach(self, logger: Logger, handlers: List[Handler]) -> None:
+        """
+        Подключает логгер к очереди.
+
+        Args:
+            logger (Logger): Логгер
+            handlers (List[Handler]): Обработчики, в которые поток пишет записи логгера
+        """
+        self.listener.routes[logger.name] = handlers
+        logger.addHandler(self.handler)
+        if not self._started:
+            self.listener.start()
+            atexit.register(self.stop)
+            self._started = True
+
+    def stop(self) -> None:
+        """Записывает оставшиеся логи и останавливает поток."""
+        if self._started:
+            self._started = False
+            self.listener.stop()
+            self.handler.direct = self.listener.handle
+
+    def snapshot(self) -> Dict:
+        """Возвращает метрики очереди."""
+        snapshot: Dict = asdict(self.stats)
+        snapshot["size"] = self.queue.qsize()
+        return snapshot
+
+
+log_queue: LogQueue = LogQueue()
@@ -0,0 +1,263 @@
+from dataclasses import dataclass
+from logging import FileHandler
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Mapping, Optional, Tuple, Union
+import atexit
+import functools
+import gzip
+import os
+import queue
+import shutil
+import threading
+import time
+
+from pydantic import BaseModel
+
+
+class LogRotationSettings(BaseModel):
+    """Настройки ротации файлов логов."""
+
+    MODE: Literal["none", "size", "time"] = "none"
+    MAX_BYTES: int = 10 * 1024 * 1024  # Размер файла для ротации в режиме size
+    WHEN: str = "midnight"  # Интервал ротации в режиме time(как в TimedRotatingFileHandler)
+    BACKUP_COUNT: int = 7  # Старых файлов на каждый лог модуля
+    COMPRESS: bool = True  # Сжимать старые файлы gzip в фоновом потоке
+    RETENTION_DAYS: Optional[float] = None  # Удалять старые файлы старше, None - без ограничения
+
+    def merge(
+        self, override: Union["LogRotationSettings", Mapping[str, Any], None]
+    ) -> "LogRotationSettings":
+        """
+        Возвращает настройки с переопределенными полями модуля.
+
+        Args:
+            override (Union[LogRotationSettings, Mapping[str, Any], None]): Поле
+            LOG_ROTATION из settings модуля: настройки или словарь с частью полей
+
+        Returns:
+            LogRotationSettings: Настройки для логов модуля
+        """
+        if override is None:
+            return self
+        if isinstance(override, LogRotationSettings):
+            return override
+        return self.model_validate({**self.model_dump(), **dict(override)})
+
+
+@dataclass
+class PruneData:
+    """Результат очистки старых логов."""
+
+    compressed: int = 0
+    deleted: int = 0
+    bytes_freed: int = 0
+
+
+def _split_rotated_name(path: Path) -> Optional[str]:
+    # info.log.1.gz, info.log.2026-10-18 -> info.log, info.log -> None
+    name: str = path.name
+    index: int = name.find(".log.")
+    return name[: index + 4] if index != -1 else None
+
+
+def compress_file(path: Path) -> int:
+    """
+    Сжимает файл gzip в path.gz и удаляет исходный файл.
+
+    Returns:
+        int: Сэкономлено байт
+    """
+    path = Path(path)
+    target: Path = path.with_name(path.name + ".gz")
+    part: Path = path.with_name(path.name + ".gz.part")
+    size: int = path.stat().st_size
+    with open(path, "rb") as source, gzip.open(part, "wb") as destination:
+        shutil.copyfileobj(source, destination)
+    os.replace(part, target)
+    os.remove(path)
+    return size - target.stat().st_size
+
+
+def prune_logs(
+    log_dir: Path,
+    backup_count: int,
+    retention_days: Optional[float] = None,
+    compress: bool = True,
+    overrides: Optional[Mapping[Path, LogRotationSettings]] = None,
+    recursive: bool = True,
+) -> PruneData:
+    """
+    Сжимает и удаляет старые(ротированные) файлы логов в папке и вложенных папках.
+
+    Для каждого лога остается не больше backup_count старых файлов, файлы старше
+    retention_days удаляются. Текущие файлы(*.log) не изменяются. Файлы, удаленные
+    другим процессом во время очистки, пропускаются.
+
+    Args:
+        log_dir (Path): Папка логов
+        backup_count (int): Старых файлов на каждый лог
+        retention_days (Optional[float], optional): Максимальный возраст старых
+        файлов в днях.По умолчанию None - без ограничения
+        compress (bool, optional): Сжать несжатые старые файлы.По умолчанию True
+        overrides (Optional[Mapping[Path, LogRotationSettings]], optional):
+        BACKUP_COUNT и RETENTION_DAYS для папок модулей.По умолчанию None
+        recursive (bool, optional): Очищать вложенные папки.По умолчанию True
+
+    Returns:
+        PruneData: Количество сжатых и удаленных файлов и освобожденных байт
+    """
+    result: PruneData = PruneData()
+    groups: Dict[Tuple[Path, str], List[Tuple[float, int, Path]]] = {}
+    log_dir = Path(log_dir).resolve()
+    paths = log_dir.rglob("*.log.*") if recursive else log_dir.glob("*.log.*")
+    for path in paths:
+        base: Optional[str] = _split_rotated_name(path)
+        if base is None or path.name.endswith(".part"):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        groups.setdefault((path.parent, base), []).append(
+            (stat.st_mtime, stat.st_size, path)
+        )
+
+    now: float = time.time()
+    for (parent, _), files in groups.items():
+        limit: int = backup_count
+        days: Optional[float] = retention_days
+        if overrides and parent in overrides:
+            limit = overrides[parent].BACKUP_COUNT
+            days = overrides[parent].RETENTION_DAYS
+        deadline: Optional[float] = now - days * 86400 if days is not None else None
+
+        files.sort(reverse=True)
+        for index, (mtime, size, path) in enumerate(files):
+            try:
+                if index >= limit or (deadline is not None and mtime < deadline):
+                    path.unlink()
+                    result.deleted += 1
+                    result.bytes_freed += size
+                elif compress and path.suffix != ".gz":
+                    result.bytes_freed += compress_file(path)
+                    result.compressed += 1
+            except FileNotFoundError:
+                continue
+    return result
+
+
+class GzipRotator:
+    """
+    rotator и namer для обработчиков логов со сжатием в фоновом потоке.
+
+    При ротации файл только переименовывается, сжатие и очистка старых файлов
+    выполняются в отдельном потоке и не задерживают запись логов. Очистка
+    использует настройки обработчика(BACKUP_COUNT и RETENTION_DAYS модуля).
+    """
+
+    def __init__(self, settings: LogRotationSettings) -> None:
+        self.settings: LogRotationSettings = settings
+        self._queue: "queue.Queue[Tuple[Path, LogRotationSettings]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def namer(self, name: str) -> str:
+        """
+        Имя старого файла после сжатия.
+
+        Вызывается обработчиком перед сдвигом старых файлов, поэтому сначала
+        дожидается сжатия после предыдущей ротации.
+        """
+        self.join()
+        return name + ".gz"
+
+    def rotate(
+        self,
+        source: str,
+        dest: str,
+        settings: Optional[LogRotationSettings] = None,
+    ) -> None:
+        """Переименовывает текущий файл и ставит его в очередь на сжатие."""
+        plain: str = dest[:-3] if dest.endswith(".gz") else dest
+        if not os.path.exists(source):
+            return
+        os.replace(source, plain)
+        self._start()
+        self._queue.put((Path(plain), settings or self.settings))
+
+    def join(self) -> None:
+        """Ждет сжатия файлов из очереди."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log-compressor", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.join)
+
+    def _run(self) -> None:
+        while True:
+            path, settings = self._queue.get()
+            try:
+                compress_file(path)
+                prune_logs(
+                    log_dir=path.parent,
+                    backup_count=settings.BACKUP_COUNT,
+                    retention_days=settings.RETENTION_DAYS,
+                    compress=False,
+                    recursive=False,
+                )
+            except OSError:
+                # Файл будет сжат при следующей очистке(cli logs-prune)
+                pass
+            finally:
+                self._queue.task_done()
+
+
+def create_file_handler(
+    path: Path,
+    settings: LogRotationSettings,
+    rotator: Optional[GzipRotator] = None,
+) -> FileHandler:
+    """
+    Создает файловый обработчик по настройкам ротации.
+
+    Файл открывается при первой записи.
+
+    Args:
+        path (Path): Путь до файла лога
+        settings (LogRotationSettings): Настройки ротации
+        rotator (Optional[GzipRotator], optional): Сжатие старых файлов.По умолчанию None
+
+    Returns:
+        FileHandler: Обработчик
+    """
+    handler: FileHandler
+    if settings.MODE == "size":
+        handler = RotatingFileHandler(
+            filename=path,
+            maxBytes=settings.MAX_BYTES,
+            backupCount=settings.BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+    elif settings.MODE == "time":
+        handler = TimedRotatingFileHandler(
+            filename=path,
+            when=settings.WHEN,
+            backupCount=settings.BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+    else:
+        return FileHandler(filename=path, encoding="utf-8", delay=True)
+
+    if rotator is not None:
+        handler.namer = rotator.namer
+        handler.rotator = functools.partial(rotator.rotate, settings=settings)
+    return handler
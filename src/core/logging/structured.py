@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from logging import Formatter, LogRecord
+from typing import Any, Dict, Optional
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson - необязательная зависимость
+    orjson = None
+
+
+def dumps(data: Dict[str, Any]) -> str:
+    """Сериализует запись в строку JSON, через orjson если он установлен."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class LazyMessage(ABC):
+    """
+    Сообщение лога, которое формируется только при записи.
+
+    Логгер проверяет уровень до обращения к сообщению, поэтому при выключенном
+    уровне текст и поля не вычисляются. Текстовый формат использует str(),
+    JsonFormatter - fields().
+    """
+
+    __slots__ = ("_text",)
+
+    def __init__(self) -> None:
+        self._text: Optional[str] = None
+
+    @abstractmethod
+    def fields(self) -> Dict[str, Any]:
+        """Поля для записи в JSON."""
+
+    @abstractmethod
+    def render(self) -> str:
+        """Текст для записи в текстовом формате."""
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.render()
+        return self._text
+
+
+class JsonFormatter(Formatter):
+    """Форматирует запись в одну строку JSON."""
+
+    def format(self, record: LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "router": getattr(record, "router", None),
+            "module": record.module,
+            "line": record.lineno,
+        }
+        if isinstance(record.msg, LazyMessage) and not record.args:
+            data.update(record.msg.fields())
+        else:
+            data["message"] = record.getMessage()
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return dumps(data)
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from aiogram.types import CallbackQuery, Message, TelegramObject
+
+from core.response.modules_loader import ModuleInfo
+from core.response.response_data import LoggingData
+from core.module_loader.runtime.registry import ModuleRegistry
+from core.contracts.module import OPTIONAL_FIELD_CALLBACK_PREFIXES
+
+
+@dataclass
+class DispatchIndexStats:
+    """Метрики индекса маршрутизации."""
+
+    hits: int = 0
+    misses: int = 0
+    fallbacks: int = 0
+    bypasses: int = 0
+
+
+class DispatchIndex:
+    """
+    Индекс для прямой маршрутизации событий в роутер модуля-владельца.
+
+    - callback_query: точное совпадение MENU_CALLBACK_DATA или самый длинный
+      префикс из CALLBACK_PREFIXES
+    - message: текст MENU_REPLY_TEXT корневых модулей из главного меню
+    """
+
+    def __init__(self) -> None:
+        self.callback_data: Dict[str, object] = {}
+        self.callback_prefixes: Dict[str, object] = {}
+        self.texts: Dict[str, object] = {}
+        self.stats: DispatchIndexStats = DispatchIndexStats()
+        self._prefix_lengths: List[int] = []
+
+    def _add(
+        self,
+        index: Dict[str, object],
+        key: str,
+        router: object,
+        logging_data: LoggingData = None,
+    ) -> None:
+        owner = index.setdefault(key, router)
+        if owner is not router and logging_data:
+            logging_data.warning_logger.warning(
+                f"[DISPATCH INDEX] '{key}' уже принадлежит {owner}, {router} пропущен"
+            )
+
+    def add_module(
+        self,
+        module: ModuleInfo,
+        router: object,
+        logging_data: LoggingData = None,
+    ) -> None:
+        """Добавляет в индекс ключи модуля из его settings."""
+        config = module.config
+        self._add(self.callback_data, config.MENU_CALLBACK_DATA, router, logging_data)
+
+        for prefix in getattr(config, OPTIONAL_FIELD_CALLBACK_PREFIXES, None) or ():
+            self._add(self.callback_prefixes, prefix, router, logging_data)
+        self._prefix_lengths = sorted(
+            {len(prefix) for prefix in self.callback_prefixes}, reverse=True
+        )
+
+        if module.is_root and config.SHOW_IN_MAIN_MENU:
+            self._add(self.texts, config.MENU_REPLY_TEXT, router, logging_data)
+
+    def find(self, event: TelegramObject) -> Optional[object]:
+        """Возвращает роутер-владелец события или None."""
+        if isinstance(event, CallbackQuery):
+            data: Optional[str] = event.data
+            if not data:
+                return None
+            router = self.callback_data.get(data)
+            if router is not None:
+                return router
+            for length in self._prefix_lengths:
+                if length <= len(data):
+                    router = self.callback_prefixes.get(data[:length])
+                    if router is not None:
+                        return router
+            return None
+
+        if isinstance(event, Message) and event.text:
+            return self.texts.get(event.text)
+
+        return None
+
+    def __len__(self) -> int:
+        return len(self.callback_data) + len(self.callback_prefixes) + len(self.texts)
+
+
+def build_dispatch_index(
+    modules: ModuleRegistry,
+    routers: Dict[str, object],
+    logging_data: LoggingData = None,
+) -> DispatchIndex:
+    """
+    Формирует индекс маршрутизации по settings модулей.
+
+    Args:
+        modules (ModuleRegistry): Реестр модулей
+        routers (Dict[str, object]): Подключенные роутеры по пути импорта модуля,
+        результат register_module
+        logging_data (LoggingData, optional): Обьект класса LoggingData.По умолчанию None
+
+    Returns:
+        DispatchIndex: Индекс маршрутизации
+    """
+    index: DispatchIndex = DispatchIndex()
+    for module in modules:
+        router = routers.get(module.package)
+        if router is None:
+            continue
+        index.add_module(module=module, router=router, logging_data=logging_data)
+    return index
@@ -0,0 +1,213 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+import time
+
+from aiogram import Router
+from aiogram.types import CallbackQuery, Message, TelegramObject
+
+from core.response.modules_loader import ModuleInfo
+from core.response.response_data import LoggingData, Result
+from core.contracts.constants import DEFAULT_NAME_ROUTER
+from core.contracts.module import (
+    OPTIONAL_FIELD_CALLBACK_PREFIXES,
+    OPTIONAL_FIELD_COMMANDS,
+    OPTIONAL_FIELD_EAGER_LOAD,
+)
+from core.error_handlers.helpers import ok, fail, safe_import
+from core.error_handlers.format import format_errors_message
+
+
+@dataclass
+class LazyRouterStats:
+    """Метрики ленивой загрузки роутеров."""
+
+    deferred: int = 0
+    loaded: int = 0
+    failed: int = 0
+    load_time: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def pending(self) -> int:
+        return self.deferred - self.loaded
+
+
+lazy_stats: LazyRouterStats = LazyRouterStats()
+
+
+@dataclass(frozen=True)
+class LazyTriggers:
+    """Условия, при которых роутер модуля импортируется."""
+
+    texts: FrozenSet[str] = frozenset()
+    commands: FrozenSet[str] = frozenset()
+    callback_data: FrozenSet[str] = frozenset()
+    callback_prefixes: Tuple[str, ...] = ()
+
+    def match(self, update_type: str, event: TelegramObject) -> bool:
+        """Проверяет подходит ли событие под условия загрузки."""
+        if update_type == "message" and isinstance(event, Message):
+            text: Optional[str] = event.text
+            if not text:
+                return False
+            if text in self.texts:
+                return True
+            if text.startswith("/") and self.commands:
+                command: str = text[1:].split(maxsplit=1)[0].split("@", 1)[0]
+                return command in self.commands
+            return False
+
+        if update_type == "callback_query" and isinstance(event, CallbackQuery):
+            data: Optional[str] = event.data
+            if not data:
+                return False
+            return data in self.callback_data or data.startswith(
+                self.callback_prefixes
+            )
+
+        return False
+
+    def update_types(self) -> Set[str]:
+        """Типы апдейтов, по которым роутер может загрузиться."""
+        update_types: Set[str] = set()
+        if self.texts or self.commands:
+            update_types.add("message")
+        if self.callback_data or self.callback_prefixes:
+            update_types.add("callback_query")
+        return update_types
+
+
+def is_eager_module(module: ModuleInfo) -> bool:
+    """Проверяет, требует ли модуль обязательной загрузки роутера при старте."""
+    return bool(getattr(module.config, OPTIONAL_FIELD_EAGER_LOAD, False))
+
+
+def get_lazy_triggers(module: ModuleInfo) -> LazyTriggers:
+    """
+    Формирует условия загрузки роутера из settings модуля.
+
+    - Корневой модуль загружается по тексту MENU_REPLY_TEXT
+    - Любой модуль загружается по MENU_CALLBACK_DATA
+    - Дополнительно используются необязательные поля COMMANDS и CALLBACK_PREFIXES
+
+    Args:
+        module (ModuleInfo): Модуль из реестра модулей
+
+    Returns:
+        LazyTriggers: Условия загрузки роутера
+    """
+    config = module.config
+    texts = {config.MENU_REPLY_TEXT} if module.is_root else set()
+    commands = {
+        command.lstrip("/")
+        for command in getattr(config, OPTIONAL_FIELD_COMMANDS, None) or ()
+    }
+    prefixes = tuple(getattr(config, OPTIONAL_FIELD_CALLBACK_PREFIXES, None) or ())
+    return LazyTriggers(
+        texts=frozenset(texts),
+        commands=frozenset(commands),
+        callback_data=frozenset({config.MENU_CALLBACK_DATA}),
+        callback_prefixes=prefixes,
+    )
+
+
+class LazyRouter(Router):
+    """
+    Роутер-заглушка модуля, импортирующий настоящий роутер при первом подходящем событии.
+
+    Настоящий роутер подключается первым дочерним роутером заглушки, поэтому
+    дочерние модули, подключенные к заглушке, проверяются после него.
+    """
+
+    def __init__(
+        self,
+        module: ModuleInfo,
+        name_router: str = DEFAULT_NAME_ROUTER,
+        triggers: Optional[LazyTriggers] = None,
+        logging_data: LoggingData = None,
+    ) -> None:
+        super().__init__(name=f"lazy:{module.config.SERVICE_NAME}")
+        self.module: ModuleInfo = module
+        self.name_router: str = name_router
+        self.triggers: LazyTriggers = triggers or get_lazy_triggers(module)
+        self.logging_data: Optional[LoggingData] = logging_data
+        self.router: Optional[Router] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.router is not None
+
+    def load(self) -> Result:
+        """Импортирует настоящий роутер модуля и подключает его к заглушке."""
+        if self.router is not None:
+            return ok(data=self.router)
+
+        start: float = time.perf_counter()
+        result_import = safe_import(
+            module_package=f"{self.module.package}.{self.name_router}",
+            logging_data=self.logging_data,
+        )
+        if not result_import.ok:
+            lazy_stats.failed += 1
+            return result_import
+
+        router = getattr(result_import.data, self.name_router, None)
+        if not isinstance(router, Router):
+            lazy_stats.failed += 1
+            return fail(
+                code="LAZY ROUTER ERROR",
+                message=f"{self.name_router} not found - {self.module.package}",
+            )
+
+        # Настоящий роутер должен проверяться раньше дочерних модулей
+        self.include_router(router)
+        self.sub_routers.insert(0, self.sub_routers.pop())
+        self.router = router
+
+        elapsed: float = time.perf_counter() - start
+        lazy_stats.loaded += 1
+        lazy_stats.load_time[self.module.package] = elapsed
+        if self.logging_data:
+            self.logging_data.info_logger.info(
+                f"[LAZY] Роутер {self.module.package} загружен за {elapsed:.3f} c"
+            )
+        return ok(data=router)
+
+    async def propagate_event(
+        self,
+        update_type: str,
+        event: TelegramObject,
+        **kwargs: Any,
+    ) -> Any:
+        if self.router is None and self.triggers.match(update_type, event):
+            result_load: Result = self.load()
+            if not result_load.ok and self.logging_data:
+                self.logging_data.error_logger.error(
+                    msg=format_errors_message(
+                        name_router=self.logging_data.router_name,
+                        function_name=self.load.__name__,
+                        error_text=f"[LAZY] {result_load.error.message}",
+                    )
+                )
+        return await super().propagate_event(update_type, event, **kwargs)
+
+
+def resolve_allowed_updates(router: Router) -> List[str]:
+    """
+    Возвращает типы апдейтов для allowed_updates с учетом ленивых роутеров.
+
+    У незагруженной заглушки нет обработчиков, поэтому resolve_used_update_types
+    не видит ее типы апдейтов, и Telegram не присылал бы события для ее загрузки.
+    Типы обработчиков, которые появятся только после загрузки роутера, известны
+    не будут - такие апдейты должны обрабатываться и загруженными модулями.
+
+    Args:
+        router (Router): Диспетчер или корневой роутер
+
+    Returns:
+        List[str]: Отсортированный список типов апдейтов
+    """
+    update_types: Set[str] = set(router.resolve_used_update_types())
+    for sub_router in router.chain_tail:
+        if isinstance(sub_router, LazyRouter) and not sub_router.loaded:
+            update_types.update(sub_router.triggers.update_types())
+    return sorted(update_types)
@@ -1,9 +1,23 @@
 from collections import defaultdict
+from dataclasses import replace
 import pkgutil
-from typing import List
+import sys
+from typing import List, Dict, Optional
 from pathlib import Path
-
-from core.response.modules_loader import ModuleInfo
+from types import ModuleType
+
+from core.response.modules_loader import ModuleInfo, ModuleManifestEntry
+from core.module_loader.runtime.manifest import (
+    build_manifest,
+    load_manifest,
+    save_manifest,
+    manifest_stats,
+)
+from core.module_loader.runtime.registry import ModuleRegistry, build_module_registry
+from core.module_loader.runtime.validate import validate_module
+from core.module_loader.runtime.lazy import is_eager_module
+from core.module_loader.runtime.parallel import import_modules
+from core.profiling.startup import profiler
 from core.contracts.constants import (
     DEFAULT_CHILD_SEPARATOR,
     DEFAULT_NAME_ROUTER,
@@ -15,9 +29,10 @@ from core.response.response_data import (
     InlineKeyboardData,
     LoggingData,
 )
-from core.error_handlers.helpers import ok
+from core.error_handlers.helpers import ok, fail
 from core.contracts.constants import DEFAULT_NAME_SETTINGS
 from core.contracts.module import (
+    REQUIRED_FIELDS_MODULES,
     DEFAULT_FIELD_FOR_INLINE_MENU_TEXT,
     DEFAULT_FIELD_FOR_INLINE_MENU_DATA,
 )
@@ -57,17 +72,20 @@ def get_root_and_parent(
     return root, parent
 
 
-def load_modules(
+def walk_module_entries(
+    package: ModuleType,
     root_package: str,
     name_settings: str = DEFAULT_NAME_SETTINGS,
     name_router: str = DEFAULT_NAME_ROUTER,
     separator: str = DEFAULT_CHILD_SEPARATOR,
-) -> Result:
+) -> List[ModuleManifestEntry]:
     """
-    Проходится по модулям и возвращает обьект ModuleInfo c собранными
-    данными
+    Проходится по пакету через pkgutil.walk_packages и возвращает записи о модулях.
+
+    Файлы settings и router не импортируются, импортируются только пакеты для обхода.
 
     Args:
+        package (ModuleType): Импортированный корневой пакет
         root_package (str): Путь для импорта, начинается с корневой директории
 
         Пример
@@ -75,31 +93,11 @@ def load_modules(
 
         name_settings (str): Имя файла для хранений настроек. По умолчанию DEFAULT_NAME_SETTINGS
         name_router (str): Имя файла для хранения роутера.По умолчанию DEFAULT_NAME_ROUTER
-
         separator (str): Имя для связывания дочернего и родительского модуля
 
-        Имя папки для хранения дочерних модулей, формирования имен в settings,
-        формирования имени роутера
-
     Returns:
-        List[ModuleInfo]: обьект содержащий в себе
-
-        Атрибуты ModuleInfo]:
-            - package (str): Путь для импорта модуля
-            - root (str): Имя корневого роутера
-            - settings (ModuleType): Модуль с настройками
-            - router (ModuleType): Модуль router
-            - parent (str | None): Имя корневого роутера если дочерний если корневой то
-            None
-
+        List[ModuleManifestEntry]: Список записей о модулях в порядке обхода
     """
-
-    result_import = safe_import(module_package=root_package)
-    if not result_import.ok:
-        return result_import
-
-    package = result_import.data
-
     modules = defaultdict(dict)
 
     for module_info in pkgutil.walk_packages(
@@ -117,31 +115,323 @@ def load_modules(
         )
 
         package_name, file_type = module_name.rsplit(".", 1)
-        result_import = safe_import(module_package=module_name)
-
-        if not result_import.ok:
-            return result_import
-
-        mod = result_import.data
-        modules[package_name][file_type] = mod
+        modules[package_name][file_type] = str(
+            Path(module_info.module_finder.path) / f"{file_type}.py"
+        )
         modules[package_name]["root"] = root
         modules[package_name]["parent"] = parent
-        modules[package_name]["package"] = package_name
-    array_modules = []
-    for package, data in modules.items():
+
+    entries: List[ModuleManifestEntry] = []
+    for package_name, data in modules.items():
         if f"{name_settings}" not in data or f"{name_router}" not in data:
             continue  # дополнительная проверка
 
-        array_modules.append(
-            ModuleInfo(
-                package=data.get("package"),
+        entries.append(
+            ModuleManifestEntry(
+                package=package_name,
                 root=data.get("root"),
                 parent=data.get("parent"),
-                router=data.get(f"{name_router}"),
-                settings=data.get(f"{name_settings}"),
+                settings_path=data.get(f"{name_settings}"),
+                router_path=data.get(f"{name_router}"),
+            )
+        )
+    return entries
+
+
+@profiler.profile(phase="discover_modules", arg="root_package")
+def discover_modules(
+    root_package: str,
+    name_settings: str = DEFAULT_NAME_SETTINGS,
+    name_router: str = DEFAULT_NAME_ROUTER,
+    separator: str = DEFAULT_CHILD_SEPARATOR,
+    manifest_path: Optional[Path] = None,
+    required_field_modules: set = REQUIRED_FIELDS_MODULES,
+) -> Result:
+    """
+    Находит модули, импортирует и проверяет их settings и возвращает реестр модулей.
+
+    Роутеры модулей не импортируются, для их загрузки используется load_routers.
+
+    Если передан manifest_path, то при актуальном manifest обход пакетов через
+    pkgutil.walk_packages пропускается. Если manifest отсутствует или устарел,
+    то после импорта settings он перезаписывается.
+
+    Args:
+        root_package (str): Путь для импорта, начинается с корневой директории
+
+        Пример
+        app.bot.modules
+
+        name_settings (str): Имя файла для хранений настроек. По умолчанию DEFAULT_NAME_SETTINGS
+        name_router (str): Имя файла для хранения роутера.По умолчанию DEFAULT_NAME_ROUTER
+        separator (str): Имя для связывания дочернего и родительского модуля
+        manifest_path (Optional[Path]): Путь до manifest модулей. По умолчанию None -
+        manifest не используется
+        required_field_modules (set): Обязательные поля settings модуля
+
+    Returns:
+        Result: содержит в себе
+
+        атрибуты Result:
+            - ok (bool)
+            - data (Optional[ModuleRegistry]): Реестр модулей без роутеров
+            - error: (Optional[Error])
+    """
+    result_import = safe_import(module_package=root_package)
+    if not result_import.ok:
+        return result_import
+
+    package = result_import.data
+
+    entries: Optional[List[ModuleManifestEntry]] = None
+    if manifest_path:
+        entries = load_manifest(
+            path=manifest_path,
+            root_package=root_package,
+            name_settings=name_settings,
+            name_router=name_router,
+            separator=separator,
+        )
+    manifest_miss: bool = entries is None
+
+    if manifest_miss:
+        entries = walk_module_entries(
+            package=package,
+            root_package=root_package,
+            name_settings=name_settings,
+            name_router=name_router,
+            separator=separator,
+        )
+
+    array_modules: List[ModuleInfo] = []
+    for entry in entries:
+        settings_package: str = f"{entry.package}.{name_settings}"
+        result_validate = validate_module(
+            root_package=settings_package,
+            required_field_modules=required_field_modules,
+            name=name_settings,
+            root=True,
+        )
+        if not result_validate.ok:
+            return fail(
+                code=result_validate.error.code,
+                message=f"{settings_package}: {result_validate.error.message}",
+                details=result_validate.error.details,
+            )
+
+        array_modules.append(
+            ModuleInfo(
+                package=entry.package,
+                root=entry.root,
+                parent=entry.parent,
+                settings=sys.modules[settings_package],
+                config=result_validate.data,
             )
         )
-    return ok(data=array_modules)
+
+    if manifest_path and manifest_miss:
+        # Сохраняем manifest после импорта, чтобы учесть созданные __pycache__.
+        # Manifest - необязательный кеш, ошибка записи не должна останавливать запуск
+        try:
+            save_manifest(
+                path=manifest_path,
+                manifest=build_manifest(
+                    entries=entries,
+                    package_paths=package.__path__,
+                    root_package=root_package,
+                    name_settings=name_settings,
+                    name_router=name_router,
+                    separator=separator,
+                ),
+            )
+        except OSError as err:
+            manifest_stats.save_error(
+                reason=f"manifest {manifest_path} не был записан: {err}"
+            )
+    return ok(data=build_module_registry(array_modules))
+
+
+@profiler.profile(phase="load_routers")
+def load_routers(
+    registry: ModuleRegistry,
+    name_router: str = DEFAULT_NAME_ROUTER,
+    logging_data: LoggingData = None,
+    lazy: bool = False,
+    workers: int = 1,
+) -> Result:
+    """
+    Импортирует router для каждого модуля из реестра.
+
+    Роутеры разных корневых модулей могут импортироваться параллельно (workers > 1),
+    роутеры внутри одного корневого модуля импортируются от родительского к дочерним.
+    Время импорта каждого роутера записывается в import_stats.
+
+    Args:
+        registry (ModuleRegistry): Реестр модулей полученный из discover_modules
+        name_router (str): Имя файла для хранения роутера.По умолчанию DEFAULT_NAME_ROUTER
+        logging_data (LoggingData, optional): Обьект класса LoggingData.По умолчанию None
+        lazy (bool, optional): Ленивый режим. Роутеры импортируются только для модулей
+        с EAGER_LOAD = True, остальные загружаются при первом подходящем событии.
+        По умолчанию False
+        workers (int, optional): Количество потоков для импорта. По умолчанию 1 -
+        последовательный импорт
+
+    Returns:
+        Result: содержит в себе
+
+        атрибуты Result:
+            - ok (bool)
+            - data (Optional[ModuleRegistry]): Новый реестр модулей с роутерами
+            - error: (Optional[Error])
+    """
+    # Группируем модули по корневому модулю: родительский модуль раньше дочерних
+    groups: Dict[str, List[str]] = {}
+    for module in sorted(registry, key=lambda m: m.module_depth):
+        if lazy and not is_eager_module(module):
+            continue
+        groups.setdefault(module.root, []).append(f"{module.package}.{name_router}")
+
+    result_import = import_modules(
+        groups=list(groups.values()),
+        max_workers=workers,
+        logging_data=logging_data,
+    )
+    if not result_import.ok:
+        return result_import
+
+    imported: Dict = result_import.data
+    array_modules: List[ModuleInfo] = [
+        replace(module, router=imported[f"{module.package}.{name_router}"])
+        if f"{module.package}.{name_router}" in imported
+        else module
+        for module in registry
+    ]
+    return ok(data=build_module_registry(array_modules))
+
+
+def load_modules(
+    root_package: str,
+    name_settings: str = DEFAULT_NAME_SETTINGS,
+    name_router: str = DEFAULT_NAME_ROUTER,
+    separator: str = DEFAULT_CHILD_SEPARATOR,
+    manifest_path: Optional[Path] = None,
+) -> Result:
+    """
+    Проходится по модулям и возвращает обьект ModuleInfo c собранными
+    данными
+
+    Обьединяет discover_modules и load_routers.
+
+    Args:
+        root_package (str): Путь для импорта, начинается с корневой директории
+
+        Пример
+        app.bot.modules
+
+        name_settings (str): Имя файла для хранений настроек. По умолчанию DEFAULT_NAME_SETTINGS
+        name_router (str): Имя файла для хранения роутера.По умолчанию DEFAULT_NAME_ROUTER
+
+        separator (str): Имя для связывания дочернего и родительского модуля
+
+        Имя папки для хранения дочерних модулей, формирования имен в settings,
+        формирования имени роутера
+
+        manifest_path (Optional[Path]): Путь до manifest модулей. По умолчанию None -
+        manifest не используется
+
+    Returns:
+        List[ModuleInfo]: обьект содержащий в себе
+
+        Атрибуты ModuleInfo]:
+            - package (str): Путь для импорта модуля
+            - root (str): Имя корневого роутера
+            - settings (ModuleType): Модуль с настройками
+            - router (ModuleType): Модуль router
+            - parent (str | None): Имя корневого роутера если дочерний если корневой то
+            None
+            - config (object): Обьект настроек из модуля settings
+
+    """
+    result_discover = discover_modules(
+        root_package=root_package,
+        name_settings=name_settings,
+        name_router=name_router,
+        separator=separator,
+        manifest_path=manifest_path,
+    )
+    if not result_discover.ok:
+        return result_discover
+
+    result_routers = load_routers(
+        registry=result_discover.data,
+        name_router=name_router,
+    )
+    if not result_routers.ok:
+        return result_routers
+
+    return ok(data=list(result_routers.data.modules))
+
+
+def rebuild_modules_manifest(
+    manifest_path: Path,
+    root_package: str,
+    name_settings: str = DEFAULT_NAME_SETTINGS,
+    name_router: str = DEFAULT_NAME_ROUTER,
+    separator: str = DEFAULT_CHILD_SEPARATOR,
+) -> Result:
+    """
+    Заново обходит пакет с модулями и перезаписывает manifest модулей.
+
+    Args:
+        manifest_path (Path): Путь до manifest модулей
+        root_package (str): Путь для импорта, начинается с корневой директории
+
+        Пример
+        app.bot.modules
+
+        name_settings (str): Имя файла для хранений настроек. По умолчанию DEFAULT_NAME_SETTINGS
+        name_router (str): Имя файла для хранения роутера.По умолчанию DEFAULT_NAME_ROUTER
+        separator (str): Имя для связывания дочернего и родительского модуля
+
+    Returns:
+        Result: содержит в себе
+
+        атрибуты Result:
+            - ok (bool)
+            - data (Optional[Any]): Количество модулей записанных в manifest
+            - error: (Optional[Error])
+    """
+    result_import = safe_import(module_package=root_package)
+    if not result_import.ok:
+        return result_import
+
+    package = result_import.data
+    entries: List[ModuleManifestEntry] = walk_module_entries(
+        package=package,
+        root_package=root_package,
+        name_settings=name_settings,
+        name_router=name_router,
+        separator=separator,
+    )
+    try:
+        save_manifest(
+            path=manifest_path,
+            manifest=build_manifest(
+                entries=entries,
+                package_paths=package.__path__,
+                root_package=root_package,
+                name_settings=name_settings,
+                name_router=name_router,
+                separator=separator,
+            ),
+        )
+    except OSError as err:
+        return fail(
+            code="MANIFEST ERROR",
+            message=f"Manifest {manifest_path} не был записан\n{err}",
+        )
+    manifest_stats.rebuilds += 1
+    return ok(data=len(entries))
 
 
 def get_child_modules_settings_inline_data(
@@ -0,0 +1,248 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Iterable
+from pathlib import Path
+import json
+import os
+
+from core.paths.paths import SRC_DIR
+from core.response.modules_loader import ModuleManifestEntry
+from core.contracts.constants import (
+    DEFAULT_CHILD_SEPARATOR,
+    DEFAULT_NAME_ROUTER,
+    DEFAULT_NAME_SETTINGS,
+)
+
+
+MANIFEST_VERSION: int = 2
+
+
+@dataclass
+class ManifestStats:
+    """Счетчики использования manifest модулей."""
+
+    hits: int = 0
+    misses: int = 0
+    rebuilds: int = 0
+    save_errors: int = 0
+    last_status: Optional[str] = None
+    last_reason: Optional[str] = None
+
+    def hit(self) -> None:
+        self.hits += 1
+        self.last_status = "hit"
+        self.last_reason = None
+
+    def miss(self, reason: str) -> None:
+        self.misses += 1
+        self.last_status = "miss"
+        self.last_reason = reason
+
+    def save_error(self, reason: str) -> None:
+        self.save_errors += 1
+        self.last_status = "save error"
+        self.last_reason = reason
+
+
+manifest_stats: ManifestStats = ManifestStats()
+
+
+def _file_signature(path: str) -> List[int]:
+    """Возвращает подпись файла [mtime_ns, size] на основе stat."""
+    stat_result = os.stat(path)
+    return [stat_result.st_mtime_ns, stat_result.st_size]
+
+
+def _directory_signature(path: str) -> int:
+    """Возвращает подпись директории(mtime_ns) на основе stat."""
+    return os.stat(path).st_mtime_ns
+
+
+def _to_relative(path: str, base_dir: Path) -> str:
+    """Возвращает путь относительно base_dir для записи в manifest."""
+    return os.path.relpath(path, base_dir)
+
+
+def _to_absolute(path: str, base_dir: Path) -> str:
+    """Восстанавливает абсолютный путь из записи manifest."""
+    return os.path.normpath(os.path.join(base_dir, path))
+
+
+def get_watched_directories(
+    package_paths: Iterable[str],
+    entries: Iterable[ModuleManifestEntry],
+    separator: str = DEFAULT_CHILD_SEPARATOR,
+) -> List[str]:
+    """
+    Возвращает список директорий, изменение которых означает добавление или
+    удаление модулей.
+
+    Отслеживаются корневые директории пакета с модулями и папки дочерних модулей.
+    Если у модуля нет папки дочерних модулей отслеживается папка самого модуля.
+
+    Args:
+        package_paths (Iterable[str]): Пути корневого пакета(package.__path__)
+        entries (Iterable[ModuleManifestEntry]): Записи о модулях
+        separator (str): Имя папки для хранения дочерних модулей
+
+    Returns:
+        List[str]: Список путей до директорий
+    """
+    directories: List[str] = [str(Path(path)) for path in package_paths]
+    for entry in entries:
+        module_dir: Path = Path(entry.settings_path).parent
+        childes_dir: Path = module_dir / separator
+        directories.append(
+            str(childes_dir) if childes_dir.is_dir() else str(module_dir)
+        )
+    return sorted(set(directories))
+
+
+def build_manifest(
+    entries: List[ModuleManifestEntry],
+    package_paths: Iterable[str],
+    root_package: str,
+    name_settings: str = DEFAULT_NAME_SETTINGS,
+    name_router: str = DEFAULT_NAME_ROUTER,
+    separator: str = DEFAULT_CHILD_SEPARATOR,
+    base_dir: Path = SRC_DIR,
+) -> Dict:
+    """
+    Формирует manifest модулей.
+
+    Пути записываются относительно base_dir, поэтому перенос checkout в другую
+    директорию не делает manifest устаревшим.
+
+    Args:
+        entries (List[ModuleManifestEntry]): Записи о найденных модулях
+        package_paths (Iterable[str]): Пути корневого пакета(package.__path__)
+        root_package (str): Путь для импорта корневого пакета
+
+        Пример
+        app.bot.modules
+
+        name_settings (str): Имя файла для хранений настроек
+        name_router (str): Имя файла для хранения роутера
+        separator (str): Имя для связывания дочернего и родительского модуля
+        base_dir (Path): Директория относительно которой записываются пути.
+        По умолчанию SRC_DIR
+
+    Returns:
+        Dict: manifest готовый для записи в JSON
+    """
+    files: Dict[str, List[int]] = {}
+    for entry in entries:
+        for file in (entry.settings_path, entry.router_path):
+            files[_to_relative(file, base_dir)] = _file_signature(file)
+
+    directories: Dict[str, int] = {
+        _to_relative(directory, base_dir): _directory_signature(directory)
+        for directory in get_watched_directories(
+            package_paths=package_paths,
+            entries=entries,
+            separator=separator,
+        )
+    }
+
+    return {
+        "version": MANIFEST_VERSION,
+        "root_package": root_package,
+        "name_settings": name_settings,
+        "name_router": name_router,
+        "separator": separator,
+        "directories": directories,
+        "files": files,
+        "modules": [
+            dict(
+                asdict(entry),
+                settings_path=_to_relative(entry.settings_path, base_dir),
+                router_path=_to_relative(entry.router_path, base_dir),
+            )
+            for entry in entries
+        ],
+    }
+
+
+def save_manifest(path: Path, manifest: Dict) -> None:
+    """Атомарно записывает manifest модулей по указанному пути."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path: Path = path.with_name(f"{path.name}.tmp")
+    temp_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def load_manifest(
+    path: Path,
+    root_package: str,
+    name_settings: str = DEFAULT_NAME_SETTINGS,
+    name_router: str = DEFAULT_NAME_ROUTER,
+    separator: str = DEFAULT_CHILD_SEPARATOR,
+    base_dir: Path = SRC_DIR,
+) -> Optional[List[ModuleManifestEntry]]:
+    """
+    Загружает manifest модулей и проверяет его актуальность.
+
+    Проверка выполняется только через stat файлов и директорий, без импорта модулей.
+    Результат проверки записывается в manifest_stats.
+
+    Args:
+        path (Path): Путь до файла manifest
+        root_package (str): Путь для импорта корневого пакета
+        name_settings (str): Имя файла для хранений настроек
+        name_router (str): Имя файла для хранения роутера
+        separator (str): Имя для связывания дочернего и родительского модуля
+        base_dir (Path): Директория относительно которой записаны пути.
+        По умолчанию SRC_DIR
+
+    Returns:
+        Optional[List[ModuleManifestEntry]]: Список записей о модулях или None если
+        manifest отсутствует или устарел
+    """
+    try:
+        manifest: Dict = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        manifest_stats.miss(reason="manifest not found")
+        return None
+    except (OSError, ValueError) as err:
+        manifest_stats.miss(reason=f"manifest unreadable: {err}")
+        return None
+
+    expected: Dict = {
+        "version": MANIFEST_VERSION,
+        "root_package": root_package,
+        "name_settings": name_settings,
+        "name_router": name_router,
+        "separator": separator,
+    }
+    for key, value in expected.items():
+        if manifest.get(key) != value:
+            manifest_stats.miss(reason=f"{key} changed")
+            return None
+
+    try:
+        for directory, signature in manifest["directories"].items():
+            if _directory_signature(_to_absolute(directory, base_dir)) != signature:
+                manifest_stats.miss(reason=f"directory changed: {directory}")
+                return None
+        for file, signature in manifest["files"].items():
+            if _file_signature(_to_absolute(file, base_dir)) != signature:
+                manifest_stats.miss(reason=f"file changed: {file}")
+                return None
+        entries: List[ModuleManifestEntry] = [
+            ModuleManifestEntry(
+                **dict(
+                    data,
+                    settings_path=_to_absolute(data["settings_path"], base_dir),
+                    router_path=_to_absolute(data["router_path"], base_dir),
+                )
+            )
+            for data in manifest["modules"]
+        ]
+    except FileNotFoundError as err:
+        manifest_stats.miss(reason=f"path removed: {err.filename}")
+        return None
+    except (KeyError, TypeError, AttributeError) as err:
+        manifest_stats.miss(reason=f"manifest invalid: {err}")
+        return None
+
+    manifest_stats.hit()
+    return entries
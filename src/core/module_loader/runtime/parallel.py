@@ -0,0 +1,154 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+from types import ModuleType
+import importlib
+import time
+
+from core.response.response_data import LoggingData, Result
+from core.error_handlers.helpers import import_fail, ok, safe_import
+from core.profiling.startup import profiler
+
+# Взаимная блокировка импорта из разных потоков. _DeadlockError - внутренний класс
+# importlib(наследник RuntimeError), поэтому при его отсутствии ловится RuntimeError
+IMPORT_DEADLOCK_ERROR: Type[Exception] = getattr(
+    importlib._bootstrap, "_DeadlockError", RuntimeError
+)
+
+
+@dataclass
+class ImportStats:
+    """Время импорта модулей при старте."""
+
+    mode: str = "sequential"
+    workers: int = 1
+    total: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    retried: List[str] = field(default_factory=list)
+
+    def slowest(self, count: int = 10) -> List[Tuple[str, float]]:
+        """Возвращает самые долгие импорты."""
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)[
+            :count
+        ]
+
+
+import_stats: ImportStats = ImportStats()
+
+
+def _import_group(
+    group: Sequence[str],
+    logging_data: LoggingData = None,
+) -> Tuple[Dict[str, ModuleType], Dict[str, float], List[str], Optional[Result]]:
+    """
+    Последовательно импортирует группу модулей в одном потоке.
+
+    При взаимной блокировке импорта(_DeadlockError) оставшиеся модули группы
+    возвращаются для последовательного импорта после пула. При любой другой
+    ошибке импорт группы прекращается и возвращается ошибка - модуль повторно
+    не импортируется, чтобы не выполнять его код дважды.
+    """
+    modules: Dict[str, ModuleType] = {}
+    timings: Dict[str, float] = {}
+    for index, module_package in enumerate(group):
+        start: float = time.perf_counter()
+        try:
+            with profiler.measure(phase="safe_import", name=module_package):
+                modules[module_package] = importlib.import_module(module_package)
+        except IMPORT_DEADLOCK_ERROR:
+            return modules, timings, list(group[index:]), None
+        except Exception as err:
+            return (
+                modules,
+                timings,
+                [],
+                import_fail(
+                    module_package=module_package,
+                    err=err,
+                    logging_data=logging_data,
+                ),
+            )
+        timings[module_package] = time.perf_counter() - start
+    return modules, timings, [], None
+
+
+def import_modules(
+    groups: Sequence[Sequence[str]],
+    max_workers: int = 1,
+    logging_data: LoggingData = None,
+) -> Result:
+    """
+    Импортирует группы модулей, параллельно если max_workers > 1.
+
+    Модули внутри группы импортируются последовательно в переданном порядке
+    (родительский модуль раньше дочерних), разные группы - в пуле потоков.
+    Модули, импорт которых в пуле остановила взаимная блокировка импорта,
+    импортируются последовательно после завершения пула. Ошибка импорта
+    в пуле возвращается сразу, без повторного импорта.
+
+    Время импорта каждого модуля записывается в import_stats и в profiler.
+
+    Args:
+        groups (Sequence[Sequence[str]]): Группы путей для импорта
+
+        Пример:
+        [["app.bot.modules.video.router", "app.bot.modules.video.childes.data.router"]]
+
+        max_workers (int, optional): Количество потоков. По умолчанию 1 - последовательно
+        logging_data (LoggingData, optional): Обьект класса LoggingData.По умолчанию None
+
+    Returns:
+        Result: содержит в себе
+
+        атрибуты Result:
+            - ok (bool)
+            - data (Optional[Dict[str, ModuleType]]): Импортированные модули по пути
+            - error: (Optional[Error])
+    """
+    start: float = time.perf_counter()
+    modules: Dict[str, ModuleType] = {}
+    pending: List[str] = []
+
+    parallel: bool = max_workers > 1 and len(groups) > 1
+    import_stats.mode = "parallel" if parallel else "sequential"
+    import_stats.workers = min(max_workers, len(groups)) if parallel else 1
+
+    if parallel:
+        failures: List[Result] = []
+        with ThreadPoolExecutor(
+            max_workers=import_stats.workers,
+            thread_name_prefix="module_import",
+        ) as executor:
+            for group_modules, timings, deadlocked, failure in executor.map(
+                lambda group: _import_group(group=group, logging_data=logging_data),
+                groups,
+            ):
+                modules.update(group_modules)
+                import_stats.timings.update(timings)
+                pending.extend(deadlocked)
+                if failure is not None:
+                    failures.append(failure)
+        if failures:
+            return failures[0]
+        import_stats.retried.extend(pending)
+    else:
+        pending = [module_package for group in groups for module_package in group]
+
+    for module_package in pending:
+        module_start: float = time.perf_counter()
+        result_import = safe_import(
+            module_package=module_package,
+            logging_data=logging_data,
+        )
+        if not result_import.ok:
+            return result_import
+        modules[module_package] = result_import.data
+        import_stats.timings[module_package] = time.perf_counter() - module_start
+
+    import_stats.total = time.perf_counter() - start
+    if logging_data and parallel and pending:
+        logging_data.warning_logger.warning(
+            "[IMPORT] После взаимной блокировки импорта последовательно "
+            "импортированы: " + ", ".join(pending)
+        )
+    return ok(data=modules)
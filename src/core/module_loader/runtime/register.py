@@ -1,24 +1,48 @@
-from typing import List, Dict
+from typing import List, Dict, Union
 
 from core.response.modules_loader import ModuleInfo
+from core.module_loader.runtime.registry import ModuleRegistry, build_module_registry
+from core.module_loader.runtime.lazy import LazyRouter, lazy_stats
 from core.response.response_data import LoggingData
 from core.contracts.constants import DEFAULT_NAME_ROUTER
+from core.profiling.startup import profiler
 
 
+def get_module_router(
+    module: ModuleInfo,
+    logging_data: LoggingData,
+    name: str = DEFAULT_NAME_ROUTER,
+) -> object:
+    """
+    Возвращает роутер модуля.
+
+    Если роутер модуля не был импортирован, возвращает LazyRouter, который
+    импортирует его при первом подходящем событии.
+    """
+    if module.router is not None:
+        return getattr(module.router, name)
+
+    lazy_stats.deferred += 1
+    return LazyRouter(module=module, name_router=name, logging_data=logging_data)
+
+
+@profiler.profile(phase="register_module")
 def register_module(
     dp: object,
-    modules: List[ModuleInfo],
+    modules: Union[ModuleRegistry, List[ModuleInfo]],
     logging_data: LoggingData,
     name: str = DEFAULT_NAME_ROUTER,
-) -> None:
+) -> Dict[str, object]:
     """
     Подключает к диспетчеру переданные роутеры.
 
+    Для модулей без импортированного роутера подключается LazyRouter.
+
 
     Args:
         dp (Dispatcher): Диспетчер aiogram
-        modules (List[ModuleInfo]): Список содержащий в себе обьект класса ModuleInfo
-        для подключения router
+        modules (Union[ModuleRegistry, List[ModuleInfo]]): Реестр модулей или список
+        содержащий в себе обьект класса ModuleInfo для подключения router
         logging_data (LoggingData): Обьект класса LoggingData
 
         атрибуты LoggingData:
@@ -30,13 +54,16 @@ def register_module(
         
         name (str): Имя переменной для роутера
 
+    Returns:
+        Dict[str, object]: Подключенный роутер(или LazyRouter) по пути импорта модуля
     """
 
-    root: List[ModuleInfo] = sorted(
-        [m for m in modules if m.is_root], key=lambda m: m.root
-    )
+    if not isinstance(modules, ModuleRegistry):
+        modules = build_module_registry(modules)
+
+    root: List[ModuleInfo] = sorted(modules.roots, key=lambda m: m.root)
     children: List[ModuleInfo] = sorted(
-        [m for m in modules if not m.is_root], key=lambda m: m.module_depth
+        modules.children, key=lambda m: m.module_depth
     )
     children = sorted(
         children,
@@ -44,10 +71,11 @@ def register_module(
     )
 
     root_map: Dict = {}
+    routers: Dict[str, object] = {}
 
     for mod in root:
-        router = mod.router
-        root_router = getattr(router, name)
+        root_router = get_module_router(module=mod, logging_data=logging_data, name=name)
+        routers[mod.package] = root_router
         dp.include_router(router=root_router)
         root_map[mod.root] = root_router
         logging_data.info_logger.info(
@@ -59,9 +87,13 @@ def register_module(
         if not parent_router:
             continue
         
-        router = mod.router
-        child_router = getattr(router, name)
+        child_router = get_module_router(
+            module=mod, logging_data=logging_data, name=name
+        )
+        routers[mod.package] = child_router
         parent_router.include_router(child_router)
         logging_data.info_logger.info(
             f"\n[Auto] Child router inculded into {parent_router}: {child_router}",
         )
+
+    return routers
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from core.response.modules_loader import ModuleInfo
+
+
+@dataclass(frozen=True)
+class ModuleRegistry:
+    """
+    Неизменяемый реестр модулей с индексами.
+
+    Атрибуты:
+        - modules (Tuple[ModuleInfo, ...]): Модули в порядке обнаружения
+        - by_package (Mapping[str, ModuleInfo]): Модуль по пути импорта
+        - by_root (Mapping[str, Tuple[ModuleInfo, ...]]): Все модули корневого модуля,
+        включая сам корневой модуль
+        - by_parent (Mapping[str, Tuple[ModuleInfo, ...]]): Дочерние модули по имени
+        родительского модуля
+        - by_depth (Mapping[int, Tuple[ModuleInfo, ...]]): Модули по глубине вложенности
+    """
+
+    modules: Tuple[ModuleInfo, ...]
+    by_package: Mapping[str, ModuleInfo]
+    by_root: Mapping[str, Tuple[ModuleInfo, ...]]
+    by_parent: Mapping[str, Tuple[ModuleInfo, ...]]
+    by_depth: Mapping[int, Tuple[ModuleInfo, ...]]
+
+    @property
+    def roots(self) -> Tuple[ModuleInfo, ...]:
+        return self.by_depth.get(0, ())
+
+    @property
+    def children(self) -> Tuple[ModuleInfo, ...]:
+        return tuple(module for module in self.modules if not module.is_root)
+
+    def get(self, package: str) -> Optional[ModuleInfo]:
+        return self.by_package.get(package)
+
+    def __iter__(self) -> Iterator[ModuleInfo]:
+        return iter(self.modules)
+
+    def __len__(self) -> int:
+        return len(self.modules)
+
+
+def _freeze_index(index: Dict) -> Mapping:
+    return MappingProxyType({key: tuple(value) for key, value in index.items()})
+
+
+def build_module_registry(modules: Iterable[ModuleInfo]) -> ModuleRegistry:
+    """
+    Формирует неизменяемый реестр модулей за один проход.
+
+    Args:
+        modules (Iterable[ModuleInfo]): Модули в порядке обнаружения
+
+    Returns:
+        ModuleRegistry: Реестр модулей с индексами
+    """
+    array_modules: Tuple[ModuleInfo, ...] = tuple(modules)
+
+    by_package: Dict[str, ModuleInfo] = {}
+    by_root: Dict[str, List[ModuleInfo]] = {}
+    by_parent: Dict[str, List[ModuleInfo]] = {}
+    by_depth: Dict[int, List[ModuleInfo]] = {}
+
+    for module in array_modules:
+        by_package[module.package] = module
+        by_root.setdefault(module.root, []).append(module)
+        if module.parent is not None:
+            by_parent.setdefault(module.parent, []).append(module)
+        by_depth.setdefault(module.module_depth, []).append(module)
+
+    return ModuleRegistry(
+        modules=array_modules,
+        by_package=MappingProxyType(by_package),
+        by_root=_freeze_index(by_root),
+        by_parent=_freeze_index(by_parent),
+        by_depth=_freeze_index(by_depth),
+    )
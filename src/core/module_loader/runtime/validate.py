@@ -7,8 +7,10 @@ from core.contracts.module import REQUIRED_FIELDS_MODULES
 from core.response.response_data import Result
 from core.error_handlers.helpers import ok, fail
 from core.error_handlers.helpers import safe_import
+from core.profiling.startup import profiler
 
 
+@profiler.profile(phase="validate_module", arg="root_package")
 def validate_module(
     root_package: str,
     required_field_modules: set = REQUIRED_FIELDS_MODULES,
@@ -0,0 +1,195 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterator, List, Optional
+from pathlib import Path
+import functools
+import json
+import time
+import tracemalloc
+
+
+@dataclass
+class ProfileRecord:
+    """Запись профилировщика о выполнении одной фазы."""
+
+    phase: str
+    name: Optional[str]
+    duration: float
+    memory_delta: int
+    depth: int
+
+
+class StartupProfiler:
+    """
+    Профилировщик запуска приложения.
+
+    Пока профилировщик выключен, обернутые функции вызываются без замеров.
+    Память считается через tracemalloc, поэтому в режиме профилирования
+    запуск заметно медленнее. Вложенность замеров хранится в ContextVar, поэтому
+    замеры из разных потоков и задач asyncio не влияют на depth друг друга.
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.records: List[ProfileRecord] = []
+        self._depth: ContextVar[int] = ContextVar("startup_profiler_depth", default=0)
+        self._started_tracemalloc: bool = False
+        self._start: float = 0.0
+        self._total: float = 0.0
+
+    def enable(self, trace_memory: bool = True) -> None:
+        """Включает профилировщик и очищает прошлые записи."""
+        self.records = []
+        self._depth.set(0)
+        self._start = time.perf_counter()
+        self._total = 0.0
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Выключает профилировщик."""
+        if not self.enabled:
+            return
+        self._total = time.perf_counter() - self._start
+        self.enabled = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @staticmethod
+    def _memory() -> int:
+        return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+    @contextmanager
+    def measure(self, phase: str, name: Optional[str] = None) -> Iterator[None]:
+        """
+        Замеряет время и изменение памяти блока кода.
+
+        Args:
+            phase (str): Имя фазы
+
+            Пример:
+            safe_import
+
+            name (Optional[str]): Имя модуля или обьекта фазы
+        """
+        if not self.enabled:
+            yield
+            return
+
+        depth: int = self._depth.get()
+        self._depth.set(depth + 1)
+        memory_before: int = self._memory()
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth.set(depth)
+            self.records.append(
+                ProfileRecord(
+                    phase=phase,
+                    name=name,
+                    duration=time.perf_counter() - start,
+                    memory_delta=self._memory() - memory_before,
+                    depth=depth,
+                )
+            )
+
+    def profile(
+        self,
+        phase: str,
+        arg: Optional[str] = None,
+        position: int = 0,
+    ) -> Callable:
+        """
+        Декоратор для замера функции как фазы запуска.
+
+        Args:
+            phase (str): Имя фазы
+            arg (Optional[str]): Имя аргумента функции, значение которого будет именем
+            записи
+            position (int): Позиция аргумента arg, если он передан позиционно
+        """
+
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+
+                name = None
+                if arg:
+                    name = kwargs.get(arg)
+                    if name is None and len(args) > position:
+                        name = args[position]
+                with self.measure(phase=phase, name=str(name) if name else None):
+                    return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def report(self) -> Dict:
+        """Возвращает отчет профилировщика в виде словаря."""
+        phases: Dict[str, Dict] = {}
+        modules: Dict[str, Dict] = {}
+        for record in self.records:
+            phase = phases.setdefault(
+                record.phase, {"count": 0, "duration": 0.0, "memory_delta": 0}
+            )
+            phase["count"] += 1
+            phase["duration"] += record.duration
+            phase["memory_delta"] += record.memory_delta
+
+            if record.name:
+                module = modules.setdefault(record.name, {})
+                module_phase = module.setdefault(
+                    record.phase, {"duration": 0.0, "memory_delta": 0}
+                )
+                module_phase["duration"] += record.duration
+                module_phase["memory_delta"] += record.memory_delta
+
+        total: float = self._total if not self.enabled else time.perf_counter() - self._start
+        return {
+            "total": total,
+            "phases": phases,
+            "modules": modules,
+            "records": [asdict(record) for record in self.records],
+        }
+
+    def save_report(self, path: Path) -> Path:
+        """Записывает отчет профилировщика в JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.report(), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        return path
+
+    def format_report(self, count: int = 15) -> str:
+        """Возвращает отчет профилировщика в виде текста."""
+        report: Dict = self.report()
+        lines: List[str] = [f"Запуск: {report['total']:.3f} c", "", "Фазы:"]
+        for phase, data in sorted(
+            report["phases"].items(), key=lambda item: item[1]["duration"], reverse=True
+        ):
+            lines.append(
+                f"  {phase:<24} {data['duration']:>8.3f} c  "
+                f"{data['memory_delta'] / 1024:>10.1f} KiB  x{data['count']}"
+            )
+
+        lines.extend(["", f"Самые долгие записи(top {count}):"])
+        for record in sorted(self.records, key=lambda r: r.duration, reverse=True)[
+            :count
+        ]:
+            lines.append(
+                f"  {record.duration:>8.3f} c  {record.memory_delta / 1024:>10.1f} KiB  "
+                f"{record.phase}: {record.name or '-'}"
+            )
+        return "\n".join(lines)
+
+
+profiler: StartupProfiler = StartupProfiler()
@@ -21,6 +21,8 @@ class DefaultMessages(BaseModel):
     UNKNOWN_STATUS_ERROR: str = "🚫 Сайт вернул неожиданный ответ."
     SERVER_ERROR: str = "⚙️ Внутренняя ошибка сервера."
     TIMEOUT_ERROR: str = "⌛ Сервер не ответил вовремя."
+    RATE_LIMIT_ERROR: str = "🚦 Сайт ограничил частоту запросов. Попробуйте позже."
+    FILE_TOO_LARGE_ERROR: str = "📦 Файл превышает допустимый размер."
 
     # Сообщения при обработках запроса пользователя
     TRY_REPSONSE_MESSAGE: str = "👣 Попробуйте, снова, сделать запрос..."
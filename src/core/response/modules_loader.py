@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Any
 from types import ModuleType
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModuleInfo:
     """Модель для хранения роутера и settings модуля."""
 
@@ -11,8 +11,9 @@ class ModuleInfo:
     root: str
     parent: Optional[str]
 
-    router: ModuleType
     settings: ModuleType
+    router: Optional[ModuleType] = None
+    config: Optional[Any] = None
 
     @property
     def is_root(self):
@@ -25,3 +26,15 @@ class ModuleInfo:
     @property
     def module_depth(self):
         return self.package.count(".childes.")
+
+
+@dataclass(frozen=True)
+class ModuleManifestEntry:
+    """Модель для хранения записи о модуле в manifest модулей."""
+
+    package: str
+    root: str
+    parent: Optional[str]
+
+    settings_path: str
+    router_path: str
@@ -1,28 +1,63 @@
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Mapping, Iterable, Tuple, Type, Union
 from dataclasses import dataclass
 from logging import Logger
+from pathlib import Path
 
+from multidict import CIMultiDict, CIMultiDictProxy
 from pydantic import BaseModel
 
 
-class Error(BaseModel):
-    """Модель для ошибок"""
+class _SlotsResult:
+    """
+    Базовый класс легких моделей результата.
+
+    Модели создаются на каждый вызов ok, fail, network_ok и network_fail, поэтому
+    используют __slots__ без валидации pydantic. model_dump и to_model сохраняют
+    совместимость с pydantic.
+    """
+
+    __slots__ = ()
+    _model: Type[BaseModel]
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Возвращает словарь полей, вложенная ошибка - тоже словарь."""
+        return {
+            name: value.model_dump() if isinstance(value, _SlotsResult) else value
+            for name, value in ((name, getattr(self, name)) for name in self.__slots__)
+        }
+
+    def to_model(self) -> BaseModel:
+        """Возвращает pydantic модель с валидацией полей."""
+        return self._model.model_validate(self.model_dump())
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields: str = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class ErrorModel(BaseModel):
+    """Pydantic модель ошибки для экспорта."""
 
     code: str
     message: str
     details: Optional[Any] = None
 
 
-class Result(BaseModel):
-    """Модель для ответа."""
+class ResultModel(BaseModel):
+    """Pydantic модель ответа для экспорта."""
 
     ok: bool
     data: Optional[Any] = None
-    error: Optional[Error] = None
+    error: Optional[ErrorModel] = None
 
 
-class NetworkResponseResult(BaseModel):
-    """Модель для сетевого ответа."""
+class NetworkResponseResultModel(BaseModel):
+    """Pydantic модель сетевого ответа для экспорта."""
 
     ok: bool
     data: Optional[Any] = None
@@ -30,7 +65,93 @@ class NetworkResponseResult(BaseModel):
     status: int
     method: str
     headers: Optional[Dict] = None
-    error: Optional[Error] = None
+    error: Optional[ErrorModel] = None
+
+
+class Error(_SlotsResult):
+    """Модель для ошибок"""
+
+    __slots__ = ("code", "message", "details")
+    _model = ErrorModel
+
+    def __init__(self, *, code: str, message: str, details: Optional[Any] = None) -> None:
+        self.code: str = code
+        self.message: str = message
+        self.details: Optional[Any] = details
+
+
+class Result(_SlotsResult):
+    """Модель для ответа."""
+
+    __slots__ = ("ok", "data", "error")
+    _model = ResultModel
+
+    def __init__(
+        self,
+        *,
+        ok: bool,
+        data: Optional[Any] = None,
+        error: Optional[Error] = None,
+    ) -> None:
+        self.ok: bool = ok
+        self.data: Optional[Any] = data
+        self.error: Optional[Error] = error
+
+
+Headers = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
+
+
+class NetworkResponseResult(_SlotsResult):
+    """
+    Модель для сетевого ответа.
+
+    Заголовки всегда хранятся как CIMultiDictProxy - как у ответа aiohttp: поиск
+    без учета регистра, повторяющиеся заголовки сохраняются. Заголовки ответа
+    aiohttp используются без копирования, остальные(dict, список пар из кэша)
+    приводятся к CIMultiDictProxy при создании.
+    """
+
+    __slots__ = ("ok", "data", "url", "status", "method", "headers", "error")
+    _model = NetworkResponseResultModel
+
+    def __init__(
+        self,
+        *,
+        ok: bool,
+        url: str,
+        status: int,
+        method: str,
+        data: Optional[Any] = None,
+        headers: Optional[Headers] = None,
+        error: Optional[Error] = None,
+    ) -> None:
+        self.ok: bool = ok
+        self.data: Optional[Any] = data
+        self.url: str = url
+        self.status: int = status
+        self.method: str = method
+        if headers is not None and not isinstance(headers, CIMultiDictProxy):
+            headers = CIMultiDictProxy(CIMultiDict(headers))
+        self.headers: Optional[CIMultiDictProxy] = headers
+        self.error: Optional[Error] = error
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Возвращает словарь полей, заголовки - обычный dict."""
+        data: Dict[str, Any] = super().model_dump()
+        if self.headers is not None:
+            data["headers"] = dict(self.headers)
+        return data
+
+    def __reduce__(self):
+        # CIMultiDictProxy не сериализуется pickle, заголовки передаются списком пар
+        fields: Dict[str, Any] = {name: getattr(self, name) for name in self.__slots__}
+        if self.headers is not None:
+            fields["headers"] = list(self.headers.items())
+        return _restore_network_result, (fields,)
+
+
+def _restore_network_result(fields: Dict[str, Any]) -> NetworkResponseResult:
+    return NetworkResponseResult(**fields)
 
 
 @dataclass
@@ -44,6 +165,47 @@ class LoggingData:
     router_name: str
 
 
+@dataclass
+class DownloadData:
+    """Модель для скачанного на диск файла."""
+
+    path: Path
+    size: int
+    duration: float
+
+    @property
+    def speed(self) -> float:
+        """Скорость скачивания в байтах в секунду."""
+        return self.size / self.duration if self.duration else float(self.size)
+
+
+@dataclass
+class CleanupData:
+    """Модель для результата удаления файлов."""
+
+    files: int = 0
+    dirs: int = 0
+    bytes: int = 0
+    errors: int = 0
+
+    def merge(self, other: "CleanupData") -> None:
+        """Добавляет результат другого удаления."""
+        self.files += other.files
+        self.dirs += other.dirs
+        self.bytes += other.bytes
+        self.errors += other.errors
+
+
+@dataclass
+class ArchiveData:
+    """Модель для созданного архива."""
+
+    parts: List[Path]  # Части архива, каждая - отдельный zip
+    size: int
+    files: int
+    duration: float
+
+
 @dataclass
 class InlineKeyboardData:
     """Модель для инлайн клавиатуры."""
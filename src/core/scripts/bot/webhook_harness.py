@@ -0,0 +1,103 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import asyncio
+import time
+
+import aiohttp
+
+
+@dataclass
+class WebhookHarnessStats:
+    """Результат отправки синтетических апдейтов."""
+
+    sent: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    errors: int = 0
+    duration: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Апдейтов в секунду."""
+        return self.sent / self.duration if self.duration else 0.0
+
+    @property
+    def p95(self) -> float:
+        """95 перцентиль времени ответа в секундах."""
+        if not self.latencies:
+            return 0.0
+        latencies: List[float] = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+
+def make_synthetic_update(update_id: int, chat_id: int = 1, text: str = "/start") -> Dict:
+    """Создает апдейт с текстовым сообщением в формате Telegram Bot API."""
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "Test"},
+            "text": text,
+        },
+    }
+
+
+async def post_synthetic_updates(
+    url: str,
+    secret_token: Optional[str] = None,
+    count: int = 100,
+    concurrency: int = 10,
+    text: str = "/start",
+) -> WebhookHarnessStats:
+    """
+    Отправляет синтетические апдейты на локальный webhook сервер.
+
+    Апдейты приходят от разных чатов(chat_id = update_id), чтобы не упираться в
+    ограничения одного чата. Хендлеры бота отвечают на апдейты через Bot API,
+    поэтому сервер должен работать с токеном тестового бота: ответы уходят в
+    несуществующие или чужие чаты и завершаются ошибками Telegram.
+
+    Args:
+        url (str): Адрес webhook
+
+        Пример:
+        http://127.0.0.1:8080/webhook
+
+        secret_token (Optional[str], optional): Секрет webhook.По умолчанию None
+        count (int, optional): Количество апдейтов.По умолчанию 100
+        concurrency (int, optional): Одновременных запросов.По умолчанию 10
+        text (str, optional): Текст сообщений.По умолчанию /start
+
+    Returns:
+        WebhookHarnessStats: Статусы ответов и время ответа
+    """
+    stats: WebhookHarnessStats = WebhookHarnessStats()
+    headers: Dict[str, str] = (
+        {"X-Telegram-Bot-Api-Secret-Token": secret_token} if secret_token else {}
+    )
+    update_ids = iter(range(1, count + 1))
+
+    async def worker(session: aiohttp.ClientSession) -> None:
+        for update_id in update_ids:
+            start: float = time.monotonic()
+            try:
+                async with session.post(
+                    url,
+                    json=make_synthetic_update(update_id, chat_id=update_id, text=text),
+                    headers=headers,
+                ) as resp:
+                    await resp.read()
+                    stats.statuses[resp.status] = stats.statuses.get(resp.status, 0) + 1
+            except aiohttp.ClientError:
+                stats.errors += 1
+                continue
+            stats.sent += 1
+            stats.latencies.append(time.monotonic() - start)
+
+    start: float = time.monotonic()
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*[worker(session) for _ in range(max(1, concurrency))])
+    stats.duration = time.monotonic() - start
+    return stats
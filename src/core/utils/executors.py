@@ -0,0 +1,228 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Literal, Optional, Tuple
+import asyncio
+import functools
+import multiprocessing
+import time
+
+from pydantic import BaseModel
+
+
+class ExecutorSettings(BaseModel):
+    """Настройки пула для синхронных функций."""
+
+    KIND: Literal["thread", "process"] = "thread"
+    MAX_WORKERS: Optional[int] = None  # None - по количеству CPU
+    # Задач одного модуля одновременно, None - без ограничений
+    MODULE_LIMIT: Optional[int] = None
+
+
+@dataclass
+class ExecutorStats:
+    """Метрики пула."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    active: int = 0  # Задач в пуле(в очереди пула и выполняются)
+    max_active: int = 0
+    queue_time_total: float = 0.0
+    queue_time_max: float = 0.0
+    run_time_total: float = 0.0
+    run_time_max: float = 0.0
+
+
+def _timed_call(func: Callable, args: Tuple, kwargs: Dict) -> Tuple[float, Any]:
+    # Выполняется в потоке или процессе пула, возвращает время начала выполнения
+    started: float = time.time()
+    return started, func(*args, **kwargs)
+
+
+class ExecutorManager:
+    """
+    Именованные пулы потоков и процессов для синхронных функций.
+
+    Пул default(потоки) есть всегда. Пулы создаются при первом запуске задачи.
+    Для процессов функция и аргументы должны поддерживать pickle. Количество
+    одновременных задач модуля в пуле ограничивается MODULE_LIMIT или
+    configure_module, ожидание ограничения входит во время в очереди.
+
+    Отмена ожидающей задачи отменяет ее в пуле. Уже выполняющаяся функция
+    завершается, но ее результат не возвращается.
+    """
+
+    DEFAULT: str = "default"
+
+    def __init__(self) -> None:
+        self._settings: Dict[str, ExecutorSettings] = {self.DEFAULT: ExecutorSettings()}
+        self._executors: Dict[str, Executor] = {}
+        self._module_limits: Dict[Tuple[str, str], int] = {}
+        self._semaphores: Dict[Tuple[str, Optional[str]], asyncio.Semaphore] = {}
+        self.stats: Dict[str, ExecutorStats] = {self.DEFAULT: ExecutorStats()}
+
+    def configure(self, name: str, settings: ExecutorSettings) -> None:
+        """
+        Задает настройки пула. Уже созданный пул с этим именем закрывается.
+
+        Args:
+            name (str): Имя пула
+
+            Пример:
+            cpu
+
+            settings (ExecutorSettings): Настройки пула
+        """
+        executor: Optional[Executor] = self._executors.pop(name, None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self._settings[name] = settings
+        self.stats.setdefault(name, ExecutorStats())
+        self._semaphores = {
+            key: semaphore for key, semaphore in self._semaphores.items() if key[0] != name
+        }
+
+    def configure_module(self, name: str, module: str, limit: int) -> None:
+        """
+        Задает ограничение одновременных задач модуля в пуле.
+
+        Args:
+            name (str): Имя пула
+            module (str): Имя роутера модуля
+            limit (int): Задач одновременно
+        """
+        self._module_limits[(name, module)] = limit
+        self._semaphores.pop((name, module), None)
+
+    def get_executor(self, name: str = DEFAULT) -> Executor:
+        """Возвращает пул по имени, создавая его при первом обращении."""
+        if name not in self._settings:
+            raise KeyError(f"Пул {name} не настроен")
+        executor: Optional[Executor] = self._executors.get(name)
+        if executor is None:
+            settings: ExecutorSettings = self._settings[name]
+            if settings.KIND == "process":
+                executor = ProcessPoolExecutor(
+                    max_workers=settings.MAX_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                executor = ThreadPoolExecutor(
+                    max_workers=settings.MAX_WORKERS,
+                    thread_name_prefix=f"executor-{name}",
+                )
+            self._executors[name] = executor
+        return executor
+
+    async def run(
+        self,
+        name: str,
+        func: Callable,
+        *args,
+        module: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Выполняет синхронную функцию в пуле.
+
+        Args:
+            name (str): Имя пула
+            func (Callable): Функция
+            module (Optional[str], optional): Имя роутера модуля для ограничения
+            одновременных задач.По умолчанию None
+
+        Returns:
+            Any: Результат функции. Ошибки функции пробрасываются
+        """
+        executor: Executor = self.get_executor(name)
+        stats: ExecutorStats = self.stats[name]
+        semaphore: Optional[asyncio.Semaphore] = self._get_semaphore(name, module)
+        submitted: float = time.time()
+        stats.submitted += 1
+        try:
+            if semaphore is None:
+                started, result = await self._submit(executor, stats, func, args, kwargs)
+            else:
+                async with semaphore:
+                    started, result = await self._submit(
+                        executor, stats, func, args, kwargs
+                    )
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        except BrokenProcessPool:
+            # Процесс пула упал, следующая задача создаст новый пул
+            self._executors.pop(name, None)
+            stats.failed += 1
+            raise
+        except Exception:
+            stats.failed += 1
+            raise
+
+        finished: float = time.time()
+        stats.completed += 1
+        stats.queue_time_total += started - submitted
+        stats.queue_time_max = max(stats.queue_time_max, started - submitted)
+        stats.run_time_total += finished - started
+        stats.run_time_max = max(stats.run_time_max, finished - started)
+        return result
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Возвращает метрики пулов."""
+        snapshot: Dict[str, Dict] = {}
+        for name, stats in self.stats.items():
+            data: Dict = asdict(stats)
+            data["kind"] = self._settings[name].KIND
+            data["queue_time_avg"] = (
+                stats.queue_time_total / stats.completed if stats.completed else 0.0
+            )
+            data["run_time_avg"] = (
+                stats.run_time_total / stats.completed if stats.completed else 0.0
+            )
+            snapshot[name] = data
+        return snapshot
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Закрывает созданные пулы."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=wait)
+        self._executors.clear()
+        self._semaphores.clear()
+
+    async def _submit(
+        self,
+        executor: Executor,
+        stats: ExecutorStats,
+        func: Callable,
+        args: Tuple,
+        kwargs: Dict,
+    ) -> Tuple[float, Any]:
+        stats.active += 1
+        stats.max_active = max(stats.max_active, stats.active)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, functools.partial(_timed_call, func, args, kwargs)
+            )
+        finally:
+            stats.active -= 1
+
+    def _get_semaphore(
+        self, name: str, module: Optional[str]
+    ) -> Optional[asyncio.Semaphore]:
+        if module is None:
+            return None
+        limit: Optional[int] = self._module_limits.get(
+            (name, module), self._settings[name].MODULE_LIMIT
+        )
+        if not limit:
+            return None
+        semaphore: Optional[asyncio.Semaphore] = self._semaphores.get((name, module))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[(name, module)] = semaphore
+        return semaphore
+
+
+executor_manager: ExecutorManager = ExecutorManager()
@@ -1,17 +1,24 @@
-from typing import Tuple, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Tuple, List, Optional
 from pathlib import Path
+import asyncio
+import functools
 import shutil
 import os
+import threading
 import time
 import traceback
+import zipfile
 
 from core.response.response_data import LoggingData
 from core.error_handlers.format import format_errors_message
-from core.response.messages import telegram_emoji
+from core.response.messages import messages, telegram_emoji
 from core.error_handlers.helpers import ok, fail
-from core.response.response_data import Result
+from core.response.response_data import ArchiveData, CleanupData, Result
+from core.contracts.constants import TELEGRAM_UPLOAD_LIMIT
+from core.profiling.startup import profiler
 
 
+@profiler.profile(phase="ensure_directories")
 def ensure_directories(
     *args: Path,
     logging_data: LoggingData = None,
@@ -149,6 +156,151 @@ def save_delete_data(
                     print(f"Failed to cleanup: {path}")
 
 
+DEFAULT_DELETE_WORKERS: int = 4  # Одновременных удалений в пуле потоков
+
+
+def _remove_path(path: Path, stats: CleanupData) -> None:
+    # Рекурсивное удаление через os.scandir: stat берется из записи папки без
+    # отдельного системного вызова. Счетчики обновляются по мере удаления, чтобы
+    # повторная попытка после ошибки не считала удаленное дважды
+    if path.is_symlink() or path.is_file():
+        size: int = path.lstat().st_size
+        path.unlink()
+        stats.files += 1
+        stats.bytes += size
+        return
+    if not path.exists():
+        return
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _remove_path(Path(entry.path), stats)
+                continue
+            size = entry.stat(follow_symlinks=False).st_size
+            os.unlink(entry.path)
+            stats.files += 1
+            stats.bytes += size
+    os.rmdir(path)
+    stats.dirs += 1
+
+
+def _remove_files_in_folder(path_folder: Path) -> CleanupData:
+    stats: CleanupData = CleanupData()
+    if not path_folder.exists():
+        return stats
+    with os.scandir(path_folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            try:
+                size: int = entry.stat(follow_symlinks=False).st_size
+                os.unlink(entry.path)
+                stats.files += 1
+                stats.bytes += size
+            except OSError:
+                stats.errors += 1
+    return stats
+
+
+async def ensure_directories_async(
+    *args: Path,
+    logging_data: LoggingData = None,
+) -> Result:
+    """
+    Асинхронная версия ensure_directories, папки создаются в пуле потоков.
+
+    Args:
+        logging_data (LoggingData, optional): Обьект класса LoggingData.По умолчанию None
+
+    Returns:
+        Result: Результат ensure_directories
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None, functools.partial(ensure_directories, *args, logging_data=logging_data)
+    )
+
+
+async def delete_all_files_and_symbolik_link_async(
+    path_folder: Path,
+    logging_data: LoggingData = None,
+) -> CleanupData:
+    """
+    Асинхронная версия delete_all_files_and_symbolik_link.
+
+    Удаляет файлы и символические ссылки в папке(без вложенных папок) одним
+    проходом os.scandir в пуле потоков.
+
+    Args:
+        path_folder (Path): Путь до папки
+        logging_data (LoggingData, optional): Обьект класса LoggingData.По умолчанию None
+
+    Returns:
+        CleanupData: Количество удаленных файлов, байт и ошибок
+    """
+    loop = asyncio.get_running_loop()
+    stats: CleanupData = await loop.run_in_executor(
+        None, _remove_files_in_folder, path_folder
+    )
+    if stats.errors and logging_data:
+        logging_data.warning_logger.warning(
+            f"Не удалось удалить файлов в {path_folder} - {stats.errors}"
+        )
+    return stats
+
+
+async def save_delete_data_async(
+    list_path: List[Path],
+    logging_data: LoggingData = None,
+    retries: int = 3,
+    backoff: float = 0.5,
+    workers: int = DEFAULT_DELETE_WORKERS,
+) -> CleanupData:
+    """
+    Асинхронная версия save_delete_data.
+
+    Пути удаляются в пуле потоков, одновременно не более workers. При
+    PermissionError(файл занят другим процессом) удаление повторяется через
+    backoff, 2 * backoff, ... секунд без блокировки цикла событий.
+
+    Args:
+        list_path (List[Path]): Список с путями до файлов и папок
+        logging_data (LoggingData, optional): Обьект класса LoggingData.По умолчанию None
+        retries (int, optional): Количество попыток для удаления.По умолчанию 3
+        backoff (float, optional): Пауза перед первым повтором в секундах.По умолчанию 0.5
+        workers (int, optional): Одновременных удалений.По умолчанию DEFAULT_DELETE_WORKERS
+
+    Returns:
+        CleanupData: Количество удаленных файлов, папок, байт и путей с ошибкой
+    """
+    loop = asyncio.get_running_loop()
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(max(1, workers))
+
+    async def delete(path: Path) -> CleanupData:
+        stats: CleanupData = CleanupData()
+        for attempt in range(retries):
+            try:
+                async with semaphore:
+                    await loop.run_in_executor(None, _remove_path, path, stats)
+                return stats
+            except PermissionError:
+                if attempt < retries - 1:
+                    await asyncio.sleep(backoff * 2**attempt)
+            except Exception as err:
+                if logging_data:
+                    logging_data.warning_logger.warning(
+                        msg=f"Ошибка при удалении {path}: {err}"
+                    )
+                break
+        stats.errors += 1
+        return stats
+
+    total: CleanupData = CleanupData()
+    for stats in await asyncio.gather(*[delete(path) for path in list_path]):
+        total.merge(stats)
+    return total
+
+
 def make_archive(
     base_name: str,
     format_archive: str,
@@ -218,3 +370,240 @@ def make_archive(
             code="ARCHIVE CREATE ERROR",
             message=f"{telegram_emoji.red_cross} Ошибка при создании архива",
         )
+
+
+ZIP_ENTRY_OVERHEAD: int = 128  # Заголовки файла в архиве без учета имени файла
+
+
+def _get_archive_part_path(base_name: str, index: int) -> Path:
+    return Path(f"{base_name}.zip" if index == 1 else f"{base_name}.{index}.zip")
+
+
+def _write_zip_parts(
+    base_name: str,
+    root_dir: Path,
+    compression: int,
+    compression_level: Optional[int],
+    max_part_size: Optional[int],
+    emit: Callable[[str, Any], None],
+    cancel: threading.Event,
+) -> None:
+    # Выполняется в потоке: пишет части архива и сообщает о каждом файле и части
+    files: List[Path] = sorted(path for path in Path(root_dir).rglob("*") if path.is_file())
+    archive: Optional[zipfile.ZipFile] = None
+    part_path: Optional[Path] = None
+    part_index: int = 0
+    directory_size: int = 0
+    try:
+        for path in files:
+            if cancel.is_set():
+                break
+            arcname: str = path.relative_to(root_dir).as_posix()
+            entry_size: int = ZIP_ENTRY_OVERHEAD + 2 * len(arcname.encode())
+            if (
+                archive is not None
+                and max_part_size
+                and archive.fp.tell() + directory_size + entry_size + path.stat().st_size
+                > max_part_size
+            ):
+                archive.close()
+                emit("part", part_path)
+                archive = None
+            if archive is None:
+                part_index += 1
+                part_path = _get_archive_part_path(base_name, part_index)
+                archive = zipfile.ZipFile(
+                    part_path, "w", compression=compression, compresslevel=compression_level
+                )
+                directory_size = 0
+            archive.write(path, arcname=arcname)
+            directory_size += entry_size
+            emit("file", path)
+
+        if cancel.is_set():
+            if archive is not None:
+                archive.close()
+                part_path.unlink()
+            return
+        if archive is None:
+            # Пустая папка - пустой архив, как в shutil.make_archive
+            part_path = _get_archive_part_path(base_name, 1)
+            archive = zipfile.ZipFile(part_path, "w")
+        archive.close()
+        emit("part", part_path)
+    except BaseException:
+        if archive is not None:
+            archive.close()
+            part_path.unlink()
+        raise
+
+
+async def iter_zip_archive(
+    base_name: str,
+    root_dir: Path,
+    compression_level: Optional[int] = 6,
+    store: bool = False,
+    max_part_size: Optional[int] = TELEGRAM_UPLOAD_LIMIT,
+    update_progress: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> AsyncIterator[Path]:
+    """
+    Создает zip архив в пуле потоков и возвращает части архива по мере готовности.
+
+    Часть можно отправлять пользователю, пока создается следующая. Каждая часть -
+    отдельный zip архив. Новая часть начинается, если файл может не поместиться в
+    текущую(размер оценивается по несжатому файлу). Файл больше max_part_size
+    записывается в отдельную часть, которая превысит ограничение.
+
+    Args:
+        base_name (str): Путь сохранения архива без расширения.Части после первой
+        получают номер
+
+        Пример
+        app/bot/temp/video/video -> video.zip, video.2.zip
+
+        root_dir (Path): Папка с файлами для архивирования
+        compression_level (Optional[int], optional): Уровень сжатия от 0 до 9.
+        По умолчанию 6
+        store (bool, optional): Без сжатия(быстро для уже сжатых фото и видео).
+        По умолчанию False
+        max_part_size (Optional[int], optional): Максимальный размер части в байтах.
+        По умолчанию TELEGRAM_UPLOAD_LIMIT, None - без разделения
+        update_progress (Optional[Callable[[], Awaitable[bool]]], optional): Функция
+        обновления прогресса, вызывается после каждого файла.Если вернула False -
+        создание архива останавливается, незаконченная часть удаляется.
+
+        Пример:
+        async_make_update_progress(state=state) из app/app_utils/fsm.py
+
+    Yields:
+        Path: Путь к готовой части архива
+    """
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    cancel: threading.Event = threading.Event()
+
+    def emit(kind: str, value: Any) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, (kind, value))
+
+    future: asyncio.Future = loop.run_in_executor(
+        None,
+        functools.partial(
+            _write_zip_parts,
+            base_name,
+            root_dir,
+            zipfile.ZIP_STORED if store else zipfile.ZIP_DEFLATED,
+            None if store else compression_level,
+            max_part_size,
+            emit,
+            cancel,
+        ),
+    )
+    future.add_done_callback(lambda _: events.put_nowait(("done", None)))
+    try:
+        while True:
+            kind, value = await events.get()
+            if kind == "done":
+                break
+            if kind == "part":
+                yield value
+            elif update_progress is not None and not cancel.is_set():
+                if not await update_progress():
+                    cancel.set()
+        await future
+    finally:
+        # Потребитель остановился раньше - поток завершает текущий файл и выходит
+        cancel.set()
+        await asyncio.wait([future])
+
+
+async def async_make_archive(
+    base_name: str,
+    root_dir: Path,
+    logging_data: LoggingData,
+    compression_level: Optional[int] = 6,
+    store: bool = False,
+    max_part_size: Optional[int] = TELEGRAM_UPLOAD_LIMIT,
+    update_progress: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> Result:
+    """
+    Создает zip архив без блокировки цикла событий.
+
+    Параметры как у iter_zip_archive. Для отправки частей по мере готовности
+    используйте iter_zip_archive.
+
+    Args:
+        base_name (str): Путь сохранения архива без расширения
+        root_dir (Path): Папка с файлами для архивирования
+        logging_data (LoggingData): Обьект класса LoggingData
+        compression_level (Optional[int], optional): Уровень сжатия от 0 до 9.
+        По умолчанию 6
+        store (bool, optional): Без сжатия.По умолчанию False
+        max_part_size (Optional[int], optional): Максимальный размер части в байтах.
+        По умолчанию TELEGRAM_UPLOAD_LIMIT
+        update_progress (Optional[Callable[[], Awaitable[bool]]], optional): Функция
+        обновления прогресса.По умолчанию None
+
+    Returns:
+        Result: содержит в себе ArchiveData при успехе
+
+        атрибуты ArchiveData:
+            - parts (List[Path])
+            - size (int)
+            - files (int)
+            - duration (float)
+    """
+    start: float = time.monotonic()
+    parts: List[Path] = []
+    files: int = 0
+    cancelled: bool = False
+
+    async def count_progress() -> bool:
+        nonlocal files, cancelled
+        files += 1
+        if update_progress is not None and not await update_progress():
+            cancelled = True
+            return False
+        return True
+
+    try:
+        async for part in iter_zip_archive(
+            base_name=base_name,
+            root_dir=root_dir,
+            compression_level=compression_level,
+            store=store,
+            max_part_size=max_part_size,
+            update_progress=count_progress,
+        ):
+            parts.append(part)
+    except Exception as err:
+        logging_data.error_logger.exception(
+            format_errors_message(
+                name_router=logging_data.router_name,
+                method="<unknown>",
+                status=0,
+                url="<unknown>",
+                error_text=str(err),
+                function_name=async_make_archive.__name__,
+            )
+        )
+        await save_delete_data_async(list_path=parts, logging_data=logging_data)
+        return fail(
+            code="ARCHIVE CREATE ERROR",
+            message=f"{telegram_emoji.red_cross} Ошибка при создании архива",
+        )
+
+    if cancelled:
+        await save_delete_data_async(list_path=parts, logging_data=logging_data)
+        return fail(code="ARCHIVE CANCELLED", message=messages.CANCEL_MESSAGE)
+
+    archive: ArchiveData = ArchiveData(
+        parts=parts,
+        size=sum(part.stat().st_size for part in parts),
+        files=files,
+        duration=time.monotonic() - start,
+    )
+    logging_data.info_logger.info(
+        f"[ARCHIVE] {base_name}: файлов - {archive.files}, частей - {len(parts)}, "
+        f"{archive.size} байт за {archive.duration:.2f} c"
+    )
+    return ok(data=archive)
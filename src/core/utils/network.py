@@ -1,13 +1,29 @@
-import base64
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Mapping,
+    Tuple,
+)
+from functools import partial
+from urllib.parse import urlparse
 from pathlib import Path
+import asyncio
+import base64
+import shutil
 
 from aiohttp import ClientSession
 
-from core.response.response_data import NetworkResponseResult, LoggingData
+from core.response.response_data import NetworkResponseResult, LoggingData, DownloadData
 from core.error_handlers.network import error_handler_for_the_website
 from core.error_handlers.helpers import network_fail, network_ok
 from core.error_handlers.format import format_errors_message
 from core.response.messages import messages
+from core.contracts.constants import DEFAULT_USER_AGENT
 
 
 async def get_and_save_image(
@@ -16,6 +32,8 @@ async def get_and_save_image(
     session: ClientSession,
     logging_data: LoggingData,
     base_64: bool = False,
+    stream: bool = False,
+    max_size: Optional[int] = None,
 ) -> NetworkResponseResult:
     """
     Сохраняет data_requests по указанному пути, если base_64 = True.
@@ -26,9 +44,14 @@ async def get_and_save_image(
     Args:
         data_requests (str): URL для скачивания или строка в кодировке base64
         path_img (Path): Путь до картинки
-        session (ClientSession): Cессия для запроса
+        session (ClientSession): Cессия для запроса.User-Agent берется из заголовков
+        сессии(session_pool), если в сессии его нет - DEFAULT_USER_AGENT
         logging_data (LoggingData): Обьект класса LoggingData содержащий в себе логгер и имя роутера
         base_64 (Optional[bool], optional): Проверка на кодировку base_64. По умолачанию None
+        stream (bool, optional): Записывать ответ на диск по частям, не загружая
+        изображение в память целиком. По умолчанию False
+        max_size (Optional[int], optional): Максимальный размер изображения в байтах.
+        По умолчанию None - без ограничений
 
     Returns:
         NetworkResponseResult: Объект с результатом запроса.
@@ -48,49 +71,40 @@ async def get_and_save_image(
             - details (Optional[Any])
     """
     try:
+        loop = asyncio.get_running_loop()
         if base_64:
             image_file: bytes = base64.b64decode(data_requests)
+            await loop.run_in_executor(None, _write_file, path_img, image_file)
+            return network_ok(data=path_img, url="base64", method="GET", status=200)
+
+        # Сайты с картинками часто отклоняют User-Agent aiohttp
+        headers: Optional[Dict[str, str]] = (
+            None
+            if "User-Agent" in session.headers
+            else {"User-Agent": DEFAULT_USER_AGENT}
+        )
+        # Делаем запрос на сайт для получения данных о картинке. При stream файл
+        # сразу сохраняется под именем с расширением из Content-Type ответа
+        response = await error_handler_for_the_website(
+            session=session,
+            url=data_requests,
+            logging_data=logging_data,
+            data_type="FILE" if stream else "BYTES",
+            timeout=5,
+            headers=headers,
+            function_name=get_and_save_image.__name__,
+            file_path=partial(_image_path, path_img),
+            max_size=max_size,
+        )
+        if not response.ok:
+            return response
 
-            path_img.parent.mkdir(parents=True, exist_ok=True)
-            with open(path_img, "wb") as image:
-                image.write(image_file)
+        if stream:
+            download: DownloadData = response.data
+            path_img = download.path
         else:
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0 Safari/537.36"
-                )
-            }
-            # Делаем запрос на сайт для получения данных о картинке
-            response = await error_handler_for_the_website(
-                session=session,
-                url=data_requests,
-                logging_data=logging_data,
-                data_type="BYTES",
-                timeout=5,
-                headers=headers,
-                function_name=get_and_save_image.__name__,
-            )
-            if not response.ok:
-                return response
-
-            # Получаем расширение для картинки, если есть
-            ext: bool = None
-            content_type = response.headers.get("Content-Type", "")
-            if "image/" in content_type:
-                ext = content_type.split("/")[-1]
-            if ext:
-                img_name = path_img.name.split(".")[0]  # 4343sds3434321.jpg
-                ext = ext.split(";")[0]
-                ext = ext.split("+")[0]  # svg+lxml
-                path_img = path_img.parent / f"{img_name}.{ext}"
-
-            # Создаем папки если не существуют
-            path_img.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(path_img, "wb") as file:
-                file.write(response.data)
+            path_img = _image_path(path_img, response.headers)
+            await loop.run_in_executor(None, _write_file, path_img, response.data)
 
         return network_ok(
             data=path_img,
@@ -105,7 +119,7 @@ async def get_and_save_image(
                 name_router=logging_data.router_name,
                 method="GET",
                 status=0,
-                url="base64" if base64 else data_requests,
+                url="base64" if base_64 else data_requests,
                 error_text=str(err),
                 function_name=get_and_save_image.__name__,
             )
@@ -115,5 +129,139 @@ async def get_and_save_image(
             message=messages.SERVER_ERROR,
             method="GET",
             status=0,
-            url="base64" if base64 else data_requests,
+            url="base64" if base_64 else data_requests,
         )
+
+
+async def iter_download_images(
+    items: Sequence[Tuple[str, Path]],
+    session: ClientSession,
+    logging_data: LoggingData,
+    base_64: bool = False,
+    limit: int = 10,
+    limit_per_host: int = 4,
+    stream: bool = False,
+    max_size: Optional[int] = None,
+    update_progress: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> AsyncIterator[NetworkResponseResult]:
+    """
+    Скачивает и сохраняет изображения пачкой через get_and_save_image.
+
+    Одинаковые data_requests скачиваются один раз - по пути первого вхождения,
+    в остальные пути с тем же data_requests скачанный файл копируется.
+    Результаты возвращаются по мере готовности, а не в порядке items.
+
+    Args:
+        items (Sequence[Tuple[str, Path]]): Пары (URL или строка base64, путь до картинки)
+        session (ClientSession): Cессия для запроса
+        logging_data (LoggingData): Обьект класса LoggingData содержащий в себе логгер и имя роутера
+        base_64 (bool, optional): data_requests в кодировке base64. По умолчанию False
+        limit (int, optional): Максимальное количество одновременных загрузок.
+        По умолчанию 10
+        limit_per_host (int, optional): Максимальное количество одновременных загрузок
+        с одного хоста. По умолчанию 4
+        stream (bool, optional): Записывать ответы на диск по частям. По умолчанию False
+        max_size (Optional[int], optional): Максимальный размер изображения в байтах
+        update_progress (Optional[Callable[[], Awaitable[bool]]], optional): Функция
+        обновления прогресса, вызывается после каждого результата.Если вернула False -
+        оставшиеся загрузки отменяются.
+
+        Пример:
+        async_make_update_progress(state=state) из app/app_utils/fsm.py
+
+    Yields:
+        NetworkResponseResult: Результат для каждой уникальной пары
+        (data_requests, путь до картинки)
+    """
+    unique: Dict[str, List[Path]] = {}
+    for data_requests, path_img in items:
+        paths: List[Path] = unique.setdefault(data_requests, [])
+        if path_img not in paths:
+            paths.append(path_img)
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(limit)
+    host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def download(
+        data_requests: str, paths: List[Path]
+    ) -> List[NetworkResponseResult]:
+        host: str = "base64" if base_64 else urlparse(data_requests).netloc
+        host_semaphore: asyncio.Semaphore = host_semaphores.setdefault(
+            host, asyncio.Semaphore(limit_per_host)
+        )
+        async with host_semaphore, semaphore:
+            result: NetworkResponseResult = await get_and_save_image(
+                data_requests=data_requests,
+                path_img=paths[0],
+                session=session,
+                logging_data=logging_data,
+                base_64=base_64,
+                stream=stream,
+                max_size=max_size,
+            )
+        if not result.ok:
+            return [result] * len(paths)
+
+        results: List[NetworkResponseResult] = [result]
+        loop = asyncio.get_running_loop()
+        for path_img in paths[1:]:
+            # Расширение копии такое же, как у скачанного файла
+            copy_path: Path = path_img.parent / (
+                f"{path_img.name.split('.')[0]}{result.data.suffix}"
+            )
+            if copy_path != result.data:
+                await loop.run_in_executor(None, _copy_file, result.data, copy_path)
+            results.append(
+                network_ok(
+                    data=copy_path,
+                    url=result.url,
+                    method=result.method,
+                    status=result.status,
+                )
+            )
+        return results
+
+    tasks: List[asyncio.Task] = [
+        asyncio.ensure_future(download(data_requests, paths))
+        for data_requests, paths in unique.items()
+    ]
+    try:
+        for future in asyncio.as_completed(tasks):
+            for result in await future:
+                yield result
+                if update_progress and not await update_progress():
+                    logging_data.info_logger.info(
+                        "[DOWNLOAD] Загрузка изображений отменена пользователем"
+                    )
+                    return
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _image_path(path_img: Path, headers: Mapping[str, str]) -> Path:
+    """Возвращает путь картинки с расширением из Content-Type, если он есть."""
+    content_type: str = headers.get("Content-Type", "")
+    if "image/" not in content_type:
+        return path_img
+    ext: str = content_type.split("/")[-1]
+    ext = ext.split(";")[0]
+    ext = ext.split("+")[0]  # svg+lxml
+    if not ext:
+        return path_img
+    img_name: str = path_img.name.split(".")[0]  # 4343sds3434321.jpg
+    return path_img.parent / f"{img_name}.{ext}"
+
+
+def _copy_file(source: Path, path: Path) -> None:
+    """Копирует файл, создавая папки если не существуют."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, path)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Записывает данные в файл, создавая папки если не существуют."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(data)
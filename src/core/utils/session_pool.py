@@ -0,0 +1,159 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+from pydantic import BaseModel
+
+from core.contracts.constants import DEFAULT_USER_AGENT
+
+
+class UpstreamSettings(BaseModel):
+    """Настройки сессии для одного сайта(upstream)."""
+
+    LIMIT: int = 100  # Всего соединений, 0 - без ограничений
+    LIMIT_PER_HOST: int = 10  # Соединений с одним хостом, 0 - без ограничений
+    TTL_DNS_CACHE: Optional[int] = 300  # Время жизни DNS кэша, None - навсегда
+    KEEPALIVE_TIMEOUT: float = 30.0  # Время жизни неиспользуемого соединения
+    HEADERS: Dict[str, str] = {"User-Agent": DEFAULT_USER_AGENT}
+
+
+@dataclass
+class SessionStats:
+    """Метрики сессии."""
+
+    requests: int = 0
+    active: int = 0
+    max_active: int = 0
+    errors: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    connections_queued: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+
+class SessionPool:
+    """
+    Сессии aiohttp по сайтам(upstream) с настроенным коннектором.
+
+    Сессия для сайта выбирается по хосту URL, для остальных хостов используется
+    сессия default. Сессии создаются при первом обращении и должны
+    использоваться в том же цикле событий.
+    """
+
+    DEFAULT: str = "default"
+
+    def __init__(
+        self,
+        default: UpstreamSettings,
+        upstreams: Optional[Dict[str, UpstreamSettings]] = None,
+    ) -> None:
+        self.settings: Dict[str, UpstreamSettings] = {
+            self.DEFAULT: default,
+            **(upstreams or {}),
+        }
+        self.stats: Dict[str, SessionStats] = {
+            name: SessionStats() for name in self.settings
+        }
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    def get(self, name: str = DEFAULT) -> aiohttp.ClientSession:
+        """
+        Возвращает сессию сайта.
+
+        Args:
+            name (str, optional): Хост сайта из upstreams.По умолчанию default
+
+        Returns:
+            aiohttp.ClientSession: Сессия
+        """
+        if name not in self.settings:
+            name = self.DEFAULT
+        session: Optional[aiohttp.ClientSession] = self._sessions.get(name)
+        if session is None or session.closed:
+            session = self._create_session(name)
+            self._sessions[name] = session
+        return session
+
+    def for_url(self, url: str) -> aiohttp.ClientSession:
+        """Возвращает сессию для хоста URL."""
+        return self.get(urlparse(url).hostname or self.DEFAULT)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Возвращает метрики сессий и загрузку пула соединений."""
+        snapshot: Dict[str, Dict] = {}
+        for name, stats in self.stats.items():
+            data: Dict = asdict(stats)
+            limit: int = self.settings[name].LIMIT
+            data["utilization"] = stats.active / limit if limit else 0.0
+            snapshot[name] = data
+        return snapshot
+
+    async def close(self) -> None:
+        """Закрывает все сессии."""
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+
+    async def __aenter__(self) -> "SessionPool":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def _create_session(self, name: str) -> aiohttp.ClientSession:
+        settings: UpstreamSettings = self.settings[name]
+        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+            limit=settings.LIMIT,
+            limit_per_host=settings.LIMIT_PER_HOST,
+            ttl_dns_cache=settings.TTL_DNS_CACHE,
+            keepalive_timeout=settings.KEEPALIVE_TIMEOUT,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=settings.HEADERS,
+            trace_configs=[self._create_trace_config(self.stats[name])],
+        )
+
+    @staticmethod
+    def _create_trace_config(stats: SessionStats) -> aiohttp.TraceConfig:
+        trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params) -> None:
+            stats.requests += 1
+            stats.active += 1
+            stats.max_active = max(stats.max_active, stats.active)
+
+        async def on_request_end(session, ctx, params) -> None:
+            stats.active -= 1
+
+        async def on_request_exception(session, ctx, params) -> None:
+            stats.active -= 1
+            stats.errors += 1
+
+        async def on_connection_create_end(session, ctx, params) -> None:
+            stats.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params) -> None:
+            stats.connections_reused += 1
+
+        async def on_connection_queued_start(session, ctx, params) -> None:
+            stats.connections_queued += 1
+
+        async def on_dns_cache_hit(session, ctx, params) -> None:
+            stats.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params) -> None:
+            stats.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
@@ -0,0 +1,250 @@
+from dataclasses import dataclass, asdict
+from queue import Empty
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+import asyncio
+import multiprocessing
+import time
+
+# Время ожидания апдейтов из очереди зависшего процесса при перезапуске
+DRAIN_TIMEOUT: float = 0.1
+
+
+@dataclass
+class WorkerStats:
+    """Метрики процесса обработки апдейтов."""
+
+    routed: int = 0
+    restarts: int = 0
+    requeued: int = 0  # Апдейты, перенесенные из очереди зависшего процесса
+    lost_queues: int = 0  # Очереди, которые не удалось разобрать полностью
+
+
+def get_update_route_key(update: Dict) -> int:
+    """
+    Возвращает ключ маршрутизации апдейта Telegram.
+
+    Ключ - id чата, если его нет(например inline_query) - id пользователя, иначе update_id.
+
+    Args:
+        update (Dict): Апдейт в формате Telegram Bot API
+
+    Returns:
+        int: Ключ маршрутизации
+    """
+    for value in update.values():
+        if not isinstance(value, dict):
+            continue
+        chat: Optional[Dict] = value.get("chat") or (value.get("message") or {}).get("chat")
+        if chat:
+            return int(chat["id"])
+        user: Optional[Dict] = value.get("from") or value.get("user")
+        if user:
+            return int(user["id"])
+    return int(update.get("update_id", 0))
+
+
+class KeyedTaskRunner:
+    """
+    Выполняет задачи параллельно, сохраняя порядок задач с одним ключом.
+
+    Задача с ключом начинается только после завершения предыдущей задачи с тем же
+    ключом(например апдейты одного чата и FSM), одновременно выполняется не более
+    max_concurrency задач.
+    """
+
+    def __init__(self, max_concurrency: int = 100) -> None:
+        self.max_concurrency: int = max(1, max_concurrency)
+        self.failed: int = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tails: Dict[int, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, key: int, factory: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """
+        Добавляет задачу.
+
+        Args:
+            key (int): Ключ порядка выполнения
+            factory (Callable[[], Awaitable[Any]]): Функция создания корутины
+
+        Returns:
+            asyncio.Task: Задача
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        task: asyncio.Task = asyncio.ensure_future(
+            self._run(key, self._tails.get(key), factory)
+        )
+        self._tails[key] = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def join(self) -> None:
+        """Ждет завершения всех задач."""
+        while self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    async def _run(
+        self,
+        key: int,
+        previous: Optional[asyncio.Task],
+        factory: Callable[[], Awaitable[Any]],
+    ) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+            async with self._semaphore:
+                await factory()
+        except Exception:
+            self.failed += 1
+        finally:
+            if self._tails.get(key) is asyncio.current_task():
+                del self._tails[key]
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+
+class WorkerPool:
+    """
+    Процессы обработки апдейтов с очередью на каждый процесс.
+
+    Апдейты распределяются по процессам по ключу(id чата), поэтому апдейты одного
+    чата всегда попадают в один процесс. Процесс обновляет heartbeat, упавшие
+    процессы и процессы без heartbeat дольше heartbeat_timeout перезапускаются в check.
+    Необработанные апдейты зависшего процесса переносятся в очередь нового процесса.
+
+    target вызывается в новом процессе как target(index, queue, heartbeat, *args):
+    читает апдейты из queue до None и записывает time.time() в heartbeat.value.
+
+    Процессы запускаются не демонами, чтобы в них можно было создавать пулы
+    процессов(executor_manager), поэтому pool.stop() нужно вызывать всегда.
+    """
+
+    def __init__(
+        self,
+        target: Callable[..., None],
+        workers: int,
+        args: Tuple = (),
+        heartbeat_timeout: float = 60.0,
+        stop_timeout: float = 30.0,
+        context: str = "spawn",
+    ) -> None:
+        self.target: Callable[..., None] = target
+        self.workers: int = max(1, workers)
+        self.args: Tuple = args
+        self.heartbeat_timeout: float = heartbeat_timeout
+        self.stop_timeout: float = stop_timeout
+        self._ctx = multiprocessing.get_context(context)
+        self.queues: List = [self._ctx.Queue() for _ in range(self.workers)]
+        self.heartbeats: List = [
+            self._ctx.Value("d", 0.0, lock=False) for _ in range(self.workers)
+        ]
+        self.processes: List = [None] * self.workers
+        self.stats: List[WorkerStats] = [WorkerStats() for _ in range(self.workers)]
+
+    def start(self) -> None:
+        """Запускает процессы."""
+        for index in range(self.workers):
+            self._start_worker(index)
+
+    def dispatch(self, update: Dict) -> int:
+        """
+        Отправляет апдейт в очередь процесса.
+
+        Args:
+            update (Dict): Апдейт в формате Telegram Bot API
+
+        Returns:
+            int: Номер процесса
+        """
+        index: int = get_update_route_key(update) % self.workers
+        self.queues[index].put(update)
+        self.stats[index].routed += 1
+        return index
+
+    def check(self) -> List[int]:
+        """
+        Перезапускает упавшие и зависшие процессы.
+
+        Returns:
+            List[int]: Номера перезапущенных процессов
+        """
+        restarted: List[int] = []
+        now: float = time.time()
+        for index, process in enumerate(self.processes):
+            if process is None:
+                continue
+            if process.is_alive():
+                if now - self.heartbeats[index].value <= self.heartbeat_timeout:
+                    continue
+                process.kill()
+                process.join()
+                # Процесс мог быть остановлен во время чтения очереди и оставить ее
+                # заблокированной, поэтому очередь создается заново, а апдейты из
+                # старой очереди переносятся в новую
+                old_queue = self.queues[index]
+                self.queues[index] = self._ctx.Queue()
+                self._requeue(index, old_queue)
+            else:
+                process.join()
+            self.stats[index].restarts += 1
+            self._start_worker(index)
+            restarted.append(index)
+        return restarted
+
+    def stop(self) -> None:
+        """Останавливает процессы после обработки апдейтов из очередей."""
+        for queue in self.queues:
+            queue.put(None)
+        deadline: float = time.monotonic() + self.stop_timeout
+        for index, process in enumerate(self.processes):
+            if process is None:
+                continue
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+            self.processes[index] = None
+        for queue in self.queues:
+            queue.cancel_join_thread()
+            queue.close()
+
+    def snapshot(self) -> Dict[int, Dict]:
+        """Возвращает метрики процессов."""
+        now: float = time.time()
+        snapshot: Dict[int, Dict] = {}
+        for index, process in enumerate(self.processes):
+            data: Dict = asdict(self.stats[index])
+            data["pid"] = process.pid if process is not None else None
+            data["alive"] = process is not None and process.is_alive()
+            data["heartbeat_age"] = now - self.heartbeats[index].value
+            snapshot[index] = data
+        return snapshot
+
+    def _requeue(self, index: int, old_queue: Any) -> None:
+        while True:
+            try:
+                update: Optional[Dict] = old_queue.get(timeout=DRAIN_TIMEOUT)
+            except Empty:
+                break
+            if update is not None:
+                self.queues[index].put(update)
+                self.stats[index].requeued += 1
+        if not old_queue.empty():
+            # Блокировка чтения осталась у убитого процесса
+            self.stats[index].lost_queues += 1
+        old_queue.cancel_join_thread()
+        old_queue.close()
+
+    def _start_worker(self, index: int) -> None:
+        self.heartbeats[index].value = time.time()
+        process = self._ctx.Process(
+            target=self.target,
+            args=(index, self.queues[index], self.heartbeats[index], *self.args),
+            name=f"bot-worker-{index}",
+            daemon=False,
+        )
+        process.start()
+        self.processes[index] = process
@@ -0,0 +1,47 @@
+from functools import partial
+import logging
+import sys
+import uuid
+
+import pytest
+from aiohttp.test_utils import TestServer
+
+from core.response.response_data import LoggingData
+
+
+@pytest.fixture
+def modules_root(tmp_path, monkeypatch):
+    """Создает уникальный пакет с модулями и добавляет его в sys.path."""
+    app_name = f"modules_app_{uuid.uuid4().hex[:8]}"
+    root_package = f"{app_name}.bot.modules"
+
+    package_dir = tmp_path / root_package.replace(".", "/")
+    package_dir.mkdir(parents=True)
+    for directory in [package_dir, package_dir.parent, package_dir.parent.parent]:
+        (directory / "__init__.py").write_text("")
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path, root_package
+
+    for name in list(sys.modules):
+        if name.startswith(app_name):
+            del sys.modules[name]
+
+
+@pytest.fixture
+def logging_data():
+    """LoggingData с одним логгером на все уровни."""
+    logger = logging.getLogger("tests")
+    return LoggingData(logger, logger, logger, logger, "test")
+
+
+@pytest.fixture
+def serve():
+    """
+    Запускает aiohttp приложение на свободном порту.
+
+    Пример:
+    async with serve(app) as server:
+        url = str(server.make_url("/api"))
+    """
+    return partial(TestServer, host="127.0.0.1")
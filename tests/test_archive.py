@@ -0,0 +1,96 @@
+import asyncio
+import os
+import zipfile
+
+from core.utils.filesistem import async_make_archive, iter_zip_archive
+
+
+def _make_files(root, count=6, size=4096):
+    (root / "sub").mkdir(parents=True)
+    for index in range(count):
+        folder = root / "sub" if index % 2 else root
+        (folder / f"file_{index}.bin").write_bytes(os.urandom(size))
+
+
+def test_archive_split_by_part_size(logging_data, tmp_path):
+    source = tmp_path / "source"
+    _make_files(source)
+    base_name = str(tmp_path / "archive")
+
+    result = asyncio.run(
+        async_make_archive(
+            base_name=base_name,
+            root_dir=source,
+            logging_data=logging_data,
+            store=True,
+            max_part_size=10_000,
+        )
+    )
+
+    assert result.ok
+    archive = result.data
+    assert archive.files == 6
+    assert [part.name for part in archive.parts] == [
+        "archive.zip",
+        "archive.2.zip",
+        "archive.3.zip",
+    ]
+    names = []
+    for part in archive.parts:
+        assert part.stat().st_size <= 10_000
+        with zipfile.ZipFile(part) as zip_file:
+            assert zip_file.testzip() is None
+            names.extend(zip_file.namelist())
+    assert sorted(names) == sorted(
+        path.relative_to(source).as_posix() for path in source.rglob("*.bin")
+    )
+
+
+def test_archive_cancel_by_progress(logging_data, tmp_path):
+    source = tmp_path / "source"
+    _make_files(source)
+    calls = []
+
+    async def update_progress():
+        calls.append(1)
+        return len(calls) < 2
+
+    result = asyncio.run(
+        async_make_archive(
+            base_name=str(tmp_path / "archive"),
+            root_dir=source,
+            logging_data=logging_data,
+            max_part_size=None,
+            update_progress=update_progress,
+        )
+    )
+
+    assert not result.ok
+    assert result.error.code == "ARCHIVE CANCELLED"
+    assert not list(tmp_path.glob("*.zip"))
+
+
+def test_iter_zip_archive_yields_parts_while_writing(tmp_path):
+    source = tmp_path / "source"
+    _make_files(source, count=4, size=20_000)
+
+    async def main():
+        seen = []
+        async for part in iter_zip_archive(
+            base_name=str(tmp_path / "archive"),
+            root_dir=source,
+            compression_level=1,
+            max_part_size=30_000,
+        ):
+            # Часть готова к отправке сразу, пока пишутся следующие
+            with zipfile.ZipFile(part) as zip_file:
+                seen.append((part.name, len(zip_file.namelist())))
+        return seen
+
+    seen = asyncio.run(main())
+    assert seen == [
+        ("archive.zip", 1),
+        ("archive.2.zip", 1),
+        ("archive.3.zip", 1),
+        ("archive.4.zip", 1),
+    ]
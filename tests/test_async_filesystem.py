@@ -0,0 +1,66 @@
+import asyncio
+import os
+
+from core.utils.filesistem import (
+    delete_all_files_and_symbolik_link_async,
+    ensure_directories_async,
+    save_delete_data_async,
+)
+
+
+def _make_tree(root):
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "file.txt").write_bytes(b"x" * 10)
+    (root / "a" / "file.txt").write_bytes(b"x" * 20)
+    (root / "a" / "b" / "file.txt").write_bytes(b"x" * 30)
+
+
+def test_save_delete_data_async_counts(tmp_path):
+    _make_tree(tmp_path / "tree")
+    single = tmp_path / "single.txt"
+    single.write_bytes(b"y" * 5)
+
+    stats = asyncio.run(
+        save_delete_data_async(
+            list_path=[tmp_path / "tree", single, tmp_path / "missing"], workers=2
+        )
+    )
+
+    assert (stats.files, stats.dirs, stats.bytes, stats.errors) == (4, 3, 65, 0)
+    assert not (tmp_path / "tree").exists() and not single.exists()
+
+
+def test_save_delete_data_async_retries_permission_error(tmp_path, monkeypatch):
+    _make_tree(tmp_path / "tree")
+    unlink = os.unlink
+    calls = []
+
+    def busy_unlink(path, *args, **kwargs):
+        calls.append(path)
+        if len(calls) == 2:
+            raise PermissionError("файл занят")
+        return unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "unlink", busy_unlink)
+    stats = asyncio.run(
+        save_delete_data_async(list_path=[tmp_path / "tree"], retries=3, backoff=0.01)
+    )
+
+    # Удаленный до ошибки файл не считается повторно
+    assert (stats.files, stats.dirs, stats.bytes, stats.errors) == (3, 3, 60, 0)
+    assert not (tmp_path / "tree").exists()
+
+
+def test_delete_files_in_folder_and_ensure_directories(tmp_path):
+    _make_tree(tmp_path)
+    os.symlink(tmp_path / "file.txt", tmp_path / "link")
+
+    async def main():
+        stats = await delete_all_files_and_symbolik_link_async(tmp_path)
+        result = await ensure_directories_async(tmp_path / "new" / "dir")
+        return stats, result
+
+    stats, result = asyncio.run(main())
+    assert (stats.files, stats.errors) == (2, 0)
+    assert (tmp_path / "a" / "file.txt").exists()
+    assert result.ok and (tmp_path / "new" / "dir").is_dir()
@@ -0,0 +1,119 @@
+from datetime import datetime
+from types import SimpleNamespace
+import asyncio
+
+from aiogram import Bot, Dispatcher, F, Router
+from aiogram.filters import StateFilter
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.types import CallbackQuery, Chat, Message, Update, User
+
+from app.bot.core.middleware.dispatch import DispatchIndexMiddleware
+from core.module_loader.runtime.dispatch_index import DispatchIndex
+from core.response.modules_loader import ModuleInfo
+
+
+def create_module(package, parent=None, prefixes=None):
+    root = package.split(".")[3]
+    return ModuleInfo(
+        package=package,
+        root=root,
+        parent=parent,
+        settings=None,
+        config=SimpleNamespace(
+            MENU_CALLBACK_DATA=package,
+            MENU_REPLY_TEXT=package,
+            SHOW_IN_MAIN_MENU=True,
+            CALLBACK_PREFIXES=prefixes or [],
+        ),
+    )
+
+
+def create_callback(data):
+    return CallbackQuery(
+        id="1",
+        from_user=User(id=1, is_bot=False, first_name="test"),
+        chat_instance="1",
+        data=data,
+    )
+
+
+def create_message(text):
+    return Message(
+        message_id=1,
+        date=datetime.now(),
+        chat=Chat(id=1, type="private"),
+        from_user=User(id=1, is_bot=False, first_name="test"),
+        text=text,
+    )
+
+
+def test_dispatch_index_find():
+    video, child, music = object(), object(), object()
+    index = DispatchIndex()
+    index.add_module(
+        create_module("app.bot.modules.video", prefixes=["video:"]), video
+    )
+    index.add_module(
+        create_module(
+            "app.bot.modules.video.childes.child",
+            parent="app.bot.modules.video",
+            prefixes=["video:child:"],
+        ),
+        child,
+    )
+    index.add_module(create_module("app.bot.modules.music"), music)
+
+    assert index.find(create_callback("app.bot.modules.music")) is music
+    assert index.find(create_callback("video:page:1")) is video
+    assert index.find(create_callback("video:child:page:1")) is child
+    assert index.find(create_callback("unknown")) is None
+
+    assert index.find(create_message("app.bot.modules.video")) is video
+    assert index.find(create_message("app.bot.modules.video.childes.child")) is None
+
+
+def test_dispatch_index_keeps_first_owner():
+    first, second = object(), object()
+    index = DispatchIndex()
+    index.add_module(create_module("app.bot.modules.video"), first)
+    index.add_module(create_module("app.bot.modules.video"), second)
+
+    assert index.find(create_callback("app.bot.modules.video")) is first
+
+
+class Form(StatesGroup):
+    text = State()
+
+
+def test_dispatch_middleware_respects_fsm_state():
+    text = "app.bot.modules.video"
+    form_router, video_router = Router(), Router()
+
+    @form_router.message(StateFilter(Form.text))
+    async def form_handler(message: Message):
+        return "form"
+
+    @video_router.message(F.text == text)
+    async def video_handler(message: Message):
+        return "video"
+
+    dp = Dispatcher()
+    dp.include_routers(form_router, video_router)
+    index = DispatchIndex()
+    index.add_module(create_module(text), video_router)
+    dp.message.outer_middleware(DispatchIndexMiddleware(index=index))
+    bot = Bot(token="42:TEST")
+
+    async def feed():
+        update = Update(update_id=1, message=create_message(text))
+        return await dp.feed_update(bot, update)
+
+    async def run():
+        assert await feed() == "video"
+        key = StorageKey(bot_id=bot.id, chat_id=1, user_id=1)
+        await dp.storage.set_state(key=key, state=Form.text)
+        assert await feed() == "form"
+
+    asyncio.run(run())
+    assert (index.stats.hits, index.stats.bypasses) == (1, 1)
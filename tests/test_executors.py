@@ -0,0 +1,87 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from core.error_handlers.helpers import run_safe_inf_executror
+from core.utils.executors import ExecutorManager, ExecutorSettings
+
+
+def _pid(_=None):
+    return os.getpid()
+
+
+def test_module_limit_and_metrics():
+    manager = ExecutorManager()
+    manager.configure("io", ExecutorSettings(MAX_WORKERS=4, MODULE_LIMIT=1))
+    manager.configure_module("io", "fast", limit=3)
+    running = {"slow": 0, "fast": 0}
+    peak = {"slow": 0, "fast": 0}
+    lock = threading.Lock()
+
+    def job(module):
+        with lock:
+            running[module] += 1
+            peak[module] = max(peak[module], running[module])
+        time.sleep(0.05)
+        with lock:
+            running[module] -= 1
+
+    async def main():
+        modules = ["slow", "fast"] * 3
+        await asyncio.gather(
+            *[manager.run("io", job, module, module=module) for module in modules]
+        )
+
+    asyncio.run(main())
+    manager.shutdown()
+    assert peak == {"slow": 1, "fast": 3}
+    snapshot = manager.snapshot()["io"]
+    assert (snapshot["completed"], snapshot["failed"], snapshot["active"]) == (6, 0, 0)
+    assert snapshot["queue_time_max"] >= 0.05  # slow ждал своей очереди
+
+
+def test_process_pool_and_failure_result():
+    manager = ExecutorManager()
+    manager.configure("cpu", ExecutorSettings(KIND="process", MAX_WORKERS=1))
+
+    async def main():
+        return await manager.run("cpu", _pid)
+
+    try:
+        assert asyncio.run(main()) != os.getpid()
+    finally:
+        manager.shutdown()
+
+    def broken():
+        raise ValueError("boom")
+
+    async def run_safe():
+        return await run_safe_inf_executror(
+            asyncio.get_running_loop(), broken, executor_name="default"
+        )
+
+    result = asyncio.run(run_safe())
+    assert not result.ok
+
+
+def test_cancel_queued_task():
+    manager = ExecutorManager()
+    manager.configure("one", ExecutorSettings(MAX_WORKERS=1))
+    calls = []
+
+    async def main():
+        first = asyncio.ensure_future(manager.run("one", time.sleep, 0.1))
+        second = asyncio.ensure_future(manager.run("one", calls.append, 1))
+        await asyncio.sleep(0.01)
+        second.cancel()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+    asyncio.run(main())
+    manager.shutdown()
+    assert calls == []
+    assert manager.snapshot()["one"]["cancelled"] == 1
@@ -0,0 +1,58 @@
+from aiogram.types import InlineKeyboardMarkup
+
+from app.app_utils.keyboard_cache import KeyboardCache, keyboard_cache
+from app.app_utils.keyboards import (
+    get_button_for_forward_or_back,
+    get_total_buttons_inline_kb,
+    prerender_button_for_forward_or_back,
+)
+from core.response.response_data import InlineKeyboardData
+
+
+def test_keyboard_cache_lru_eviction():
+    cache = KeyboardCache(maxsize=2)
+    markup = InlineKeyboardMarkup(inline_keyboard=[])
+    cache.set("a", markup)
+    cache.set("b", markup)
+    assert cache.get("a") == markup
+    cache.set("c", markup)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 1, 1)
+
+
+def test_keyboards_return_independent_copies():
+    keyboard_cache.clear()
+    buttons = [InlineKeyboardData(text="Видео", callback_data="video")]
+
+    first = get_total_buttons_inline_kb(list_inline_kb_data=buttons)
+    first.inline_keyboard[0][0].text = "Изменено"
+    first.inline_keyboard.append([])
+
+    second = get_total_buttons_inline_kb(
+        list_inline_kb_data=[InlineKeyboardData(text="Видео", callback_data="video")]
+    )
+    assert keyboard_cache.stats.hits == 1
+    assert second is not first
+    assert [[button.text for button in row] for row in second.inline_keyboard] == [
+        ["Видео"]
+    ]
+    first = get_total_buttons_inline_kb(list_inline_kb_data=buttons)
+    assert get_total_buttons_inline_kb(list_inline_kb_data=buttons, cache=False) == first
+
+
+def test_forward_or_back_prerender():
+    keyboard_cache.clear()
+    assert prerender_button_for_forward_or_back(prefix="album", total=3) == 3
+
+    markup = get_button_for_forward_or_back(prefix="album", list_data=[1, 2, 3], indeх=1)
+    assert keyboard_cache.stats.hits == 1
+    assert [button.callback_data for button in markup.inline_keyboard[0]] == [
+        "album back 0",
+        "album forward 2",
+    ]
+    assert markup == get_button_for_forward_or_back(
+        prefix="album", list_data=[1, 2, 3], indeх=1, cache=False
+    )
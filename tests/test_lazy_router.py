@@ -0,0 +1,112 @@
+import asyncio
+import sys
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from aiogram import Dispatcher, Router
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.types import CallbackQuery, Chat, Message, User
+
+from core.module_loader.runtime.lazy import (
+    LazyRouter,
+    get_lazy_triggers,
+    lazy_stats,
+    resolve_allowed_updates,
+)
+from core.response.modules_loader import ModuleInfo
+
+
+ROUTER_CONTENT = """from aiogram import Router, F
+
+router = Router(name="video")
+
+
+@router.message(F.text == "video")
+async def video(message):
+    return "handled"
+"""
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    """Создает модуль с router.py, который еще не импортирован."""
+    package = f"lazy_app_{uuid.uuid4().hex[:8]}"
+    package_dir = tmp_path / package
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    (package_dir / "router.py").write_text(ROUTER_CONTENT)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    config = SimpleNamespace(
+        SERVICE_NAME="video",
+        MENU_REPLY_TEXT="video",
+        MENU_CALLBACK_DATA="video",
+        COMMANDS=["video"],
+        CALLBACK_PREFIXES=["video "],
+    )
+    yield ModuleInfo(
+        package=package, root="video", parent=None, settings=None, config=config
+    )
+
+    for name in list(sys.modules):
+        if name.startswith(package):
+            del sys.modules[name]
+
+
+def make_message(text):
+    return Message(
+        message_id=1,
+        date=datetime.now(),
+        chat=Chat(id=1, type="private"),
+        text=text,
+    )
+
+
+def test_lazy_triggers_match(lazy_module):
+    triggers = get_lazy_triggers(lazy_module)
+    user = User(id=1, is_bot=False, first_name="test")
+
+    assert triggers.match("message", make_message("video"))
+    assert triggers.match("message", make_message("/video@test_bot arg"))
+    assert not triggers.match("message", make_message("music"))
+    assert triggers.match(
+        "callback_query",
+        CallbackQuery(id="1", from_user=user, chat_instance="1", data="video next 2"),
+    )
+    assert not triggers.match(
+        "callback_query",
+        CallbackQuery(id="1", from_user=user, chat_instance="1", data="music"),
+    )
+
+
+def test_lazy_router_loads_on_first_matching_update(lazy_module):
+    router = LazyRouter(module=lazy_module)
+    loaded = lazy_stats.loaded
+
+    response = asyncio.run(router.propagate_event("message", make_message("music")))
+    assert response is UNHANDLED
+    assert not router.loaded
+    assert f"{lazy_module.package}.router" not in sys.modules
+
+    response = asyncio.run(router.propagate_event("message", make_message("video")))
+    assert response == "handled"
+    assert router.loaded
+    assert lazy_stats.loaded == loaded + 1
+    assert lazy_module.package in lazy_stats.load_time
+
+
+def test_allowed_updates_include_lazy_router_triggers(lazy_module):
+    dp = Dispatcher()
+    main = Router(name="main")
+
+    @main.message()
+    async def start(message):
+        return True
+
+    dp.include_router(main)
+    dp.include_router(LazyRouter(module=lazy_module))
+
+    assert dp.resolve_used_update_types() == ["message"]
+    assert resolve_allowed_updates(dp) == ["callback_query", "message"]
@@ -0,0 +1,46 @@
+from core.logging.factory import LoggerFactory
+from core.logging.format import log_format
+from core.logging.handlers import HandlerRegistry
+
+
+def test_registry_shares_handlers_and_opens_files_lazily(tmp_path):
+    registry = HandlerRegistry()
+    factory = LoggerFactory(
+        base_path=tmp_path,
+        format_log=log_format.LOG_FORMAT,
+        datefmt=log_format.DATE_FORMAT,
+        registry=registry,
+    )
+    first = factory.create(name="test_registry_first", subdir="first")
+    factory.create(name="test_registry_second", subdir="second")
+
+    snapshot = registry.snapshot()
+    assert snapshot["file_handlers"] == 8
+    assert (snapshot["formatters"], snapshot["stream_handlers"]) == (1, 1)
+    assert snapshot["open_files"] == 2  # только info.log с записью о создании логгера
+
+    first.error_logger.error("ошибка")
+    assert registry.snapshot()["open_files"] == 3
+    registry.close()
+
+
+def test_single_file_mode_writes_router_field(tmp_path):
+    registry = HandlerRegistry()
+    factory = LoggerFactory(
+        base_path=tmp_path,
+        format_log=log_format.LOG_FORMAT_WITH_ROUTER,
+        datefmt=log_format.DATE_FORMAT,
+        single_file=True,
+        registry=registry,
+    )
+    first = factory.create(name="test_single_first", subdir="first")
+    second = factory.create(name="test_single_second", subdir="second")
+    first.warning_logger.warning("от первого")
+    second.warning_logger.warning("от второго")
+    registry.close()
+
+    assert registry.snapshot()["file_handlers"] == 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["info.log", "warning.log"]
+    lines = (tmp_path / "warning.log").read_text(encoding="utf-8").splitlines()
+    assert "test_single_first" in lines[0] and "от первого" in lines[0]
+    assert "test_single_second" in lines[1] and "от второго" in lines[1]
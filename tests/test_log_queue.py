@@ -0,0 +1,63 @@
+import logging
+import threading
+import time
+
+from core.logging.factory import LoggerFactory
+from core.logging.format import log_format
+from core.logging.queued import LogQueue
+
+
+class _SlowHandler(logging.Handler):
+    def __init__(self, gate):
+        super().__init__()
+        self.gate = gate
+        self.records = []
+
+    def emit(self, record):
+        self.gate.wait(timeout=5)
+        self.records.append(record.getMessage())
+
+
+def test_log_queue_drops_below_error_when_full():
+    release = threading.Event()
+    handler = _SlowHandler(release)
+    log_queue = LogQueue(maxsize=2, policy="drop")
+    logger = logging.getLogger("test_log_queue_drop")
+    logger.setLevel(logging.INFO)
+    log_queue.attach(logger, [handler])
+
+    logger.info("first")
+    while not log_queue.queue.empty():  # поток взял запись и ждет в обработчике
+        time.sleep(0.01)
+    for index in range(10):
+        logger.info("info %s", index)
+    assert log_queue.stats.dropped == 8
+
+    threading.Timer(0.5, release.set).start()
+    logger.error("error")  # ошибка ждет места в очереди
+    log_queue.stop()
+
+    assert handler.records[-1] == "error"
+    assert len(handler.records) == log_queue.stats.enqueued
+    assert log_queue.stats.blocked == 1
+
+
+def test_factory_writes_through_queue(tmp_path):
+    log_queue = LogQueue()
+    factory = LoggerFactory(
+        base_path=tmp_path,
+        format_log=log_format.LOG_FORMAT,
+        datefmt=log_format.DATE_FORMAT,
+        log_queue=log_queue,
+    )
+    logging_data = factory.create(name="test_log_queue_factory")
+    logging_data.warning_logger.warning("предупреждение")
+    assert logging_data.warning_logger.handlers == [log_queue.handler]
+
+    log_queue.stop()
+    assert "предупреждение" in (tmp_path / "warning.log").read_text(encoding="utf-8")
+    assert "создан" in (tmp_path / "info.log").read_text(encoding="utf-8")
+
+    # После остановки потока запись идет сразу в файл
+    logging_data.error_logger.error("после остановки")
+    assert "после остановки" in (tmp_path / "error.log").read_text(encoding="utf-8")
@@ -0,0 +1,78 @@
+import gzip
+import os
+import time
+
+from core.logging.factory import LoggerFactory
+from core.logging.format import log_format
+from core.logging.handlers import HandlerRegistry
+from core.logging.rotation import LogRotationSettings, prune_logs
+
+
+def test_size_rotation_compresses_in_background(tmp_path):
+    registry = HandlerRegistry()
+    registry.configure_rotation(
+        LogRotationSettings(MODE="size", MAX_BYTES=500, BACKUP_COUNT=2)
+    )
+    factory = LoggerFactory(
+        base_path=tmp_path,
+        format_log=log_format.LOG_FORMAT,
+        datefmt=log_format.DATE_FORMAT,
+        registry=registry,
+    )
+    logging_data = factory.create(name="test_rotation_size", subdir="module")
+    for index in range(40):
+        logging_data.info_logger.info("строка %s %s", index, "x" * 50)
+    registry.rotator.join()
+    registry.close()
+
+    names = sorted(path.name for path in (tmp_path / "module").iterdir())
+    assert names == ["info.log", "info.log.1.gz", "info.log.2.gz"]
+    text = gzip.decompress((tmp_path / "module" / "info.log.1.gz").read_bytes())
+    assert "строка" in text.decode("utf-8")
+
+
+def test_prune_logs_keeps_backup_count_per_log(tmp_path):
+    module = tmp_path / "module"
+    module.mkdir()
+    (module / "info.log").write_text("текущий")
+    now = time.time()
+    for index in range(1, 5):
+        path = module / f"info.log.{index}"
+        path.write_text("старый " * 100)
+        os.utime(path, (now - index * 60, now - index * 60))
+    (module / "error.log.1").write_text("ошибка")
+
+    data = prune_logs(log_dir=tmp_path, backup_count=2)
+
+    assert (data.compressed, data.deleted) == (3, 2)
+    assert sorted(path.name for path in module.iterdir()) == [
+        "error.log.1.gz",
+        "info.log",
+        "info.log.1.gz",
+        "info.log.2.gz",
+    ]
+    assert prune_logs(log_dir=tmp_path, backup_count=2, retention_days=0).deleted == 3
+
+
+def test_module_override_and_process_files(tmp_path):
+    registry = HandlerRegistry()
+    registry.configure_rotation(LogRotationSettings(MODE="size", MAX_BYTES=300))
+    registry.process_name = "worker-1"
+    factory = LoggerFactory(
+        base_path=tmp_path,
+        format_log=log_format.LOG_FORMAT,
+        datefmt=log_format.DATE_FORMAT,
+        registry=registry,
+    )
+    override = registry.rotation.merge({"BACKUP_COUNT": 1})
+    logging_data = factory.create(
+        name="test_rotation_override", subdir="module", rotation=override
+    )
+    for index in range(40):
+        logging_data.info_logger.info("строка %s %s", index, "x" * 50)
+    registry.rotator.join()
+    registry.close()
+
+    names = sorted(path.name for path in (tmp_path / "module").iterdir())
+    assert names == ["info.worker-1.log", "info.worker-1.log.1.gz"]
+    assert registry.rotation_overrides() == {(tmp_path / "module").resolve(): override}
@@ -0,0 +1,51 @@
+import sys
+
+import pytest
+
+from core.module_loader.scaffolding.creator import create_module
+from core.module_loader.runtime.loader import discover_modules
+from core.module_loader.runtime.registry import build_module_registry
+from core.response.modules_loader import ModuleInfo
+
+
+def test_build_module_registry_indexes():
+    modules = [
+        ModuleInfo(package="m.video", root="video", parent=None, settings=None),
+        ModuleInfo(
+            package="m.video.childes.one", root="video", parent="video", settings=None
+        ),
+        ModuleInfo(
+            package="m.video.childes.one.childes.two",
+            root="video",
+            parent="video",
+            settings=None,
+        ),
+        ModuleInfo(package="m.music", root="music", parent=None, settings=None),
+    ]
+    registry = build_module_registry(modules)
+
+    assert len(registry) == 4
+    assert [m.root for m in registry.roots] == ["video", "music"]
+    assert registry.get("m.video.childes.one").parent == "video"
+    assert len(registry.by_root["video"]) == 3
+    assert len(registry.by_parent["video"]) == 2
+    assert registry.by_depth[2][0].package == "m.video.childes.one.childes.two"
+    assert "music" not in registry.by_parent
+
+    with pytest.raises(TypeError):
+        registry.by_package["x"] = modules[0]
+
+
+def test_discover_modules_imports_only_settings(modules_root):
+    root_dir, root_package = modules_root
+    create_module(root_dir=root_dir, root_package=root_package, module_name="test.data")
+
+    result = discover_modules(root_package=root_package)
+    assert result.ok
+
+    registry = result.data
+    assert [m.package for m in registry.roots] == [f"{root_package}.test"]
+    child = registry.get(f"{root_package}.test.childes.data")
+    assert child.config.SERVICE_NAME == "test.childes.data"
+    assert child.router is None
+    assert f"{root_package}.test.router" not in sys.modules
@@ -0,0 +1,119 @@
+import importlib
+import json
+import shutil
+import sys
+
+from core.module_loader.scaffolding.creator import create_module
+from core.module_loader.runtime.loader import (
+    discover_modules,
+    rebuild_modules_manifest,
+    walk_module_entries,
+)
+from core.module_loader.runtime.manifest import (
+    build_manifest,
+    load_manifest,
+    manifest_stats,
+    save_manifest,
+)
+
+
+def test_manifest_hit_and_miss(modules_root):
+    root_dir, root_package = modules_root
+    manifest_path = root_dir / "cache" / "modules_manifest.json"
+
+    create_module(root_dir=root_dir, root_package=root_package, module_name="test.data")
+
+    result = rebuild_modules_manifest(
+        manifest_path=manifest_path,
+        root_package=root_package,
+    )
+    assert result.ok
+    assert result.data == 2
+
+    hits = manifest_stats.hits
+    entries = load_manifest(path=manifest_path, root_package=root_package)
+    assert manifest_stats.hits == hits + 1
+    assert {entry.package for entry in entries} == {
+        f"{root_package}.test",
+        f"{root_package}.test.childes.data",
+    }
+    child = [entry for entry in entries if entry.parent is not None][0]
+    assert child.root == "test"
+    assert child.parent == "test"
+
+    # Добавление дочернего модуля делает manifest устаревшим
+    create_module(
+        root_dir=root_dir, root_package=root_package, module_name="test.video"
+    )
+    misses = manifest_stats.misses
+    assert load_manifest(path=manifest_path, root_package=root_package) is None
+    assert manifest_stats.misses == misses + 1
+    assert manifest_stats.last_reason.startswith("directory changed")
+
+
+def test_manifest_miss_when_missing_or_other_package(modules_root):
+    root_dir, root_package = modules_root
+    manifest_path = root_dir / "cache" / "modules_manifest.json"
+
+    assert load_manifest(path=manifest_path, root_package=root_package) is None
+    assert manifest_stats.last_reason == "manifest not found"
+
+    create_module(root_dir=root_dir, root_package=root_package, module_name="test")
+    rebuild_modules_manifest(manifest_path=manifest_path, root_package=root_package)
+
+    assert load_manifest(path=manifest_path, root_package="other.modules") is None
+    assert manifest_stats.last_reason == "root_package changed"
+
+
+def test_manifest_survives_moving_checkout(modules_root):
+    root_dir, root_package = modules_root
+    source_dir = root_dir / "source"
+    create_module(
+        root_dir=source_dir, root_package=root_package, module_name="test.data"
+    )
+    package_dir = source_dir / root_package.split(".")[0]
+    for directory in [package_dir, package_dir / "bot", package_dir / "bot/modules"]:
+        (directory / "__init__.py").write_text("")
+
+    sys.path.insert(0, str(source_dir))
+    try:
+        package = importlib.import_module(root_package)
+        entries = walk_module_entries(package=package, root_package=root_package)
+        manifest = build_manifest(
+            entries=entries,
+            package_paths=package.__path__,
+            root_package=root_package,
+            base_dir=source_dir,
+        )
+    finally:
+        sys.path.remove(str(source_dir))
+    paths = [*manifest["files"], *manifest["directories"]]
+    assert not any(path.startswith(str(root_dir)) for path in paths)
+
+    moved_dir = root_dir / "moved"
+    shutil.copytree(source_dir, moved_dir)
+    manifest_path = moved_dir / "cache" / "modules_manifest.json"
+    save_manifest(path=manifest_path, manifest=manifest)
+
+    entries = load_manifest(
+        path=manifest_path, root_package=root_package, base_dir=moved_dir
+    )
+    assert manifest_stats.last_status == "hit"
+    assert all(entry.settings_path.startswith(str(moved_dir)) for entry in entries)
+    assert json.loads(manifest_path.read_text())["version"] == 2
+
+
+def test_manifest_save_error_does_not_stop_discovery(modules_root):
+    root_dir, root_package = modules_root
+    create_module(root_dir=root_dir, root_package=root_package, module_name="test")
+    (root_dir / "cache").write_text("не директория")
+
+    save_errors = manifest_stats.save_errors
+    result = discover_modules(
+        root_package=root_package,
+        manifest_path=root_dir / "cache" / "modules_manifest.json",
+    )
+
+    assert result.ok
+    assert manifest_stats.save_errors == save_errors + 1
+    assert manifest_stats.last_status == "save error"
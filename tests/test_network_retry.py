@@ -0,0 +1,139 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import ClientSession, web
+
+from core.error_handlers.network import error_handler_for_the_website
+from core.error_handlers.retry import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+policy = RetryPolicy(attempts=3, backoff=0.01, jitter=0)
+
+
+@pytest.fixture
+def fetch(serve, logging_data):
+    async def fetch(statuses, repeat=1, **kwargs):
+        calls = []
+
+        async def handler(request):
+            calls.append(1)
+            status = statuses[min(len(calls), len(statuses)) - 1]
+            return web.json_response({"ok": status == 200}, status=status)
+
+        app = web.Application()
+        app.router.add_route("*", "/", handler)
+        async with serve(app) as server, ClientSession() as session:
+            results = [
+                await error_handler_for_the_website(
+                    session=session,
+                    url=str(server.make_url("/")),
+                    logging_data=logging_data,
+                    **kwargs,
+                )
+                for _ in range(repeat)
+            ]
+        return results[-1], len(calls)
+
+    return fetch
+
+
+def test_retry_on_status(fetch):
+    result, calls = asyncio.run(fetch([503, 503, 200], retry=policy))
+    assert result.ok
+    assert calls == 3
+
+    result, calls = asyncio.run(fetch([503, 503, 200]))
+    assert result.status == 503
+    assert calls == 1
+
+
+def test_retry_does_not_repeat_client_errors(fetch):
+    result, calls = asyncio.run(fetch([404, 200], retry=policy))
+    assert result.status == 404
+    assert calls == 1
+
+
+def test_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert policy.get_delay(attempt=1, retry_after="1") == 1.0
+    assert policy.get_delay(attempt=1, retry_after="120") is None
+    assert policy.get_delay(attempt=3) == 0.04
+
+
+def test_circuit_breaker_half_open():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.snapshot()["rejected"] == 2
+
+
+def test_circuit_breaker_rejects_requests(fetch):
+    breakers = CircuitBreakerRegistry(failure_threshold=3, recovery_timeout=60)
+    result, calls = asyncio.run(
+        fetch([500], repeat=2, retry=policy, breakers=breakers)
+    )
+    assert result.error.code == "CIRCUIT_OPEN"
+    assert calls == 3
+    assert list(breakers.snapshot().values())[0]["state"] == "open"
+
+
+def test_retry_skips_non_idempotent_methods(fetch):
+    result, calls = asyncio.run(fetch([503, 200], retry=policy, method="POST"))
+    assert result.status == 503
+    assert calls == 1
+
+    post_policy = RetryPolicy(attempts=3, backoff=0.01, jitter=0, methods=("POST",))
+    result, calls = asyncio.run(fetch([503, 200], retry=post_policy, method="POST"))
+    assert result.ok
+    assert calls == 2
+
+
+def test_circuit_breaker_releases_cancelled_probe():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow() and breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+    breaker.release_probe()
+    assert breaker.allow()
+
+
+def test_circuit_breaker_counts_429_as_failure(fetch):
+    breakers = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=60)
+    result, _ = asyncio.run(fetch([429], repeat=2, breakers=breakers))
+    assert result.error.code == "CIRCUIT_OPEN"
+
+
+def test_local_errors_do_not_open_circuit(fetch, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    breakers = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=60)
+    result, calls = asyncio.run(
+        fetch(
+            [200],
+            repeat=2,
+            retry=policy,
+            breakers=breakers,
+            data_type="FILE",
+            file_path=blocker / "image.png",  # запись на диск падает с OSError
+        )
+    )
+    assert result.error.code != "CIRCUIT_OPEN"
+    assert calls == 2
+    assert list(breakers.snapshot().values())[0]["state"] == "closed"
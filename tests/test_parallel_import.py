@@ -0,0 +1,59 @@
+import sys
+import uuid
+
+import pytest
+
+from core.module_loader.runtime.parallel import import_modules, import_stats
+from core.profiling.startup import profiler
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """Создает пакет с модулями двух корневых модулей."""
+    name = f"parallel_app_{uuid.uuid4().hex[:8]}"
+    package_dir = tmp_path / name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    for module in ["video", "video_child", "music"]:
+        (package_dir / f"{module}.py").write_text(f"NAME = '{module}'\n")
+    (package_dir / "runs.py").write_text("COUNT = []\n")
+    (package_dir / "broken.py").write_text(
+        "from . import runs\nruns.COUNT.append(1)\nraise ValueError('broken')\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+
+    for module in list(sys.modules):
+        if module.startswith(name):
+            del sys.modules[module]
+
+
+def test_import_modules_parallel(package):
+    groups = [
+        [f"{package}.video", f"{package}.video_child"],
+        [f"{package}.music"],
+    ]
+    profiler.enable(trace_memory=False)
+    try:
+        result = import_modules(groups=groups, max_workers=2)
+    finally:
+        profiler.disable()
+
+    assert result.ok
+    assert result.data[f"{package}.video_child"].NAME == "video_child"
+    assert import_stats.mode == "parallel"
+    assert import_stats.workers == 2
+    assert {f"{package}.video", f"{package}.music"} <= set(import_stats.timings)
+    modules = profiler.report()["modules"]
+    assert all("safe_import" in modules[name] for name in result.data)
+
+
+def test_import_modules_failure_returns_fail(package):
+    groups = [[f"{package}.broken"], [f"{package}.music"]]
+    result = import_modules(groups=groups, max_workers=2)
+
+    assert not result.ok
+    assert result.error.code == "IMPORT ERROR"
+    # Модуль с ошибкой не импортируется повторно
+    assert f"{package}.broken" not in import_stats.retried
+    assert sys.modules[f"{package}.runs"].COUNT == [1]
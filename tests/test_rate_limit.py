@@ -0,0 +1,66 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import ClientSession, web
+from pydantic import ValidationError
+
+from core.error_handlers.network import error_handler_for_the_website
+from core.error_handlers.rate_limit import RateLimiter, RateLimitSettings, TokenBucket
+
+
+def test_token_bucket_queues_requests():
+    bucket = TokenBucket(rate=50, burst=2)
+
+    async def main():
+        start = time.monotonic()
+        await asyncio.gather(*[bucket.acquire() for _ in range(7)])
+        return time.monotonic() - start
+
+    duration = asyncio.run(main())
+    assert duration >= 0.09
+    assert bucket.stats.acquired == 7
+    assert bucket.stats.max_queued >= 5
+    assert bucket.stats.queued == 0
+    assert bucket.stats.delayed >= 5
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_rate_limit_rejects_invalid_settings(rate, burst):
+    with pytest.raises(ValidationError):
+        RateLimitSettings(RATE=rate, BURST=burst)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate, burst=burst)
+
+
+def test_rate_limiter_module_priority():
+    limiter = RateLimiter()
+    limiter.configure("api.example.com", RateLimitSettings(RATE=1))
+    limiter.configure("api.example.com", RateLimitSettings(RATE=5), module="video")
+
+    assert limiter.get("api.example.com", module="video").rate == 5
+    assert limiter.get("api.example.com", module="music").rate == 1
+    assert limiter.get("example.com") is None
+
+
+def test_error_handler_rate_limited(serve, logging_data):
+    limiter = RateLimiter()
+    limiter.configure("127.0.0.1", RateLimitSettings(RATE=100, BURST=5))
+
+    async def handler(request):
+        return web.json_response({}, status=429, headers={"Retry-After": "0"})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        async with serve(app) as server, ClientSession() as session:
+            return await error_handler_for_the_website(
+                session=session,
+                url=str(server.make_url("/")),
+                logging_data=logging_data,
+                rate_limiter=limiter,
+            )
+
+    result = asyncio.run(main())
+    assert result.error.code == "RATE_LIMITED"
+    assert limiter.snapshot()["127.0.0.1"]["throttled"] == 1
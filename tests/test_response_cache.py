@@ -0,0 +1,176 @@
+import asyncio
+import os
+import time
+
+import pytest
+from aiohttp import ClientSession, web
+
+from core.error_handlers.cache import ResponseCache
+from core.error_handlers.network import error_handler_for_the_website
+
+
+async def _fetch_all(serve, logging_data, handler, calls_kwargs):
+    app = web.Application()
+    app.router.add_get("/api", handler)
+    async with serve(app) as server, ClientSession() as session:
+        return [
+            await error_handler_for_the_website(
+                session=session,
+                url=str(server.make_url("/api")),
+                logging_data=logging_data,
+                **kwargs,
+            )
+            for kwargs in calls_kwargs
+        ]
+
+
+@pytest.fixture
+def fetch(serve, logging_data):
+    async def fetch(cache, cache_control, repeat=2, caches=None):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.json_response(
+                {"items": [1, 2, 3]},
+                headers={"Cache-Control": cache_control, "ETag": '"v1"'},
+            )
+
+        results = await _fetch_all(
+            serve,
+            logging_data,
+            handler,
+            [{"cache": request_cache} for request_cache in caches or [cache] * repeat],
+        )
+        return results, calls
+
+    return fetch
+
+
+@pytest.fixture
+def fetch_with_headers(serve, logging_data):
+    async def fetch_with_headers(cache, headers_list, response_headers):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.headers.get("Accept"))
+            return web.json_response(
+                {"accept": request.headers.get("Accept")}, headers=response_headers
+            )
+
+        results = await _fetch_all(
+            serve,
+            logging_data,
+            handler,
+            [{"headers": headers, "cache": cache} for headers in headers_list],
+        )
+        return results, calls
+
+    return fetch_with_headers
+
+
+def test_response_cache_max_age(fetch):
+    cache = ResponseCache()
+    results, calls = asyncio.run(fetch(cache, "max-age=60"))
+
+    assert len(calls) == 1
+    assert results[1].data == {"items": [1, 2, 3]}
+    assert results[1].headers.get("Content-Type").startswith("application/json")
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert cache.stats.bytes_saved > 0
+
+
+def test_response_cache_revalidates_with_etag(fetch):
+    cache = ResponseCache()
+    results, calls = asyncio.run(fetch(cache, "no-cache"))
+
+    assert calls == [None, '"v1"']
+    assert results[1].ok and results[1].status == 200
+    assert results[1].data == {"items": [1, 2, 3]}
+    assert cache.stats.revalidated == 1
+
+
+def test_response_cache_no_store(fetch):
+    cache = ResponseCache()
+    _, calls = asyncio.run(fetch(cache, "no-store"))
+
+    assert len(calls) == 2
+    assert len(cache) == 0
+
+
+def test_response_cache_disk(fetch, tmp_path):
+    caches = [ResponseCache(disk_dir=tmp_path), ResponseCache(disk_dir=tmp_path)]
+    results, calls = asyncio.run(fetch(None, "max-age=60", caches=caches))
+
+    assert len(calls) == 1
+    assert caches[1].stats.hits == 1
+    assert results[1].data == {"items": [1, 2, 3]}
+
+
+def test_response_cache_disk_error_keeps_memory_entry(fetch, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = ResponseCache(disk_dir=blocker / "cache")  # mkdir падает с OSError
+    results, calls = asyncio.run(fetch(cache, "max-age=60"))
+
+    assert len(calls) == 1
+    assert results[0].ok and results[1].data == {"items": [1, 2, 3]}
+    assert cache.stats.disk_errors == 1
+
+
+def test_response_cache_prunes_disk(tmp_path):
+    cache = ResponseCache(maxsize=2, disk_dir=tmp_path)
+    now = time.time()
+    for index, expires in enumerate([now - 10, now + 10, now + 20, now + 30]):
+        path = tmp_path / f"{index}.json"
+        path.write_text("{}")
+        os.utime(path, (now, expires))
+    cache._prune_disk()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["2.json", "3.json"]
+    assert cache.stats.disk_evictions == 2
+
+
+def test_response_cache_keys_on_request_headers(fetch_with_headers):
+    cache = ResponseCache()
+    headers_list = [{"Accept": "application/json"}, {"Accept": "text/plain"}] * 2
+    results, calls = asyncio.run(
+        fetch_with_headers(
+            cache, headers_list, {"Cache-Control": "max-age=60", "Vary": "Accept"}
+        )
+    )
+
+    assert calls == ["application/json", "text/plain"]
+    assert [result.data["accept"] for result in results] == [
+        "application/json",
+        "text/plain",
+    ] * 2
+
+
+def test_response_cache_skips_private_responses(fetch_with_headers):
+    for headers_list, response_headers in [
+        ([{"Authorization": "Bearer 1"}] * 2, {"Cache-Control": "max-age=60"}),
+        ([None] * 2, {"Cache-Control": "private, max-age=60"}),
+        ([None] * 2, {"Cache-Control": "max-age=60", "Vary": "*"}),
+    ]:
+        cache = ResponseCache()
+        _, calls = asyncio.run(
+            fetch_with_headers(cache, headers_list, response_headers)
+        )
+
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+
+def test_response_cache_ignores_broken_disk_entries(tmp_path):
+    cache = ResponseCache(disk_dir=tmp_path)
+    key = cache.make_key(method="GET", url="u", data_type="JSON")
+    for broken in ["[]", "{}", '{"url": "u"}', "not json"]:
+        path = tmp_path / f"{key}.json"
+        path.write_text(broken)
+
+        assert asyncio.run(cache.get(key)) is None
+        assert not path.exists()
+    assert cache.stats.disk_corrupted == 4
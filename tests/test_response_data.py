@@ -0,0 +1,45 @@
+import pickle
+
+from multidict import CIMultiDictProxy
+
+from core.error_handlers.cache import CacheEntry
+from core.error_handlers.helpers import fail, network_fail, network_ok, ok
+from core.response.response_data import NetworkResponseResultModel, ResultModel
+
+
+def test_results_keep_pydantic_api():
+    result = fail(code="ERROR", message="Ошибка", details={"id": 1})
+    assert (result.ok, result.data, result.error.code) == (False, None, "ERROR")
+    assert result.model_dump() == ResultModel(**result.model_dump()).model_dump()
+    assert result.to_model().error.details == {"id": 1}
+    assert pickle.loads(pickle.dumps(result)) == result
+    assert ok(data=1) != ok(data=2)
+
+    network = network_fail(
+        code="NETWORK ERROR", message="Ошибка", url="u", status=404, method="GET"
+    )
+    assert isinstance(network.to_model(), NetworkResponseResultModel)
+    assert network.model_dump()["error"]["message"] == "Ошибка"
+
+
+def test_network_headers_are_always_case_insensitive():
+    network = network_ok(
+        data=b"", url="u", status=200, method="GET", headers={"Content-Type": "image/png"}
+    )
+    cached = CacheEntry(
+        data=b"",
+        url="u",
+        status=200,
+        method="GET",
+        headers=[("Set-Cookie", "a=1"), ("Set-Cookie", "b=2")],
+        data_type="BYTES",
+        expires=0,
+        size=0,
+    ).to_result()
+
+    for result in (network, cached):
+        assert isinstance(result.headers, CIMultiDictProxy)
+    assert network.headers["content-type"] == "image/png"
+    assert cached.headers.getall("set-cookie") == ["a=1", "b=2"]
+    assert pickle.loads(pickle.dumps(cached)) == cached
+    assert network.model_dump()["headers"] == {"Content-Type": "image/png"}
@@ -0,0 +1,107 @@
+import asyncio
+import time
+
+import pytest
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from aiogram.methods import GetMe, SendMessage, SendPhoto
+from aiogram.types import InputMediaPhoto
+
+from app.app_utils.broadcast import broadcast, send_media_groups
+from app.bot.core.middleware.throttling import SendSchedulerMiddleware
+
+
+def test_scheduler_limits_chat_and_retries():
+    scheduler = SendSchedulerMiddleware(global_rate=1000, chat_rate=20, chat_burst=1)
+    calls = []
+
+    async def make_request(bot, method):
+        calls.append(type(method).__name__)
+        if len(calls) == 2:
+            raise TelegramRetryAfter(method=method, message="flood", retry_after=0)
+        return "ok"
+
+    async def main():
+        start = time.monotonic()
+        await scheduler(make_request, None, GetMe())
+        for _ in range(4):
+            await scheduler(make_request, None, SendMessage(chat_id=1, text="x"))
+        return time.monotonic() - start
+
+    duration = asyncio.run(main())
+    assert calls.count("SendMessage") == 5
+    assert duration >= 0.15
+    snapshot = scheduler.snapshot()
+    assert (snapshot["sent"], snapshot["retried"], snapshot["chats"]) == (4, 1, 1)
+
+
+def test_broadcast_collects_errors_and_cancels():
+    async def send(bot, chat_id):
+        if chat_id == 3:
+            raise TelegramForbiddenError(method=GetMe(), message="blocked")
+
+    async def main(limit):
+        calls = []
+
+        async def update_progress():
+            calls.append(1)
+            return len(calls) < limit
+
+        return await broadcast(
+            bot=None,
+            chat_ids=[1, 2, 3, 3, 4, 5],
+            send=send,
+            concurrency=1,
+            update_progress=update_progress,
+        )
+
+    result = asyncio.run(main(limit=100))
+    assert (result.total, result.sent, result.failed) == (5, 4, 1)
+    assert 3 in result.errors
+
+    result = asyncio.run(main(limit=2))
+    assert result.cancelled
+    assert result.sent == 2
+
+
+def test_broadcast_stops_workers_on_unexpected_error():
+    sent = []
+
+    async def send(bot, chat_id):
+        if chat_id == 1:
+            raise ValueError("ошибка отправки")
+        await asyncio.sleep(0.01)
+        sent.append(chat_id)
+
+    async def main():
+        with pytest.raises(ValueError):
+            await broadcast(bot=None, chat_ids=range(1, 20), send=send, concurrency=2)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    assert sent == []
+
+
+def test_single_media_keeps_caption_formatting():
+    class FakeBot:
+        def __init__(self):
+            self.methods = []
+
+        async def __call__(self, method):
+            self.methods.append(method)
+            return method
+
+    bot = FakeBot()
+    media = InputMediaPhoto(
+        media="file-id", caption="<b>фото</b>", parse_mode="HTML", has_spoiler=True
+    )
+    asyncio.run(
+        send_media_groups(
+            bot=bot, chat_id=1, media=[media], caption="подпись", protect_content=True
+        )
+    )
+
+    (method,) = bot.methods
+    assert isinstance(method, SendPhoto)
+    assert (method.photo, method.caption) == ("file-id", "подпись")
+    assert method.parse_mode == "HTML"
+    assert method.has_spoiler and method.protect_content
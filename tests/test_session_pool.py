@@ -0,0 +1,44 @@
+import asyncio
+
+from aiohttp import web
+
+from core.contracts.constants import DEFAULT_USER_AGENT
+from core.utils.session_pool import SessionPool, UpstreamSettings
+
+
+def test_session_pool(serve):
+    agents = []
+
+    async def handler(request):
+        agents.append(request.headers.get("User-Agent"))
+        return web.Response(text="ok")
+
+    async def redirect(request):
+        raise web.HTTPFound("/")
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        app.router.add_get("/redirect", redirect)
+        async with serve(app) as server, SessionPool(
+            default=UpstreamSettings(),
+            upstreams={"127.0.0.1": UpstreamSettings(LIMIT=4, HEADERS={})},
+        ) as pool:
+            assert pool.for_url("https://example.com/a") is pool.get()
+            session = pool.for_url(str(server.make_url("/")))
+            for path in ("/", "/", "/redirect"):
+                async with session.get(server.make_url(path)) as resp:
+                    await resp.read()
+            async with pool.get().get(server.make_url("/")) as resp:
+                await resp.read()
+            return pool.snapshot()
+
+    snapshot = asyncio.run(main())
+    upstream = snapshot["127.0.0.1"]
+    assert upstream["requests"] == 3
+    assert upstream["active"] == 0
+    assert upstream["connections_created"] == 1
+    assert upstream["connections_reused"] == 3  # редирект идет по тому же соединению
+    assert snapshot["default"]["requests"] == 1
+    assert agents[-1] == DEFAULT_USER_AGENT
+    assert agents[0] != DEFAULT_USER_AGENT
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientSession, web
+
+from core.error_handlers.network import error_handler_for_the_website
+from core.error_handlers.singleflight import SingleFlight
+
+
+def test_singleflight_coalesces_concurrent_calls():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"ok": True}
+
+    async def main():
+        flight = SingleFlight()
+        results = await asyncio.gather(*[flight.do("key", fetch) for _ in range(10)])
+        await flight.do("key", fetch)
+        return flight, results
+
+    flight, results = asyncio.run(main())
+    assert len(calls) == 2
+    assert all(result is results[0] for result in results)
+    assert (flight.stats.executed, flight.stats.coalesced) == (2, 9)
+    assert flight.stats.in_flight == 0
+
+
+def test_singleflight_cancel_waiter_and_errors():
+    async def fetch():
+        await asyncio.sleep(0.02)
+        raise ValueError("upstream")
+
+    async def main():
+        flight = SingleFlight()
+        first = asyncio.ensure_future(flight.do("key", fetch))
+        second = asyncio.ensure_future(flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(ValueError):
+            await second
+
+    asyncio.run(main())
+
+
+def test_error_handler_singleflight(serve, logging_data):
+    calls = []
+
+    async def handler(request):
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return web.json_response({"items": [1]})
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/api", handler)
+        flight = SingleFlight()
+        async with serve(app) as server, ClientSession() as session:
+            return await asyncio.gather(
+                *[
+                    error_handler_for_the_website(
+                        session=session,
+                        url=str(server.make_url("/api")),
+                        logging_data=logging_data,
+                        singleflight=flight,
+                    )
+                    for _ in range(20)
+                ]
+            )
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result.data == {"items": [1]} for result in results)
@@ -0,0 +1,55 @@
+import json
+import threading
+
+from core.profiling.startup import StartupProfiler
+
+
+def test_profiler_records_only_when_enabled(tmp_path):
+    profiler = StartupProfiler()
+
+    @profiler.profile(phase="safe_import", arg="module_package")
+    def safe_import(module_package):
+        return [0] * 1000
+
+    safe_import("app.disabled")
+    assert profiler.records == []
+
+    profiler.enable()
+    with profiler.measure(phase="create_app_context"):
+        safe_import(module_package="app.bot.modules.test.settings")
+        safe_import("app.bot.modules.test.router")
+    profiler.disable()
+
+    report = profiler.report()
+    assert report["phases"]["safe_import"]["count"] == 2
+    assert report["phases"]["create_app_context"]["count"] == 1
+    assert "app.bot.modules.test.router" in report["modules"]
+
+    nested = [r for r in profiler.records if r.phase == "safe_import"]
+    assert all(record.depth == 1 for record in nested)
+
+    path = profiler.save_report(tmp_path / "startup_profile.json")
+    assert json.loads(path.read_text(encoding="utf-8"))["total"] >= 0
+    assert "safe_import" in profiler.format_report()
+
+
+def test_profiler_depth_is_per_thread():
+    profiler = StartupProfiler()
+    profiler.enable(trace_memory=False)
+    barrier = threading.Barrier(4)
+
+    def work(name):
+        with profiler.measure(phase="outer", name=name):
+            barrier.wait()
+            with profiler.measure(phase="inner", name=name):
+                barrier.wait()
+
+    threads = [threading.Thread(target=work, args=(str(i),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    profiler.disable()
+
+    depths = {(record.phase, record.depth) for record in profiler.records}
+    assert depths == {("outer", 0), ("inner", 1)}
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from aiohttp import ClientSession, web
+
+from core.contracts.constants import DEFAULT_USER_AGENT
+from core.utils.network import get_and_save_image, iter_download_images
+
+
+IMAGE = b"\x89PNG" + b"0" * 200_000
+AGENTS = []
+
+
+@pytest.fixture
+def download(serve, logging_data):
+    async def download(tmp_path, stream=True, **kwargs):
+        async def image(request):
+            AGENTS.append(request.headers.get("User-Agent"))
+            return web.Response(body=IMAGE, content_type="image/png")
+
+        app = web.Application()
+        app.router.add_get("/image", image)
+        async with serve(app) as server, ClientSession() as session:
+            return await get_and_save_image(
+                data_requests=str(server.make_url("/image")),
+                path_img=tmp_path / "images" / "photo.jpg",
+                session=session,
+                logging_data=logging_data,
+                stream=stream,
+                **kwargs,
+            )
+
+    return download
+
+
+def test_stream_download_saves_file(download, tmp_path):
+    # Файл с именем из path_img не должен перезаписываться промежуточной загрузкой
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "photo.jpg").write_bytes(b"old")
+    result = asyncio.run(download(tmp_path))
+
+    assert result.ok
+    assert result.data == tmp_path / "images" / "photo.png"
+    assert result.data.read_bytes() == IMAGE
+    assert (tmp_path / "images" / "photo.jpg").read_bytes() == b"old"
+    assert sorted((tmp_path / "images").iterdir()) == [
+        tmp_path / "images" / "photo.jpg",
+        result.data,
+    ]
+    assert AGENTS[-1] == DEFAULT_USER_AGENT  # у сессии нет своего User-Agent
+
+
+def test_stream_download_max_size(download, tmp_path):
+    for stream in (True, False):
+        result = asyncio.run(download(tmp_path, stream=stream, max_size=1000))
+
+        assert not result.ok
+        assert result.error.code == "FILE_TOO_LARGE"
+        assert not list(tmp_path.rglob("photo*"))
+
+
+@pytest.fixture
+def download_batch(serve, logging_data):
+    async def download_batch(tmp_path, cancel_after=None):
+        active = {"now": 0, "max": 0, "requests": 0}
+
+        async def image(request):
+            active["requests"] += 1
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return web.Response(body=IMAGE, content_type="image/png")
+
+        calls = []
+
+        async def update_progress():
+            calls.append(1)
+            return cancel_after is None or len(calls) < cancel_after
+
+        app = web.Application()
+        app.router.add_get("/{name}", image)
+        async with serve(app) as server, ClientSession() as session:
+            items = [
+                (str(server.make_url(f"/{number % 6}")), tmp_path / f"{number}.jpg")
+                for number in range(12)
+            ]
+            # Полный повтор пары скачивается и возвращается один раз
+            items.append(items[0])
+            results = [
+                result
+                async for result in iter_download_images(
+                    items=items,
+                    session=session,
+                    logging_data=logging_data,
+                    limit_per_host=2,
+                    update_progress=update_progress,
+                )
+            ]
+        return results, active, calls
+
+    return download_batch
+
+
+def test_iter_download_images(download_batch, tmp_path):
+    results, active, calls = asyncio.run(download_batch(tmp_path))
+
+    # Каждый URL скачивается один раз, в остальные пути файл копируется
+    assert active["requests"] == 6
+    assert len(results) == 12
+    assert all(result.ok for result in results)
+    assert sorted(result.data.name for result in results) == sorted(
+        f"{number}.png" for number in range(12)
+    )
+    assert all(result.data.read_bytes() == IMAGE for result in results)
+    assert active["max"] <= 2
+    assert len(calls) == 12
+
+
+def test_iter_download_images_cancel(download_batch, tmp_path):
+    results, _, calls = asyncio.run(download_batch(tmp_path, cancel_after=2))
+
+    assert len(results) == 2
+    assert len(calls) == 2
@@ -0,0 +1,67 @@
+import json
+import logging
+from types import SimpleNamespace
+
+from core.error_handlers.format import EventErrorMessage, format_errors_message
+from core.logging.factory import LoggerFactory
+from core.logging.format import log_format
+from core.logging.handlers import HandlerRegistry
+
+
+def test_error_message_is_formatted_only_when_emitted(monkeypatch):
+    calls = []
+    message = format_errors_message(name_router="test", status=500, error_text="boom")
+    render = type(message).render
+    monkeypatch.setattr(type(message), "render", lambda self: calls.append(1) or render(self))
+
+    logger = logging.getLogger("test_lazy_disabled")
+    logger.setLevel(logging.CRITICAL)
+    logger.error(message)
+    assert calls == []
+
+    assert str(message).startswith("[500] <no method> <unknown>\nRouter: test\n")
+    str(message)
+    assert calls == [1]
+
+
+def test_json_mode_writes_structured_lines(tmp_path):
+    registry = HandlerRegistry()
+    factory = LoggerFactory(
+        base_path=tmp_path,
+        format_log=log_format.LOG_FORMAT,
+        datefmt=log_format.DATE_FORMAT,
+        registry=registry,
+        json_format=True,
+    )
+    logging_data = factory.create(name="test_json_router", subdir="module")
+    logging_data.error_logger.error(
+        format_errors_message(
+            name_router=logging_data.router_name,
+            method="GET",
+            status=404,
+            url="https://example.com",
+            error_text="not found",
+            function_name="fetch",
+        )
+    )
+    try:
+        raise ValueError("ошибка обработчика")
+    except ValueError as err:
+        event = SimpleNamespace(from_user=SimpleNamespace(id=42, username="user"))
+        logging_data.error_logger.error(
+            EventErrorMessage(name_router="x", event=event, error=err, duration=0.25)
+        )
+    registry.close()
+
+    lines = (tmp_path / "module" / "error.log").read_text(encoding="utf-8").splitlines()
+    request, event_error = [json.loads(line) for line in lines]
+    assert request["router"] == "test_json_router"
+    assert (request["function"], request["status"], request["url"]) == (
+        "fetch",
+        404,
+        "https://example.com",
+    )
+    assert request["message"] == "not found"
+    assert (event_error["user_id"], event_error["duration"]) == (42, 0.25)
+    assert event_error["router"] == "test_json_router"
+    assert "ValueError: ошибка обработчика" in event_error["exc"]
@@ -0,0 +1,41 @@
+import asyncio
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Message
+
+from app.bot.core.webhook import create_webhook_app
+from core.scripts.bot.webhook_harness import post_synthetic_updates
+
+
+def test_webhook_checks_secret_and_limits_concurrency(serve):
+    dp = Dispatcher()
+    handled = []
+    active = [0, 0]  # текущее и максимальное количество обработок
+
+    @dp.message()
+    async def handler(message: Message) -> None:
+        active[0] += 1
+        active[1] = max(active[1], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        handled.append(message.message_id)
+
+    async def main():
+        bot = Bot(token="42:TEST")
+        app = create_webhook_app(
+            dp=dp, bot=bot, path="/webhook", secret_token="secret", max_concurrency=2
+        )
+        async with serve(app) as server:
+            url = str(server.make_url("/webhook"))
+            wrong = await post_synthetic_updates(url=url, secret_token="wrong", count=3)
+            stats = await post_synthetic_updates(
+                url=url, secret_token="secret", count=20, concurrency=5
+            )
+        return wrong, stats
+
+    wrong, stats = asyncio.run(main())
+    assert wrong.statuses == {401: 3}
+    assert stats.statuses == {200: 20}
+    # Остановка сервера дожидается начатых обработок
+    assert sorted(handled) == list(range(1, 21))
+    assert active[1] <= 2
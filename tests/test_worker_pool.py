@@ -0,0 +1,117 @@
+import asyncio
+import multiprocessing
+import time
+
+from core.utils.worker_pool import KeyedTaskRunner, WorkerPool, get_update_route_key
+
+
+def _echo_worker(index, queue, heartbeat, results):
+    heartbeat.value = time.time()
+    while True:
+        update = queue.get()
+        if update is None:
+            break
+        if update.get("crash"):
+            raise SystemExit(1)
+        results.put((index, update["message"]["chat"]["id"], update["update_id"]))
+        if update.get("hang"):
+            # Ответ дописывается до зависания, иначе убитый процесс может оставить
+            # очередь results заблокированной
+            results.close()
+            results.join_thread()
+            heartbeat.value = 0.0
+            time.sleep(3600)
+
+
+def _executor_worker(index, queue, heartbeat, results):
+    from core.utils.executors import ExecutorSettings, executor_manager
+
+    executor_manager.configure("cpu", ExecutorSettings(KIND="process", MAX_WORKERS=1))
+    while queue.get() is not None:
+        results.put(asyncio.run(executor_manager.run("cpu", pow, 2, 10)))
+    executor_manager.shutdown()
+
+
+def _make_update(update_id, chat_id, **kwargs):
+    return {"update_id": update_id, "message": {"chat": {"id": chat_id}}, **kwargs}
+
+
+def test_route_key():
+    assert get_update_route_key(_make_update(1, -100)) == -100
+    callback = {
+        "update_id": 2,
+        "callback_query": {"from": {"id": 5}, "message": {"chat": {"id": 7}}},
+    }
+    assert get_update_route_key(callback) == 7
+    assert get_update_route_key({"update_id": 3, "inline_query": {"from": {"id": 5}}}) == 5
+    assert get_update_route_key({"update_id": 4}) == 4
+
+
+def test_keyed_runner_keeps_order_per_key():
+    calls = []
+
+    async def job(key, number, delay):
+        await asyncio.sleep(delay)
+        calls.append((key, number))
+
+    async def main():
+        runner = KeyedTaskRunner(max_concurrency=10)
+        runner.submit(1, lambda: job(1, 1, 0.05))
+        runner.submit(1, lambda: job(1, 2, 0))
+        runner.submit(2, lambda: job(2, 1, 0))
+        await runner.join()
+        return runner
+
+    runner = asyncio.run(main())
+    assert calls == [(2, 1), (1, 1), (1, 2)]
+    assert not runner._tails
+
+
+def test_worker_pool_sticky_routing_and_restart():
+    results = multiprocessing.get_context("spawn").Queue()
+    pool = WorkerPool(target=_echo_worker, workers=2, args=(results,), stop_timeout=10)
+    pool.start()
+    try:
+        for update_id, chat_id in enumerate([1, 2, 3, 1, 2, 3, 1]):
+            pool.dispatch(_make_update(update_id, chat_id))
+        received = [results.get(timeout=30) for _ in range(7)]
+
+        pool.dispatch(_make_update(100, 1, crash=True))
+        pool.processes[1].join(timeout=30)
+        assert pool.check() == [1]
+        pool.dispatch(_make_update(101, 1))
+        assert results.get(timeout=30)[2] == 101
+
+        # Апдейты из очереди зависшего процесса переходят к новому процессу
+        pool.dispatch(_make_update(102, 1, hang=True))
+        pool.dispatch(_make_update(103, 1))
+        pool.dispatch(_make_update(104, 1))
+        assert results.get(timeout=30)[2] == 102
+        deadline = time.monotonic() + 30
+        while pool.heartbeats[1].value and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.check() == [1]
+        assert [results.get(timeout=30)[2] for _ in range(2)] == [103, 104]
+    finally:
+        pool.stop()
+
+    workers = {}
+    for index, chat_id, update_id in received:
+        workers.setdefault(chat_id, set()).add(index)
+    assert workers == {1: {1}, 2: {0}, 3: {1}}
+    chat_1 = [update_id for _, chat_id, update_id in received if chat_id == 1]
+    assert chat_1 == [0, 3, 6]
+    assert pool.stats[1].restarts == 2
+    assert pool.stats[1].requeued == 2
+    assert pool.stats[1].lost_queues == 0
+
+
+def test_worker_can_use_process_pool():
+    results = multiprocessing.get_context("spawn").Queue()
+    pool = WorkerPool(target=_executor_worker, workers=1, args=(results,), stop_timeout=30)
+    pool.start()
+    try:
+        pool.dispatch(_make_update(1, 1))
+        assert results.get(timeout=60) == 1024
+    finally:
+        pool.stop()